@@ -0,0 +1,68 @@
+"""Compare the HTTP/1.1 and HTTP/2 transports of ApiClient
+
+Both servers answer after the same latency. The local servers are the ones
+of the tests, so the benchmark needs the ``tests`` directory of a checkout
+and the ``http2`` extra. Run from the root of the repository:
+
+    python -m benchmarks.bench_http2 --requests 500 --threads 50 --latency 0.05
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.utils.http2_session import HTTP2Session
+from ms_python_client.utils.http_pool import create_session
+from tests.ms_python_client.local_h2_server import LocalH2Server
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+BODY = {"value": [{"id": str(i), "subject": "Meeting"} for i in range(10)]}
+
+
+def run(api_client: ApiClient, requests: int, threads: int) -> float:
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for response in executor.map(
+            lambda _: api_client.make_get_request("/events", headers={}),
+            range(requests),
+        ):
+            assert response.status_code == 200
+    return time.monotonic() - start
+
+
+def report(name: str, elapsed: float, requests: int, connections: int) -> None:
+    print(
+        f"{name:<10} {elapsed:7.2f}s {requests / elapsed:9.1f} req/s "
+        f"{connections:5d} connections"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--connections", type=int, default=4, help="HTTP/2 connections")
+    args = parser.parse_args()
+
+    with LocalHttpServer(delay=args.latency) as server:
+        server.add("GET", "/events", BODY)
+        # Large enough for every thread, as recommended for HTTP/1.1
+        session = create_session(pool_maxsize=args.threads)
+        elapsed = run(
+            ApiClient(server.url, session=session), args.requests, args.threads
+        )
+        report("HTTP/1.1", elapsed, args.requests, server.connections)
+
+    with LocalH2Server(delay=args.latency) as server:
+        server.add("GET", "/events", BODY)
+        with HTTP2Session(args.connections, http2_prior_knowledge=True) as h2:
+            elapsed = run(
+                ApiClient(server.url, transport=h2), args.requests, args.threads
+            )
+        report("HTTP/2", elapsed, args.requests, server.connections)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare the JSON codecs on pages of events like the ones of Graph
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_json_codec --events 1000 --rounds 20
+"""
+
+import argparse
+import timeit
+
+from ms_python_client.utils.json_codec import get_codec_by_name
+
+
+def build_event(number: int) -> dict:
+    return {
+        "@odata.etag": f'W/"DwAAABYAAAB{number:08d}"',
+        "id": f"AAMkAGI2TAAA{number:020d}=",
+        "createdDateTime": "2023-06-01T09:12:45.1234567Z",
+        "lastModifiedDateTime": "2023-06-02T14:03:12.7654321Z",
+        "changeKey": f"DwAAABYAAAB{number:08d}",
+        "categories": ["Zoom"],
+        "subject": f"Weekly meeting {number}",
+        "bodyPreview": "Join the Zoom meeting " * 5,
+        "importance": "normal",
+        "sensitivity": "normal",
+        "isAllDay": False,
+        "isCancelled": False,
+        "isOrganizer": True,
+        "showAs": "busy",
+        "type": "singleInstance",
+        "webLink": f"https://outlook.office365.com/owa/?itemid={number}",
+        "body": {
+            "contentType": "html",
+            "content": "<html><body><p>Join the Zoom meeting</p>"
+            + "<div>https://cern.zoom.us/j/123456789</div>" * 20
+            + "</body></html>",
+        },
+        "start": {"dateTime": "2023-06-05T10:00:00.0000000", "timeZone": "UTC"},
+        "end": {"dateTime": "2023-06-05T11:00:00.0000000", "timeZone": "UTC"},
+        "location": {
+            "displayName": "https://cern.zoom.us/j/123456789",
+            "locationType": "default",
+            "uniqueIdType": "private",
+        },
+        "attendees": [
+            {
+                "type": "required",
+                "status": {"response": "none", "time": "0001-01-01T00:00:00Z"},
+                "emailAddress": {
+                    "name": f"Attendee {attendee}",
+                    "address": f"attendee.{attendee}@cern.ch",
+                },
+            }
+            for attendee in range(10)
+        ],
+        "organizer": {
+            "emailAddress": {"name": "Zoom Room", "address": "zoom.room@cern.ch"}
+        },
+        "singleValueExtendedProperties": [
+            {
+                "id": "String {d3123b00-8eb5-4f10-ae88-1269fe4cbaf0} Name ZoomId",
+                "value": str(123456789 + number),
+            }
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000, help="Events per page")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    page = {
+        "@odata.context": "https://graph.microsoft.com/v1.0/$metadata#events",
+        "value": [build_event(number) for number in range(args.events)],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/users/u/events?$skip=10",
+    }
+    encoded = get_codec_by_name("json").dumps(page)
+    print(f"Page of {args.events} events, {len(encoded) / 1e6:.1f} MB")
+
+    for name in ["json", "orjson", "msgspec"]:
+        try:
+            codec = get_codec_by_name(name)
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+        decode = min(
+            timeit.repeat(lambda: codec.loads(encoded), number=1, repeat=args.rounds)
+        )
+        encode = min(
+            timeit.repeat(lambda: codec.dumps(page), number=1, repeat=args.rounds)
+        )
+        print(f"{name:<8} decode {decode * 1e3:8.2f} ms  encode {encode * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
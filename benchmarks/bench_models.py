@@ -0,0 +1,50 @@
+"""Compare the memory used by events kept as dicts and as Event models
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_models --events 10000
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+from typing import Callable
+
+from benchmarks.bench_json_codec import build_event
+from ms_python_client.models import Event
+from ms_python_client.utils.json_codec import dumps, loads
+
+
+def measure(build: Callable[[], list]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    events = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    args = parser.parse_args()
+
+    # Decoded from bytes, as they are when read from a response
+    encoded = [dumps(build_event(number)) for number in range(args.events)]
+
+    as_dicts = measure(lambda: [loads(event) for event in encoded])
+    as_models = measure(lambda: [Event.from_graph(loads(event)) for event in encoded])
+    print(f"{args.events} events")
+    print(f"dicts  {as_dicts / 1e6:8.1f} MB")
+    print(f"Event  {as_models / 1e6:8.1f} MB  ({as_dicts / as_models:.1f}x smaller)")
+
+    events = [Event.from_graph(loads(event)) for event in encoded[:1000]]
+    start = min(timeit.repeat(lambda: [event.start for event in events], number=1))
+    body = min(timeit.repeat(lambda: [event.body for event in events], number=1))
+    print(f"per event: start {start * 1e3:.2f} µs  body {body * 1e3:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare the CPU time spent per request by the transports of ApiClient
+
+The requests are sent one after the other from the main thread, and only the
+CPU time of that thread is counted, not the one of the local server. Run from
+the root of the repository:
+
+    python -m benchmarks.bench_transports --requests 2000
+"""
+
+import argparse
+import time
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.interfaces.transport_interface import TransportInterface
+from ms_python_client.utils.transports import RequestsTransport, Urllib3Transport
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+BODY = {"id": "1", "subject": "Meeting", "start": {"dateTime": "2023-01-01T10:00"}}
+
+
+def run(
+    url: str, transport: TransportInterface, requests: int
+) -> "tuple[float, float]":
+    api_client = ApiClient(url, transport=transport)
+    # Warm up, the connection is opened once
+    api_client.make_get_request("/users/user/events/1", headers={})
+
+    cpu_start, wall_start = time.thread_time(), time.monotonic()
+    for _ in range(requests):
+        api_client.make_get_request("/users/user/events/1", headers={})
+    return time.thread_time() - cpu_start, time.monotonic() - wall_start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with LocalHttpServer() as server:
+        server.add("GET", "/users/user/events/1", BODY)
+        for name, transport in [
+            ("requests", RequestsTransport()),
+            ("urllib3", Urllib3Transport()),
+        ]:
+            with transport:
+                cpu, wall = run(server.url, transport, args.requests)
+            print(
+                f"{name:<10} {cpu / args.requests * 1e6:8.1f} us CPU/request "
+                f"{wall / args.requests * 1e6:8.1f} us wall/request"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,23 @@
+from .async_cern_ms_api_client import AsyncCERNMSApiClient
+from .async_ms_api_client import AsyncMSApiClient
 from .cern_ms_api_client import CERNMSApiClient
 from .components.events.cern_events_component import NotFoundError
 from .config import Config
 from .ms_api_client import MSApiClient
-from .utils.error import generate_error_log
+from .utils.error import ConflictError, generate_error_log
 from .utils.event_generator import EventParameters, PartialEventParameters
 from .utils.logger import setup_logs
 
 __all__ = [
     "MSApiClient",
     "CERNMSApiClient",
+    "AsyncMSApiClient",
+    "AsyncCERNMSApiClient",
     "setup_logs",
     "generate_error_log",
     "EventParameters",
     "PartialEventParameters",
     "Config",
     "NotFoundError",
+    "ConflictError",
 ]
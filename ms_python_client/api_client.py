@@ -1,9 +1,22 @@
 import logging
+import time
 from typing import Any, Mapping, Optional
 
 from requests import RequestException, Response, Session
-from requests.adapters import HTTPAdapter
-from urllib3 import Retry
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+
+from ms_python_client.interfaces.transport_interface import TransportInterface
+from ms_python_client.utils import json_codec
+from ms_python_client.utils.concurrency_limiter import MailboxConcurrencyLimiter
+from ms_python_client.utils.http2_session import DEFAULT_MAX_CONNECTIONS, HTTP2Session
+from ms_python_client.utils.http_pool import PoolStats, create_session
+from ms_python_client.utils.rate_limiter import SharedRateLimiter
+from ms_python_client.utils.retry import (
+    RetryPolicy,
+    RetryStats,
+    parse_retry_after,
+)
+from ms_python_client.utils.transports import RequestsTransport
 
 logger = logging.getLogger("ms_python_client")
 
@@ -11,20 +24,110 @@ _Headers = Mapping[str, str]
 _Data = Mapping[str, Any]
 
 
+def encode_json_body(
+    json: Optional[_Data], headers: _Headers
+) -> "tuple[Optional[bytes], _Headers]":
+    """Encode the body of a request once, with the JSON codec of the clients
+
+    Args:
+        json (dict): The body of the request
+        headers (dict): The headers of the request
+
+    Returns:
+        tuple[bytes, dict]: The encoded body and the headers with its type
+    """
+    if json is None:
+        return None, headers
+    if any(key.lower() == "content-type" for key in headers):
+        return json_codec.dumps(json), headers
+    return json_codec.dumps(json), {**headers, "Content-Type": "application/json"}
+
+
 class ApiClient:
-    def __init__(self, api_base_url: str):
+    """Send the requests to the API and retry the failed ones
+
+    The requests are sent by a transport, a ``requests.Session`` by default.
+    Responses with a retryable status are retried by ``retry_policy``.
+    Connection errors are still retried by the transport.
+
+    The requests made for a mailbox (``/users/{id}/...``) go through
+    ``concurrency_limiter``, which queues them when too many are running
+    for the same mailbox.
+
+    Args:
+        api_base_url (str): The URL prepended to the API paths
+        retry_policy (RetryPolicy): When and how to retry, the default one
+            if not given
+        concurrency_limiter (MailboxConcurrencyLimiter): Limits the
+            concurrent requests per mailbox, the default one if not given
+        rate_limiter (SharedRateLimiter): Optional request budgets shared
+            with the other processes of the host
+        session (Session): A session shared with other clients, see
+            ``create_session``. The pool arguments are then ignored
+        pool_connections (int): Number of hosts whose pool is kept
+        pool_maxsize (int): Maximum number of connections kept per host,
+            should be at least the number of threads using the client.
+            10 by default, or the ``HTTP2Session`` default with ``http2``
+        pool_block (bool): Wait for a free connection when all of them are
+            in use, instead of opening one that is closed afterwards
+        http2 (bool): Send the requests over HTTP/2 through an
+            ``HTTP2Session``, requires the ``http2`` extra. Its few
+            connections are shared by all the threads, unless
+            ``pool_maxsize`` is given
+        transport (TransportInterface): Another transport, such as an
+            ``Urllib3Transport`` or an ``HTTP2Session``, possibly shared with
+            other clients. The session and pool arguments are then ignored
+    """
+
+    def __init__(
+        self,
+        api_base_url: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[MailboxConcurrencyLimiter] = None,
+        rate_limiter: Optional[SharedRateLimiter] = None,
+        session: Optional[Session] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        http2: bool = False,
+        transport: Optional[TransportInterface] = None,
+    ):
         self.api_base_url = api_base_url
         self.timeout = 10
-        self.session = Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.concurrency_limiter = concurrency_limiter or MailboxConcurrencyLimiter()
+        self.rate_limiter = rate_limiter
+        self.transport: TransportInterface
+        if transport is not None:
+            self.transport = transport
+        elif session is not None:
+            self.transport = RequestsTransport(session)
+        elif http2:
+            self.transport = HTTP2Session(
+                max_connections=pool_maxsize or DEFAULT_MAX_CONNECTIONS
+            )
+        else:
+            self.transport = RequestsTransport(
+                create_session(
+                    pool_connections, pool_maxsize or DEFAULT_POOLSIZE, pool_block
+                )
+            )
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self.retry_policy.stats
+
+    @property
+    def session(self) -> Optional[Session]:
+        """The requests session, None for the other transports"""
+        if isinstance(self.transport, RequestsTransport):
+            return self.transport.session
+        return None
+
+    @property
+    def pool_stats(self) -> Optional[PoolStats]:
+        """Usage of the connection pool, None if the transport does not track it"""
+        return self.transport.get_pool_stats(self.api_base_url)
 
     def build_headers(self, extra_headers: Optional[_Headers] = None) -> dict:
         """Create the headers for a request appending the ones in the params
@@ -40,37 +143,44 @@ class ApiClient:
             headers.update(extra_headers)
         return headers
 
-    def make_get_request(self, api_path: str, headers: _Headers) -> Response:
+    def build_url(self, api_path: str) -> str:
+        """Build the URL of a request
+
+        Args:
+            api_path (str): The URL path, or an absolute URL such as the
+                ``@odata.nextLink`` of a previous response
+
+        Returns:
+            str: The full URL
+        """
+        if api_path.startswith(("http://", "https://")):
+            return api_path
+        return self.api_base_url + api_path
+
+    def make_get_request(
+        self, api_path: str, headers: _Headers, stream: bool = False
+    ) -> Response:
         """Makes a GET request using requests
 
         Args:
             api_path (str): The URL path
             headers (dict): The headers of the request
+            stream (bool): Read the body only when the response is iterated,
+                see ``Response.iter_content``. The response must be closed.
+                The concurrency slot of the mailbox is released once the
+                headers are received, so the body is read outside of it
 
         Returns:
             Response: The response of the request
         """
-        response = None
-        full_url = self.api_base_url + api_path
-        logger.info("GET %s", api_path)
-        try:
-            response = self.session.get(full_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-        except RequestException as e:
-            logger.error(e)
-            if isinstance(response, Response) and response.text:
-                logger.error(response.text)
-            raise e
-        logger.debug(
-            "GET [%s] - %d in %fs",
-            api_path,
-            response.status_code,
-            response.elapsed.total_seconds(),
-        )
-        return response
+        return self._request("GET", api_path, headers, stream=stream)
 
     def make_post_request(
-        self, api_path: str, headers: _Headers, json: Optional[_Data] = None
+        self,
+        api_path: str,
+        headers: _Headers,
+        json: Optional[_Data] = None,
+        idempotent: bool = False,
     ) -> Response:
         """Makes a POST request using requests
 
@@ -78,30 +188,13 @@ class ApiClient:
             api_path (str): The URL path
             headers (dict): The headers of the request
             json (dict): The body of the request
+            idempotent (bool): The request can be sent twice safely, so it is
+                retried like a GET
 
         Returns:
             Response: The response of the request
         """
-        response = None
-        full_url = self.api_base_url + api_path
-        logger.info("POST %s", api_path)
-        try:
-            response = self.session.post(
-                full_url, headers=headers, json=json, timeout=self.timeout
-            )
-            response.raise_for_status()
-        except RequestException as e:
-            logger.error(e)
-            if isinstance(response, Response) and response.text:
-                logger.error(response.text)
-            raise e
-        logger.debug(
-            "POST [%s] - %d in %fs",
-            api_path,
-            response.status_code,
-            response.elapsed.total_seconds(),
-        )
-        return response
+        return self._request("POST", api_path, headers, json, idempotent)
 
     def make_patch_request(
         self, api_path: str, headers: _Headers, json: Optional[_Data] = None
@@ -116,26 +209,7 @@ class ApiClient:
         Returns:
             Response: The response of the request
         """
-        response = None
-        full_url = self.api_base_url + api_path
-        logger.info("PATCH %s", api_path)
-        try:
-            response = self.session.patch(
-                full_url, headers=headers, json=json, timeout=self.timeout
-            )
-            response.raise_for_status()
-        except RequestException as e:
-            logger.error(e)
-            if isinstance(response, Response) and response.text:
-                logger.error(response.text)
-            raise e
-        logger.debug(
-            "PATCH [%s] - %d in %fs",
-            api_path,
-            response.status_code,
-            response.elapsed.total_seconds(),
-        )
-        return response
+        return self._request("PATCH", api_path, headers, json)
 
     def make_delete_request(
         self, api_path: str, headers: _Headers, json: Optional[_Data] = None
@@ -150,12 +224,23 @@ class ApiClient:
         Returns:
             Response: The response of the request
         """
+        return self._request("DELETE", api_path, headers, json)
+
+    def _request(
+        self,
+        method: str,
+        api_path: str,
+        headers: _Headers,
+        json: Optional[_Data] = None,
+        idempotent: bool = False,
+        stream: bool = False,
+    ) -> Response:
         response = None
-        full_url = self.api_base_url + api_path
-        logger.info("DELETE %s", api_path)
+        full_url = self.build_url(api_path)
+        logger.info("%s %s", method, api_path)
         try:
-            response = self.session.delete(
-                full_url, headers=headers, json=json, timeout=self.timeout
+            response = self._send_with_retries(
+                method, full_url, headers, json, idempotent, stream
             )
             response.raise_for_status()
         except RequestException as e:
@@ -164,9 +249,66 @@ class ApiClient:
                 logger.error(response.text)
             raise e
         logger.debug(
-            "DELETE [%s] - %d in %fs",
+            "%s [%s] - %d in %fs",
+            method,
             api_path,
             response.status_code,
             response.elapsed.total_seconds(),
         )
         return response
+
+    def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        headers: _Headers,
+        json: Optional[_Data],
+        idempotent: bool,
+        stream: bool = False,
+    ) -> Response:
+        data, headers = encode_json_body(json, headers)
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            # With stream, the slot is released before the body is read: the
+            # streamed pages are not counted in the concurrency window
+            with self.concurrency_limiter.slot(url) as slot:
+                response = self.transport.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+                if slot is not None:
+                    slot.status_code = response.status_code
+            self._share_retry_after(url, response)
+
+            if not self.retry_policy.should_retry(
+                method, response.status_code, attempt, idempotent
+            ):
+                return response
+
+            attempt += 1
+            delay = self.retry_policy.get_delay(
+                attempt, response.status_code, response.headers
+            )
+            logger.debug(
+                "Retrying %s %s after a %d in %.2fs",
+                method,
+                url,
+                response.status_code,
+                delay,
+            )
+            response.close()
+            time.sleep(delay)
+
+    def _share_retry_after(self, url: str, response: Response) -> None:
+        # Make the other processes wait too, instead of getting throttled
+        if not self.rate_limiter or response.status_code != 429:
+            return
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after:
+            self.rate_limiter.throttled(url, retry_after)
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+from typing import Any, Mapping, Optional
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import RequestException, Response
+
+from ms_python_client.api_client import encode_json_body
+from ms_python_client.utils.httpx_response import to_requests_response
+from ms_python_client.utils.retry import RetryPolicy, RetryStats
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+logger = logging.getLogger("ms_python_client")
+
+_Headers = Mapping[str, str]
+_Data = Mapping[str, Any]
+
+
+class AsyncApiClient:
+    """asyncio counterpart of ApiClient
+
+    All the requests share the connection pool of a single
+    ``httpx.AsyncClient`` and are retried like the ones of ApiClient.
+    Responses are returned as ``requests.Response`` objects.
+
+    Args:
+        api_base_url (str): The URL prepended to the API paths
+        max_connections (int): Size of the connection pool
+        retry_policy (RetryPolicy): When and how to retry, the default one
+            if not given
+    """
+
+    def __init__(
+        self,
+        api_base_url: str,
+        max_connections: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        if httpx is None:  # pragma: no cover
+            raise ImportError(
+                "AsyncApiClient requires httpx: pip install ms-python-client[async]"
+            )
+        self.api_base_url = api_base_url
+        self.timeout = 10
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            )
+        )
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self.retry_policy.stats
+
+    async def aclose(self) -> None:
+        """Close all the connections of the pool"""
+        await self.client.aclose()
+
+    def build_headers(self, extra_headers: Optional[_Headers] = None) -> dict:
+        """Create the headers for a request appending the ones in the params
+
+        Args:
+            extra_headers (dict): Mapping of headers that will be appended to the default ones
+
+        Returns:
+            dict: All the headers
+        """
+        headers: dict[str, str] = {}
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
+
+    def build_url(self, api_path: str) -> str:
+        """Build the URL of a request
+
+        Args:
+            api_path (str): The URL path, or an absolute URL such as the
+                ``@odata.nextLink`` of a previous response
+
+        Returns:
+            str: The full URL
+        """
+        if api_path.startswith(("http://", "https://")):
+            return api_path
+        return self.api_base_url + api_path
+
+    async def make_get_request(self, api_path: str, headers: _Headers) -> Response:
+        """Makes a GET request using httpx
+
+        Args:
+            api_path (str): The URL path
+            headers (dict): The headers of the request
+
+        Returns:
+            Response: The response of the request
+        """
+        return await self._request("GET", api_path, headers)
+
+    async def make_post_request(
+        self,
+        api_path: str,
+        headers: _Headers,
+        json: Optional[_Data] = None,
+        idempotent: bool = False,
+    ) -> Response:
+        """Makes a POST request using httpx
+
+        Args:
+            api_path (str): The URL path
+            headers (dict): The headers of the request
+            json (dict): The body of the request
+            idempotent (bool): The request can be sent twice safely, so it is
+                retried like a GET
+
+        Returns:
+            Response: The response of the request
+        """
+        return await self._request("POST", api_path, headers, json, idempotent)
+
+    async def make_patch_request(
+        self, api_path: str, headers: _Headers, json: Optional[_Data] = None
+    ) -> Response:
+        """Makes a PATCH request using httpx
+
+        Args:
+            api_path (str): The URL path
+            headers (dict): The headers of the request
+            json (dict): The body of the request
+
+        Returns:
+            Response: The response of the request
+        """
+        return await self._request("PATCH", api_path, headers, json)
+
+    async def make_delete_request(
+        self, api_path: str, headers: _Headers, json: Optional[_Data] = None
+    ) -> Response:
+        """Makes a DELETE request using httpx
+
+        Args:
+            api_path (str): The URL path
+            headers (dict): The headers of the request
+            json (dict): The body of the request
+
+        Returns:
+            Response: The response of the request
+        """
+        return await self._request("DELETE", api_path, headers, json)
+
+    async def _request(
+        self,
+        method: str,
+        api_path: str,
+        headers: _Headers,
+        json: Optional[_Data] = None,
+        idempotent: bool = False,
+    ) -> Response:
+        response = None
+        full_url = self.build_url(api_path)
+        logger.info("%s %s", method, api_path)
+        try:
+            response = await self._send_with_retries(
+                method, full_url, headers, json, idempotent
+            )
+            response.raise_for_status()
+        except RequestException as e:
+            logger.error(e)
+            if isinstance(response, Response) and response.text:
+                logger.error(response.text)
+            raise e
+        logger.debug(
+            "%s [%s] - %d in %fs",
+            method,
+            api_path,
+            response.status_code,
+            response.elapsed.total_seconds(),
+        )
+        return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        headers: _Headers,
+        json: Optional[_Data],
+        idempotent: bool,
+    ) -> Response:
+        retry_policy = self.retry_policy
+        retryable_method = idempotent or method.upper() in retry_policy.methods
+        data, headers = encode_json_body(json, headers)
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(
+                    method, url, headers=headers, content=data, timeout=self.timeout
+                )
+            except httpx.TransportError as e:
+                # Connection errors happen before the request is sent, so
+                # they are retried whatever the method is
+                retryable = retryable_method or isinstance(e, httpx.ConnectError)
+                if not retryable or attempt >= retry_policy.max_retries:
+                    raise RequestsConnectionError(e) from e
+                attempt += 1
+                await asyncio.sleep(retry_policy.get_delay(attempt))
+                continue
+
+            if not retry_policy.should_retry(
+                method, response.status_code, attempt, idempotent
+            ):
+                return to_requests_response(response)
+
+            attempt += 1
+            delay = retry_policy.get_delay(
+                attempt, response.status_code, response.headers
+            )
+            logger.debug(
+                "Retrying %s %s after a %d in %.2fs",
+                method,
+                url,
+                response.status_code,
+                delay,
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from ms_python_client.async_ms_api_client import AsyncMSApiClient
+from ms_python_client.components.events.async_cern_events_component import (
+    AsyncCERNEventsComponents,
+)
+from ms_python_client.config import Config
+from ms_python_client.services.zoom_id_index import ZoomIdIndex
+from ms_python_client.utils import init_from_env
+
+
+class AsyncCERNMSApiClient(AsyncMSApiClient):
+    def __init__(
+        self,
+        config: Config,
+        api_endpoint: str = "https://graph.microsoft.com/v1.0",
+        max_connections: int = 100,
+        zoom_id_index: Optional[ZoomIdIndex] = None,
+    ):
+        self.zoom_id_index = zoom_id_index
+        super().__init__(config, api_endpoint, max_connections)
+        self.init_components()
+
+    def init_components(self):
+        # Add all the new components here
+        self.events = AsyncCERNEventsComponents(self, self.zoom_id_index)
+
+    @staticmethod
+    def init_from_dotenv(custom_dotenv=".env") -> "AsyncCERNMSApiClient":
+        init_from_env.init_from_dotenv(custom_dotenv)
+        ms_client = AsyncCERNMSApiClient.init_from_env()
+        return ms_client
+
+    @staticmethod
+    def init_from_env() -> "AsyncCERNMSApiClient":
+        config = init_from_env.init_from_env()
+        ms_client = AsyncCERNMSApiClient(config)
+        return ms_client
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import os
+from typing import Any, Mapping, Optional
+
+import requests
+
+from ms_python_client.async_api_client import AsyncApiClient
+from ms_python_client.components.events.async_events_component import (
+    AsyncEventsComponent,
+)
+from ms_python_client.components.users.async_users_component import (
+    AsyncUsersComponent,
+)
+from ms_python_client.config import Config
+from ms_python_client.interfaces.async_ms_client_interface import (
+    AsyncMSClientInterface,
+)
+from ms_python_client.services.oauth2_flow import Oauth2Flow
+from ms_python_client.services.token_holder import AccessTokenHolder
+from ms_python_client.utils import init_from_env
+from ms_python_client.utils.retry import RetryPolicy, RetryStats
+
+logger = logging.getLogger("ms_python_client")
+
+_Data = Mapping[str, Any]
+_Headers = Mapping[str, str]
+
+
+class AsyncMSApiClient(AsyncMSClientInterface):
+    """asyncio version of MSApiClient
+
+    Needs the ``async`` extra (httpx). Close it with ``await client.aclose()``
+    or use it as an async context manager.
+    """
+
+    @staticmethod
+    def init_from_env() -> "AsyncMSApiClient":
+        config = init_from_env.init_from_env()
+        ms_client = AsyncMSApiClient(config)
+        return ms_client
+
+    @staticmethod
+    def init_from_dotenv(
+        custom_dotenv=".env",
+    ) -> "AsyncMSApiClient":
+        init_from_env.init_from_dotenv(custom_dotenv)
+        ms_client = AsyncMSApiClient.init_from_env()
+        return ms_client
+
+    def init_components(self):
+        # Add all the new components here
+        self.events = AsyncEventsComponent(self)
+        self.users = AsyncUsersComponent(self)
+
+    def __init__(
+        self,
+        config: Config,
+        api_endpoint: str = "https://graph.microsoft.com/v1.0",
+        max_connections: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        if "MS_ACCESS_TOKEN" in os.environ and os.getenv("MS_ACCESS_TOKEN") != "":
+            self.dev_token = os.environ["MS_ACCESS_TOKEN"]
+        else:
+            self.dev_token = None
+            self.oauth = Oauth2Flow(config)
+            self.token_holder = AccessTokenHolder(
+                self.oauth.get_access_token_with_expiry
+            )
+
+        self.api_client = AsyncApiClient(
+            api_base_url=api_endpoint,
+            max_connections=max_connections,
+            retry_policy=retry_policy,
+        )
+        self.init_components()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Counters of the retries and of the time spent waiting for them"""
+        return self.api_client.retry_stats
+
+    async def __aenter__(self) -> "AsyncMSApiClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool and stop the token refresh"""
+        await self.api_client.aclose()
+        if not self.dev_token:
+            self.token_holder.close()
+
+    async def build_headers(self, extra_headers: Optional[_Headers] = None) -> _Headers:
+        if self.dev_token:
+            token = self.dev_token
+        else:
+            # The token is refreshed in the background, so it is almost
+            # always there. Acquiring it blocks, keep that off the event loop
+            token = self.token_holder.peek_token() or await asyncio.to_thread(
+                self.token_holder.get_token
+            )
+
+        headers = self.api_client.build_headers(
+            extra_headers={"Authorization": f"Bearer {token}"}
+        )
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
+
+    def build_query_string_from_dict(
+        self, parameters: Optional[Mapping[str, str]]
+    ) -> str:
+        query_string = "?"
+        for key, value in parameters.items() if parameters else []:
+            if value:
+                query_string += f"{key}={value}&"
+        return query_string[:-1]
+
+    async def make_get_request(
+        self,
+        api_path: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[_Headers] = None,
+    ) -> requests.Response:
+        headers = await self.build_headers(extra_headers)
+        query_string = self.build_query_string_from_dict(parameters)
+
+        response = await self.api_client.make_get_request(
+            api_path=f"{api_path}{query_string}",
+            headers=headers,
+        )
+
+        return response
+
+    async def make_post_request(
+        self,
+        api_path: str,
+        json: _Data,
+        extra_headers: Optional[_Headers] = None,
+        idempotent: bool = False,
+    ) -> requests.Response:
+        headers = await self.build_headers(extra_headers)
+
+        response = await self.api_client.make_post_request(
+            api_path=api_path, headers=headers, json=json, idempotent=idempotent
+        )
+
+        return response
+
+    async def make_patch_request(
+        self, api_path: str, json: _Data, extra_headers: Optional[_Headers] = None
+    ) -> requests.Response:
+        headers = await self.build_headers(extra_headers)
+
+        response = await self.api_client.make_patch_request(
+            api_path=api_path, headers=headers, json=json
+        )
+
+        return response
+
+    async def make_delete_request(
+        self, api_path: str, extra_headers: Optional[_Headers] = None
+    ) -> requests.Response:
+        headers = await self.build_headers(extra_headers)
+
+        response = await self.api_client.make_delete_request(
+            api_path=api_path, headers=headers
+        )
+
+        return response
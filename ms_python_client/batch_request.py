@@ -0,0 +1,329 @@
+import logging
+import time
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.utils import json_codec
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.retry import RetryPolicy
+
+logger = logging.getLogger("ms_python_client")
+
+_Data = Mapping[str, Any]
+_Headers = Mapping[str, str]
+
+# Maximum number of requests Microsoft Graph accepts in a single batch
+MAX_BATCH_SIZE = 20
+FAILED_DEPENDENCY = 424
+
+
+class BatchItem:
+    """A request of a batch, holding its response once the batch is executed
+
+    Args:
+        request_id (str): The id of the request inside the batch
+        method (str): The HTTP method
+        url (str): The URL path, with its query string
+        json (dict): The body of the request
+        headers (dict): The headers of the request
+        depends_on (list[BatchItem]): Requests that must run before this one
+    """
+
+    def __init__(
+        self,
+        request_id: str,
+        method: str,
+        url: str,
+        json: Optional[_Data] = None,
+        headers: Optional[_Headers] = None,
+        depends_on: Optional[Iterable["BatchItem"]] = None,
+    ) -> None:
+        self.id = request_id
+        self.method = method
+        self.url = url
+        self.json = json
+        self.headers = dict(headers or {})
+        self.depends_on = list(depends_on or [])
+        self.status_code: Optional[int] = None
+        self.response_headers: dict[str, str] = {}
+        self.body: Any = None
+
+    @property
+    def done(self) -> bool:
+        return self.status_code is not None
+
+    @property
+    def response(self) -> Response:
+        """The response of the request, as if it was sent on its own
+
+        Raises:
+            ValueError: The batch has not been executed yet
+
+        Returns:
+            Response: The response of the request
+        """
+        if not self.done:
+            raise ValueError(f"Request {self.id} of the batch has not been executed")
+
+        response = Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.response_headers)
+        response.url = self.url
+        response.encoding = "utf-8"
+        if isinstance(self.body, (dict, list)):
+            content = json_codec.dumps(self.body)
+        elif self.body is None:
+            content = b""
+        else:
+            content = str(self.body).encode()
+        # pylint: disable=protected-access
+        response._content = content
+        return response
+
+    def to_json(self, depends_on: Iterable["BatchItem"]) -> dict:
+        request: dict[str, Any] = {
+            "id": self.id,
+            "method": self.method,
+            "url": self.url,
+        }
+        headers = dict(self.headers)
+        if self.json is not None:
+            request["body"] = self.json
+            headers.setdefault("Content-Type", "application/json")
+        if headers:
+            request["headers"] = headers
+        dependencies = [item.id for item in depends_on]
+        if dependencies:
+            request["dependsOn"] = dependencies
+        return request
+
+
+class BatchRequest:
+    """Collect requests and send them through the Graph ``$batch`` endpoint
+
+    Requests are sent in batches of at most 20. The requests linked through
+    ``depends_on`` are always sent in the same batch, in order. Only the
+    requests that ``retry_policy`` would retry if they were sent on their
+    own are sent again, in a new batch, after the longest of their waits.
+
+    Args:
+        client (MSClientInterface): The client used to send the batches
+        max_retries (int): Number of times a throttled or failed request is
+            sent again, the one of ``retry_policy`` by default
+        retry_policy (RetryPolicy): Which requests are retried and how long
+            to wait before it
+        on_write (Callable): Called with the URL of every request other than
+            a GET once it is sent, to drop what is cached about it
+    """
+
+    def __init__(
+        self,
+        client: MSClientInterface,
+        max_retries: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        on_write: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.client = client
+        self.on_write = on_write
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.max_retries = (
+            self.retry_policy.max_retries if max_retries is None else max_retries
+        )
+        self.items: list[BatchItem] = []
+
+    def __enter__(self) -> "BatchRequest":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def add(
+        self,
+        method: str,
+        api_path: str,
+        json: Optional[_Data] = None,
+        extra_headers: Optional[_Headers] = None,
+        depends_on: Optional[Iterable[BatchItem]] = None,
+    ) -> BatchItem:
+        """Add a request to the batch
+
+        Args:
+            method (str): The HTTP method
+            api_path (str): The URL path, with its query string
+            json (dict): The body of the request
+            extra_headers (dict): The headers of the request
+            depends_on (list[BatchItem]): Requests that must run before this one
+
+        Returns:
+            BatchItem: The request, holding its response once executed
+        """
+        depends_on = list(depends_on or [])
+        for dependency in depends_on:
+            if dependency not in self.items:
+                raise ValueError(f"Request {dependency.id} is not part of the batch")
+
+        item = BatchItem(
+            str(len(self.items) + 1),
+            method.upper(),
+            api_path,
+            json,
+            extra_headers,
+            depends_on,
+        )
+        self.items.append(item)
+        return item
+
+    def get(
+        self,
+        api_path: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[_Headers] = None,
+        depends_on: Optional[Iterable[BatchItem]] = None,
+    ) -> BatchItem:
+        query_string = "&".join(
+            f"{key}={value}" for key, value in (parameters or {}).items() if value
+        )
+        if query_string:
+            api_path = f"{api_path}?{query_string}"
+        return self.add("GET", api_path, None, extra_headers, depends_on)
+
+    def post(
+        self,
+        api_path: str,
+        json: _Data,
+        extra_headers: Optional[_Headers] = None,
+        depends_on: Optional[Iterable[BatchItem]] = None,
+    ) -> BatchItem:
+        return self.add("POST", api_path, json, extra_headers, depends_on)
+
+    def patch(
+        self,
+        api_path: str,
+        json: _Data,
+        extra_headers: Optional[_Headers] = None,
+        depends_on: Optional[Iterable[BatchItem]] = None,
+    ) -> BatchItem:
+        return self.add("PATCH", api_path, json, extra_headers, depends_on)
+
+    def delete(
+        self,
+        api_path: str,
+        extra_headers: Optional[_Headers] = None,
+        depends_on: Optional[Iterable[BatchItem]] = None,
+    ) -> BatchItem:
+        return self.add("DELETE", api_path, None, extra_headers, depends_on)
+
+    def execute(self) -> list[BatchItem]:
+        """Send all the requests that have not been executed yet
+
+        Returns:
+            list[BatchItem]: All the requests of the batch, with their responses
+        """
+        pending = [item for item in self.items if not item.done]
+        attempt = 0
+        while pending:
+            retry: list[BatchItem] = []
+            for chunk in self._split(pending):
+                self._send(chunk)
+                retry.extend(item for item in chunk if self._should_retry(item, chunk))
+
+            if not retry:
+                break
+            if attempt >= self.max_retries:
+                for _ in retry:
+                    self.retry_policy.stats.record_exhausted()
+                break
+
+            attempt += 1
+            wait = max(
+                self.retry_policy.get_delay(
+                    attempt,
+                    item.status_code,
+                    CaseInsensitiveDict(item.response_headers),
+                )
+                for item in retry
+            )
+            logger.info("Retrying %d requests of the batch in %.2fs", len(retry), wait)
+            time.sleep(wait)
+            pending = retry
+
+        return self.items
+
+    def _send(self, chunk: list[BatchItem]) -> None:
+        in_chunk = set(item.id for item in chunk)
+        json = {
+            "requests": [
+                item.to_json(
+                    dependency
+                    for dependency in item.depends_on
+                    if dependency.id in in_chunk
+                )
+                for item in chunk
+            ]
+        }
+        response = self.client.make_post_request("/$batch", json)
+
+        by_id = {item.id: item for item in chunk}
+        for sub_response in decode_response(response).get("responses", []):
+            item = by_id[str(sub_response["id"])]
+            item.status_code = int(sub_response["status"])
+            item.response_headers = sub_response.get("headers", {})
+            item.body = sub_response.get("body")
+
+        if self.on_write is not None:
+            for item in chunk:
+                if item.method != "GET":
+                    self.on_write(item.url)
+
+    def _should_retry(self, item: BatchItem, chunk: list[BatchItem]) -> bool:
+        if item.status_code == FAILED_DEPENDENCY:
+            # Its dependency failed in a way that will be retried, retry it too
+            return any(
+                dependency in chunk and self._should_retry(dependency, chunk)
+                for dependency in item.depends_on
+            )
+        return item.status_code is not None and self.retry_policy.is_retryable(
+            item.method, item.status_code
+        )
+
+    @staticmethod
+    def _split(items: list[BatchItem]) -> list[list[BatchItem]]:
+        # Requests depending on each other must be in the same batch, so
+        # group them before filling the batches
+        group_of: dict[str, list[BatchItem]] = {}
+        groups: list[list[BatchItem]] = []
+        for item in items:
+            linked: list[list[BatchItem]] = []
+            for dependency in item.depends_on:
+                other = group_of.get(dependency.id)
+                if other is not None and all(other is not g for g in linked):
+                    linked.append(other)
+
+            group = linked[0] if linked else []
+            if not linked:
+                groups.append(group)
+            for other in linked[1:]:
+                group.extend(other)
+                groups.remove(other)
+                for member in other:
+                    group_of[member.id] = group
+            group.append(item)
+            group_of[item.id] = group
+
+        chunks: list[list[BatchItem]] = []
+        for group in groups:
+            if len(group) > MAX_BATCH_SIZE:
+                raise ValueError(
+                    f"More than {MAX_BATCH_SIZE} requests depend on each other"
+                )
+            for chunk in chunks:
+                if len(chunk) + len(group) <= MAX_BATCH_SIZE:
+                    chunk.extend(group)
+                    break
+            else:
+                chunks.append(list(group))
+        return chunks
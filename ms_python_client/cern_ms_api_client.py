@@ -1,9 +1,19 @@
+from typing import Optional
+
+from requests import Session
+
 from ms_python_client.components.events.cern_events_component import (
     CERNEventsComponents,
 )
+from ms_python_client.components.subscriptions.subscriptions_component import (
+    SubscriptionsComponent,
+)
 from ms_python_client.config import Config
+from ms_python_client.interfaces.transport_interface import TransportInterface
 from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.services.zoom_id_index import ZoomIdIndex
 from ms_python_client.utils import init_from_env
+from ms_python_client.utils.response_cache import ResponseCache
 
 
 class CERNMSApiClient(MSApiClient):
@@ -11,13 +21,25 @@ class CERNMSApiClient(MSApiClient):
         self,
         config: Config,
         api_endpoint: str = "https://graph.microsoft.com/v1.0",
+        zoom_id_index: Optional[ZoomIdIndex] = None,
+        session: Optional[Session] = None,
+        transport: Optional[TransportInterface] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
-        super().__init__(config, api_endpoint)
+        self.zoom_id_index = zoom_id_index
+        super().__init__(
+            config,
+            api_endpoint,
+            session=session,
+            transport=transport,
+            response_cache=response_cache,
+        )
         self.init_components()
 
     def init_components(self):
         # Add all the new components here
-        self.events = CERNEventsComponents(self)
+        self.events = CERNEventsComponents(self, self.zoom_id_index)
+        self.subscriptions = SubscriptionsComponent(self)
 
     @staticmethod
     def init_from_dotenv(custom_dotenv=".env") -> "CERNMSApiClient":
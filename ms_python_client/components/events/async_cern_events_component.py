@@ -0,0 +1,265 @@
+import logging
+from typing import Awaitable, Callable, Iterable, Mapping, Optional, TypeVar
+
+from requests import HTTPError
+
+from ms_python_client.components.events.async_events_component import (
+    AsyncEventsComponent,
+)
+from ms_python_client.components.events.cern_events_component import (
+    CURRENT_EVENT_HEADERS,
+    ZOOM_ID_EXPAND,
+    build_current_event_parameters,
+    build_zoom_id_filter_parameters,
+    get_current_event_of_response,
+    get_event_matching_zoom_id,
+    get_zoom_id_of_event,
+    with_zoom_id_expand,
+)
+from ms_python_client.interfaces.async_ms_client_interface import (
+    AsyncMSClientInterface,
+)
+from ms_python_client.services.zoom_id_index import MemoryZoomIdIndex, ZoomIdIndex
+from ms_python_client.utils.error import is_not_found_error
+from ms_python_client.utils.event_generator import (
+    EventParameters,
+    PartialEventParameters,
+    create_event_body,
+    create_partial_event_body,
+)
+
+logger = logging.getLogger("ms_python_client")
+
+_T = TypeVar("_T")
+
+
+class AsyncCERNEventsComponents:
+    """asyncio version of the CERN Events component
+
+    Args:
+        client (AsyncMSClientInterface): The client used to make the requests
+        zoom_id_index (ZoomIdIndex): The index of the zoom ids, in memory by
+            default
+    """
+
+    def __init__(
+        self,
+        client: AsyncMSClientInterface,
+        zoom_id_index: Optional[ZoomIdIndex] = None,
+    ) -> None:
+        self.events_component = AsyncEventsComponent(client)
+        self.zoom_id_index = (
+            zoom_id_index if zoom_id_index is not None else MemoryZoomIdIndex()
+        )
+
+    async def list_events(
+        self,
+        user_id: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """List all the events of a user
+
+        Args:
+            user_id (str): The user id
+            parameters (dict): Optional parameters for the request
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The response of the request
+        """
+        response = await self.events_component.list_events(
+            user_id, with_zoom_id_expand(parameters), extra_headers
+        )
+        self.zoom_id_index.update_from_events(user_id, response.get("value", []))
+        return response
+
+    def update_zoom_id_index(self, user_id: str, events: Iterable[dict]) -> None:
+        """Keep the zoom id index current with events listed elsewhere
+
+        Args:
+            user_id (str): The user id
+            events (list[dict]): Events of a list or delta response
+        """
+        self.zoom_id_index.update_from_events(user_id, events)
+
+    async def get_event_by_zoom_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Get an event of a user
+
+        Args:
+            user_id (str): The user id
+            zoom_id (str): The event id
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The response of the request
+        """
+        event_id = self.zoom_id_index.get(user_id, zoom_id)
+        if event_id is not None:
+            try:
+                return await self.events_component.get_event(
+                    user_id, event_id, {"$expand": ZOOM_ID_EXPAND}, extra_headers
+                )
+            except HTTPError as e:
+                if not is_not_found_error(e):
+                    raise
+                self.zoom_id_index.discard(user_id, zoom_id)
+        return await self._find_event_by_zoom_id(user_id, zoom_id, extra_headers)
+
+    async def _find_event_by_zoom_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        parameters = build_zoom_id_filter_parameters(zoom_id)
+        response = await self.events_component.list_events(
+            user_id, parameters, extra_headers
+        )
+        event = get_event_matching_zoom_id(response, zoom_id)
+        if "id" in event:
+            self.zoom_id_index.set(user_id, zoom_id, event["id"])
+        return event
+
+    async def _run_with_event_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        extra_headers: Optional[Mapping[str, str]],
+        action: Callable[[str], Awaitable[_T]],
+    ) -> _T:
+        event_id = self.zoom_id_index.get(user_id, zoom_id)
+        if event_id is not None:
+            try:
+                return await action(event_id)
+            except HTTPError as e:
+                if not is_not_found_error(e):
+                    raise
+                logger.info("Event of zoom id %s not found, looking it up", zoom_id)
+                self.zoom_id_index.discard(user_id, zoom_id)
+
+        event = await self._find_event_by_zoom_id(user_id, zoom_id, extra_headers)
+        return await action(event["id"])
+
+    async def get_event_zoom_id(
+        self,
+        user_id: str,
+        event_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """Get the zoom id of an event of a user
+
+        Args:
+            user_id (str): The user id
+            event_id (str): The event id
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            str: The zoom id of the event
+        """
+        parameters = {"$select": "id", "$expand": ZOOM_ID_EXPAND}
+        response = await self.events_component.get_event(
+            user_id, event_id, parameters, extra_headers
+        )
+        return get_zoom_id_of_event(response, event_id)
+
+    async def create_event(
+        self,
+        user_id: str,
+        zoom_id: str,
+        event: EventParameters,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Create an event for a user
+
+        Args:
+            user_id (str): The user id
+            zoom_id (str): The zoom id of the event
+            event (EventParameters): The event data
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The response of the request
+        """
+        json = create_event_body(event, zoom_id)
+        response = await self.events_component.create_event(
+            user_id, json, extra_headers
+        )
+        if "id" in response:
+            self.zoom_id_index.set(user_id, zoom_id, response["id"])
+        return response
+
+    async def update_event_by_zoom_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        event: PartialEventParameters,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Update an event for a user
+
+        Args:
+            user_id (str): The user id
+            zoom_id (str): The zoom id of the event
+            event (EventParameters): The event parameters
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The updated event, empty unless the ``Prefer`` header of
+            ``extra_headers`` asks for ``return=representation``
+        """
+        json = create_partial_event_body(event)
+        return await self._run_with_event_id(
+            user_id,
+            zoom_id,
+            extra_headers,
+            lambda event_id: self.events_component.update_event(
+                user_id, event_id, json, extra_headers
+            ),
+        )
+
+    async def delete_event_by_zoom_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Delete an event of a user
+
+        Args:
+            user_id (str): The user id
+            zoom_id (str): The event id
+            extra_headers (dict): Optional headers for the request
+        """
+        await self._run_with_event_id(
+            user_id,
+            zoom_id,
+            extra_headers,
+            lambda event_id: self.events_component.delete_event(
+                user_id, event_id, extra_headers
+            ),
+        )
+        self.zoom_id_index.discard(user_id, zoom_id)
+
+    async def get_current_event(
+        self,
+        user_id: str,
+    ) -> dict:
+        """Get the current event of a user
+
+        Args:
+            user_id (str): The user id
+
+        Returns:
+            dict: The response of the request
+        """
+        parameters = build_current_event_parameters()
+        response = await self.events_component.list_events(
+            user_id, parameters, CURRENT_EVENT_HEADERS
+        )
+        return get_current_event_of_response(response)
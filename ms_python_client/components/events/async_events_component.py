@@ -0,0 +1,187 @@
+from typing import Any, Mapping, Optional, Sequence
+
+from requests import HTTPError
+
+from ms_python_client.interfaces.async_ms_client_interface import (
+    AsyncMSClientInterface,
+)
+from ms_python_client.utils.error import ConflictError, is_precondition_failed_error
+from ms_python_client.utils.etag_cache import (
+    ETagCache,
+    build_variant_key,
+    decode_conditional_response,
+    with_if_none_match,
+)
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.odata import (
+    EVENT_SELECT,
+    RETURN_MINIMAL,
+    with_preference,
+    with_select,
+)
+
+
+class AsyncEventsComponent:
+    """Events of the calendars of the users
+
+    Only the fields in ``list_select`` and ``get_select`` are requested,
+    unless the parameters of a call have their own ``$select``. An empty
+    ``$select`` requests all the fields.
+
+    The last version of the events read with ``get_event`` is kept in
+    ``etag_cache``, so reading them again only downloads the events that
+    changed. Set it to None to always download them.
+    """
+
+    list_select: Sequence[str] = EVENT_SELECT
+    get_select: Sequence[str] = EVENT_SELECT
+
+    def __init__(self, client: AsyncMSClientInterface) -> None:
+        self.client = client
+        self.etag_cache: Optional[ETagCache] = ETagCache()
+
+    async def list_events(
+        self,
+        user_id: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """List all the events of a user
+
+        Args:
+            user_id (str): The user id
+            parameters (dict): Optional parameters for the request, a
+                ``$select`` replaces the default one
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The response of the request
+        """
+        api_path = f"/users/{user_id}/calendar/events"
+        response = await self.client.make_get_request(
+            api_path,
+            with_select(parameters, self.list_select),
+            extra_headers=extra_headers,
+        )
+        return decode_response(response)
+
+    async def get_event(
+        self,
+        user_id: str,
+        event_id: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Get an event of a user
+
+        Args:
+            user_id (str): The user id
+            event_id (str): The event id
+            parameters (dict): Optional parameters for the request, a
+                ``$select`` replaces the default one
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The event, from ``etag_cache`` when Graph answers that it
+            did not change
+        """
+        api_path = f"/users/{user_id}/calendar/events/{event_id}"
+        parameters = with_select(parameters, self.get_select)
+        if self.etag_cache is None:
+            response = await self.client.make_get_request(
+                api_path, parameters=parameters, extra_headers=extra_headers
+            )
+            return decode_response(response)
+
+        variant = build_variant_key(parameters, extra_headers)
+        cached = self.etag_cache.get(api_path, variant)
+        response = await self.client.make_get_request(
+            api_path,
+            parameters=parameters,
+            extra_headers=with_if_none_match(extra_headers, cached),
+        )
+        return decode_conditional_response(
+            self.etag_cache, api_path, variant, cached, response
+        )
+
+    async def create_event(
+        self,
+        user_id: str,
+        json: Mapping[str, Any],
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Create an event for a user
+
+        Args:
+            user_id (str): The user id
+            data (Mapping[str, Any]): The event data
+
+        Returns:
+            dict: The response of the request
+        """
+        api_path = f"/users/{user_id}/calendar/events"
+        response = await self.client.make_post_request(
+            api_path, json, extra_headers=extra_headers
+        )
+        return decode_response(response)
+
+    async def update_event(
+        self,
+        user_id: str,
+        event_id: str,
+        json: Mapping[str, Any],
+        extra_headers: Optional[Mapping[str, str]] = None,
+        etag: Optional[str] = None,
+    ) -> dict:
+        """Update an event for a user
+
+        Args:
+            user_id (str): The user id
+            event_id (str): The event id
+            data (Mapping[str, Any]): The event parameters
+            etag (str): The ``@odata.etag`` of the event the update is based
+                on, the update fails if the event changed since then
+
+        Raises:
+            ConflictError: The event does not match the etag anymore
+
+        Returns:
+            dict: The updated event, empty unless the ``Prefer`` header of
+            ``extra_headers`` asks for ``return=representation``
+        """
+        api_path = f"/users/{user_id}/calendar/events/{event_id}"
+        headers = with_preference(extra_headers, RETURN_MINIMAL)
+        if etag:
+            headers["If-Match"] = etag
+        if self.etag_cache is not None:
+            self.etag_cache.discard(api_path)
+        try:
+            # Graph answers with a 204 instead of sending the whole event back
+            response = await self.client.make_patch_request(
+                api_path, json, extra_headers=headers
+            )
+        except HTTPError as e:
+            if etag and is_precondition_failed_error(e):
+                raise ConflictError(f"Event {event_id} changed since {etag}") from e
+            raise
+        return decode_response(response) if response.content else {}
+
+    async def delete_event(
+        self,
+        user_id: str,
+        event_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Delete an event of a user
+
+        Args:
+            user_id (str): The user id
+            event_id (str): The event id
+
+        Returns:
+            dict: The response of the request
+        """
+        api_path = f"/users/{user_id}/calendar/events/{event_id}"
+        if self.etag_cache is not None:
+            self.etag_cache.discard(api_path)
+        await self.client.make_delete_request(api_path, extra_headers=extra_headers)
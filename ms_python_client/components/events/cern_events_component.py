@@ -1,9 +1,15 @@
 import logging
-from datetime import datetime
-from typing import Mapping, Optional
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Mapping, Optional, TypeVar
+
+from requests import HTTPError
 
 from ms_python_client.components.events.events_component import EventsComponent
 from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.services.zoom_id_index import MemoryZoomIdIndex, ZoomIdIndex
+from ms_python_client.utils.bulk import MAILBOX_MAX_WORKERS, BulkResult, run_bulk
+from ms_python_client.utils.error import is_not_found_error
+from ms_python_client.utils.etag_cache import ETagCache
 from ms_python_client.utils.event_generator import (
     ZOOM_ID_EXTENDED_PROPERTY_ID,
     EventParameters,
@@ -14,6 +20,13 @@ from ms_python_client.utils.event_generator import (
 
 logger = logging.getLogger("ms_python_client")
 
+_T = TypeVar("_T")
+
+ZOOM_ID_EXPAND = (
+    f"singleValueExtendedProperties($filter=id eq '{ZOOM_ID_EXTENDED_PROPERTY_ID}')"
+)
+CURRENT_EVENT_HEADERS = {"Prefer": 'outlook.timezone="Europe/Zurich"'}
+
 
 class NotFoundError(Exception):
     """Execption raised when an event is not found
@@ -23,11 +36,100 @@ class NotFoundError(Exception):
     """
 
 
+def with_zoom_id_expand(parameters: Optional[Mapping[str, str]]) -> dict:
+    """Expand the zoom id of the events, unless the parameters expand something"""
+    result = dict(parameters or {})
+    result.setdefault("$expand", ZOOM_ID_EXPAND)
+    return result
+
+
+def build_zoom_id_filter_parameters(zoom_id: str) -> dict:
+    return {
+        "$count": "true",
+        "$filter": f"singleValueExtendedProperties/Any(ep: ep/id eq \
+                    '{ZOOM_ID_EXTENDED_PROPERTY_ID}' and ep/value eq '{zoom_id}')",
+        "$expand": f"singleValueExtendedProperties($filter=id eq \
+                    '{ZOOM_ID_EXTENDED_PROPERTY_ID}')",
+    }
+
+
+def get_event_matching_zoom_id(response: dict, zoom_id: str) -> dict:
+    count = response.get("@odata.count", 0)
+    if count == 0:
+        raise NotFoundError(f"Event with zoom id {zoom_id} not found")
+
+    if count > 1:
+        logger.warning(
+            "Found %s events with zoom id %s. Returning the first one.",
+            count,
+            zoom_id,
+        )
+
+    return response.get("value", [])[0]
+
+
+def get_zoom_id_of_event(event: dict, event_id: str) -> str:
+    for property in event["singleValueExtendedProperties"]:
+        if property["id"] == ZOOM_ID_EXTENDED_PROPERTY_ID:
+            return property["value"]
+
+    raise NotFoundError(f"Zoom id not found for event {event_id}")
+
+
+def build_current_event_parameters(now: Optional[datetime] = None) -> dict:
+    """Filter the events happening now
+
+    Graph compares the dates of the filter in UTC, whatever the timezone of
+    the response is. Seconds are enough, and let identical requests share
+    a cached response.
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    datetime_now = now.strftime("%Y-%m-%dT%H:%M:%S")
+    return {
+        "$count": "true",
+        "$filter": f"start/dateTime le '{datetime_now}' and end/dateTime ge '{datetime_now}'",
+    }
+
+
+def get_current_event_of_response(response: dict) -> dict:
+    count = response.get("@odata.count", 0)
+    if count == 0:
+        raise NotFoundError("No current event found")
+
+    if count > 1:
+        logger.warning("Found %s current events. Returning the first one.", count)
+
+    return response.get("value", [])[0]
+
+
 class CERNEventsComponents:
-    """CERN Events component"""
+    """CERN Events component
 
-    def __init__(self, client: MSClientInterface) -> None:
+    The events are listed with their zoom id. The event ids of the zoom ids
+    are kept in ``zoom_id_index``, so updating or deleting a known event
+    takes a single request. An entry that is not valid anymore is dropped
+    and the event is looked up again.
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        zoom_id_index (ZoomIdIndex): The index of the zoom ids, in memory by
+            default
+    """
+
+    def __init__(
+        self,
+        client: MSClientInterface,
+        zoom_id_index: Optional[ZoomIdIndex] = None,
+    ) -> None:
         self.events_component = EventsComponent(client)
+        self.zoom_id_index = (
+            zoom_id_index if zoom_id_index is not None else MemoryZoomIdIndex()
+        )
+
+    @property
+    def etag_cache(self) -> Optional[ETagCache]:
+        """The ``etag_cache`` of the events component"""
+        return self.events_component.etag_cache
 
     def list_events(
         self,
@@ -45,7 +147,54 @@ class CERNEventsComponents:
         Returns:
             dict: The response of the request
         """
-        return self.events_component.list_events(user_id, parameters, extra_headers)
+        response = self.events_component.list_events(
+            user_id, with_zoom_id_expand(parameters), extra_headers
+        )
+        self.zoom_id_index.update_from_events(user_id, response.get("value", []))
+        return response
+
+    def iter_events(
+        self,
+        user_id: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate over all the events of a user, page after page
+
+        Args:
+            user_id (str): The user id
+            parameters (dict): Optional parameters for the first request
+            extra_headers (dict): Optional headers for the requests
+            page_size (int): Number of events per page (``$top``)
+            prefetch (bool): Request the next page while the current one is consumed
+            stream (bool): Decode the events while the pages are read, so
+                only one event is in memory at a time
+
+        Yields:
+            dict: The events
+        """
+        for event in self.events_component.iter_events(
+            user_id,
+            with_zoom_id_expand(parameters),
+            extra_headers,
+            page_size,
+            prefetch,
+            stream,
+        ):
+            self.zoom_id_index.update_from_events(user_id, [event])
+            yield event
+
+    def update_zoom_id_index(self, user_id: str, events: Iterable[dict]) -> None:
+        """Keep the zoom id index current with events listed elsewhere
+
+        Args:
+            user_id (str): The user id
+            events (list[dict]): Events of a list or delta response
+        """
+        self.zoom_id_index.update_from_events(user_id, events)
 
     def get_event_by_zoom_id(
         self,
@@ -63,27 +212,50 @@ class CERNEventsComponents:
         Returns:
             dict: The response of the request
         """
-        parameters = {
-            "$count": "true",
-            "$filter": f"singleValueExtendedProperties/Any(ep: ep/id eq \
-                        '{ZOOM_ID_EXTENDED_PROPERTY_ID}' and ep/value eq '{zoom_id}')",
-            "$expand": f"singleValueExtendedProperties($filter=id eq \
-                        '{ZOOM_ID_EXTENDED_PROPERTY_ID}')",
-        }
+        event_id = self.zoom_id_index.get(user_id, zoom_id)
+        if event_id is not None:
+            try:
+                return self.events_component.get_event(
+                    user_id, event_id, {"$expand": ZOOM_ID_EXPAND}, extra_headers
+                )
+            except HTTPError as e:
+                if not is_not_found_error(e):
+                    raise
+                self.zoom_id_index.discard(user_id, zoom_id)
+        return self._find_event_by_zoom_id(user_id, zoom_id, extra_headers)
+
+    def _find_event_by_zoom_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        parameters = build_zoom_id_filter_parameters(zoom_id)
         response = self.events_component.list_events(user_id, parameters, extra_headers)
+        event = get_event_matching_zoom_id(response, zoom_id)
+        if "id" in event:
+            self.zoom_id_index.set(user_id, zoom_id, event["id"])
+        return event
 
-        count = response.get("@odata.count", 0)
-        if count == 0:
-            raise NotFoundError(f"Event with zoom id {zoom_id} not found")
-
-        if count > 1:
-            logger.warning(
-                "Found %s events with zoom id %s. Returning the first one.",
-                count,
-                zoom_id,
-            )
-
-        return response.get("value", [])[0]
+    def _run_with_event_id(
+        self,
+        user_id: str,
+        zoom_id: str,
+        extra_headers: Optional[Mapping[str, str]],
+        action: Callable[[str], _T],
+    ) -> _T:
+        event_id = self.zoom_id_index.get(user_id, zoom_id)
+        if event_id is not None:
+            try:
+                return action(event_id)
+            except HTTPError as e:
+                if not is_not_found_error(e):
+                    raise
+                logger.info("Event of zoom id %s not found, looking it up", zoom_id)
+                self.zoom_id_index.discard(user_id, zoom_id)
+
+        event_id = self._find_event_by_zoom_id(user_id, zoom_id, extra_headers)["id"]
+        return action(event_id)
 
     def get_event_zoom_id(
         self,
@@ -101,18 +273,11 @@ class CERNEventsComponents:
         Returns:
             str: The zoom id of the event
         """
-        parameters = {
-            "$expand": f"singleValueExtendedProperties($filter=id eq '{ZOOM_ID_EXTENDED_PROPERTY_ID}')",
-        }
+        parameters = {"$select": "id", "$expand": ZOOM_ID_EXPAND}
         response = self.events_component.get_event(
             user_id, event_id, parameters, extra_headers
         )
-
-        for property in response["singleValueExtendedProperties"]:
-            if property["id"] == ZOOM_ID_EXTENDED_PROPERTY_ID:
-                return property["value"]
-
-        raise NotFoundError(f"Zoom id not found for event {event_id}")
+        return get_zoom_id_of_event(response, event_id)
 
     def create_event(
         self,
@@ -133,7 +298,10 @@ class CERNEventsComponents:
             dict: The response of the request
         """
         json = create_event_body(event, zoom_id)
-        return self.events_component.create_event(user_id, json, extra_headers)
+        response = self.events_component.create_event(user_id, json, extra_headers)
+        if "id" in response:
+            self.zoom_id_index.set(user_id, zoom_id, response["id"])
+        return response
 
     def update_event_by_zoom_id(
         self,
@@ -151,12 +319,17 @@ class CERNEventsComponents:
             extra_headers (dict): Optional headers for the request
 
         Returns:
-            dict: The response of the request
+            dict: The updated event, empty unless the ``Prefer`` header of
+            ``extra_headers`` asks for ``return=representation``
         """
         json = create_partial_event_body(event)
-        event_id = self.get_event_by_zoom_id(user_id, zoom_id, extra_headers)["id"]
-        return self.events_component.update_event(
-            user_id, event_id, json, extra_headers
+        return self._run_with_event_id(
+            user_id,
+            zoom_id,
+            extra_headers,
+            lambda event_id: self.events_component.update_event(
+                user_id, event_id, json, extra_headers
+            ),
         )
 
     def delete_event_by_zoom_id(
@@ -175,8 +348,107 @@ class CERNEventsComponents:
         Returns:
             dict: The response of the request
         """
-        event_id = self.get_event_by_zoom_id(user_id, zoom_id, extra_headers)["id"]
-        self.events_component.delete_event(user_id, event_id, extra_headers)
+        self._run_with_event_id(
+            user_id,
+            zoom_id,
+            extra_headers,
+            lambda event_id: self.events_component.delete_event(
+                user_id, event_id, extra_headers
+            ),
+        )
+        self.zoom_id_index.discard(user_id, zoom_id)
+
+    def create_events(
+        self,
+        user_id: str,
+        events: Iterable["tuple[str, EventParameters]"],
+        extra_headers: Optional[Mapping[str, str]] = None,
+        max_workers: int = MAILBOX_MAX_WORKERS,
+        stop_on_error: bool = False,
+    ) -> Iterator[BulkResult]:
+        """Create many events for a user concurrently
+
+        Results are yielded as soon as each event is created, in any order.
+
+        Args:
+            user_id (str): The user id
+            events (list[tuple[str, EventParameters]]): The zoom id and the
+                data of each event
+            extra_headers (dict): Optional headers for the requests
+            max_workers (int): Maximum number of concurrent requests
+            stop_on_error (bool): Don't create more events after an error
+
+        Yields:
+            BulkResult: The zoom id with the created event or the error
+        """
+        return run_bulk(
+            lambda item: self.create_event(user_id, item[0], item[1], extra_headers),
+            events,
+            lambda item: item[0],
+            max_workers,
+            stop_on_error,
+        )
+
+    def update_events_by_zoom_id(
+        self,
+        user_id: str,
+        events: Iterable["tuple[str, PartialEventParameters]"],
+        extra_headers: Optional[Mapping[str, str]] = None,
+        max_workers: int = MAILBOX_MAX_WORKERS,
+        stop_on_error: bool = False,
+    ) -> Iterator[BulkResult]:
+        """Update many events of a user concurrently
+
+        Args:
+            user_id (str): The user id
+            events (list[tuple[str, PartialEventParameters]]): The zoom id and
+                the parameters of each event
+            extra_headers (dict): Optional headers for the requests
+            max_workers (int): Maximum number of concurrent requests
+            stop_on_error (bool): Don't update more events after an error
+
+        Yields:
+            BulkResult: The zoom id with the updated event or the error
+        """
+        return run_bulk(
+            lambda item: self.update_event_by_zoom_id(
+                user_id, item[0], item[1], extra_headers
+            ),
+            events,
+            lambda item: item[0],
+            max_workers,
+            stop_on_error,
+        )
+
+    def delete_events_by_zoom_id(
+        self,
+        user_id: str,
+        zoom_ids: Iterable[str],
+        extra_headers: Optional[Mapping[str, str]] = None,
+        max_workers: int = MAILBOX_MAX_WORKERS,
+        stop_on_error: bool = False,
+    ) -> Iterator[BulkResult]:
+        """Delete many events of a user concurrently
+
+        Args:
+            user_id (str): The user id
+            zoom_ids (list[str]): The zoom ids of the events
+            extra_headers (dict): Optional headers for the requests
+            max_workers (int): Maximum number of concurrent requests
+            stop_on_error (bool): Don't delete more events after an error
+
+        Yields:
+            BulkResult: The zoom id, with the error if the deletion failed
+        """
+        return run_bulk(
+            lambda zoom_id: self.delete_event_by_zoom_id(
+                user_id, zoom_id, extra_headers
+            ),
+            zoom_ids,
+            lambda zoom_id: zoom_id,
+            max_workers,
+            stop_on_error,
+        )
 
     def get_current_event(
         self,
@@ -190,19 +462,8 @@ class CERNEventsComponents:
         Returns:
             dict: The response of the request
         """
-        datetime_now = datetime.now().isoformat()
-        parameters = {
-            "$count": "true",
-            "$filter": f"start/dateTime le '{datetime_now}' and end/dateTime ge '{datetime_now}'",
-        }
-        extra_headers = {"Prefer": 'outlook.timezone="Europe/Zurich"'}
-        response = self.events_component.list_events(user_id, parameters, extra_headers)
-
-        count = response.get("@odata.count", 0)
-        if count == 0:
-            raise NotFoundError("No current event found")
-
-        if count > 1:
-            logger.warning("Found %s current events. Returning the first one.", count)
-
-        return response.get("value", [])[0]
+        parameters = build_current_event_parameters()
+        response = self.events_component.list_events(
+            user_id, parameters, CURRENT_EVENT_HEADERS
+        )
+        return get_current_event_of_response(response)
@@ -1,11 +1,43 @@
-from typing import Any, Mapping, Optional
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from requests import HTTPError
 
 from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.utils.error import ConflictError, is_precondition_failed_error
+from ms_python_client.utils.etag_cache import (
+    ETagCache,
+    build_variant_key,
+    decode_conditional_response,
+    with_if_none_match,
+)
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.odata import (
+    EVENT_SELECT,
+    RETURN_MINIMAL,
+    with_preference,
+    with_select,
+)
+from ms_python_client.utils.pagination import iter_items
 
 
 class EventsComponent:
+    """Events of the calendars of the users
+
+    Only the fields in ``list_select`` and ``get_select`` are requested,
+    unless the parameters of a call have their own ``$select``. An empty
+    ``$select`` requests all the fields.
+
+    The last version of the events read with ``get_event`` is kept in
+    ``etag_cache``, so reading them again only downloads the events that
+    changed. Set it to None to always download them.
+    """
+
+    list_select: Sequence[str] = EVENT_SELECT
+    get_select: Sequence[str] = EVENT_SELECT
+
     def __init__(self, client: MSClientInterface) -> None:
         self.client = client
+        self.etag_cache: Optional[ETagCache] = ETagCache()
 
     def list_events(
         self,
@@ -17,15 +49,56 @@ class EventsComponent:
 
         Args:
             user_id (str): The user id
+            parameters (dict): Optional parameters for the request, a
+                ``$select`` replaces the default one
+            extra_headers (dict): Optional headers for the request
 
         Returns:
             dict: The response of the request
         """
         api_path = f"/users/{user_id}/calendar/events"
         response = self.client.make_get_request(
-            api_path, parameters, extra_headers=extra_headers
+            api_path,
+            with_select(parameters, self.list_select),
+            extra_headers=extra_headers,
+        )
+        return decode_response(response)
+
+    def iter_events(
+        self,
+        user_id: str,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate over all the events of a user, page after page
+
+        Pages are requested lazily, so only about one page is kept in memory.
+
+        Args:
+            user_id (str): The user id
+            parameters (dict): Optional parameters for the first request
+            extra_headers (dict): Optional headers for the requests
+            page_size (int): Number of events per page (``$top``)
+            prefetch (bool): Request the next page while the current one is consumed
+            stream (bool): Decode the events while the pages are read, so
+                only one event is in memory at a time
+
+        Yields:
+            dict: The events
+        """
+        api_path = f"/users/{user_id}/calendar/events"
+        return iter_items(
+            self.client,
+            api_path,
+            with_select(parameters, self.list_select),
+            extra_headers,
+            page_size,
+            prefetch,
+            stream,
         )
-        return response.json()
 
     def get_event(
         self,
@@ -39,15 +112,32 @@ class EventsComponent:
         Args:
             user_id (str): The user id
             event_id (str): The event id
+            parameters (dict): Optional parameters for the request, a
+                ``$select`` replaces the default one
+            extra_headers (dict): Optional headers for the request
 
         Returns:
-            dict: The response of the request
+            dict: The event, from ``etag_cache`` when Graph answers that it
+            did not change
         """
         api_path = f"/users/{user_id}/calendar/events/{event_id}"
+        parameters = with_select(parameters, self.get_select)
+        if self.etag_cache is None:
+            response = self.client.make_get_request(
+                api_path, parameters=parameters, extra_headers=extra_headers
+            )
+            return decode_response(response)
+
+        variant = build_variant_key(parameters, extra_headers)
+        cached = self.etag_cache.get(api_path, variant)
         response = self.client.make_get_request(
-            api_path, parameters=parameters, extra_headers=extra_headers
+            api_path,
+            parameters=parameters,
+            extra_headers=with_if_none_match(extra_headers, cached),
+        )
+        return decode_conditional_response(
+            self.etag_cache, api_path, variant, cached, response
         )
-        return response.json()
 
     def create_event(
         self,
@@ -68,7 +158,7 @@ class EventsComponent:
         response = self.client.make_post_request(
             api_path, json, extra_headers=extra_headers
         )
-        return response.json()
+        return decode_response(response)
 
     def update_event(
         self,
@@ -76,6 +166,7 @@ class EventsComponent:
         event_id: str,
         json: Mapping[str, Any],
         extra_headers: Optional[Mapping[str, str]] = None,
+        etag: Optional[str] = None,
     ) -> dict:
         """Update an event for a user
 
@@ -83,15 +174,32 @@ class EventsComponent:
             user_id (str): The user id
             event_id (str): The event id
             data (Mapping[str, Any]): The event parameters
+            etag (str): The ``@odata.etag`` of the event the update is based
+                on, the update fails if the event changed since then
+
+        Raises:
+            ConflictError: The event does not match the etag anymore
 
         Returns:
-            dict: The response of the request
+            dict: The updated event, empty unless the ``Prefer`` header of
+            ``extra_headers`` asks for ``return=representation``
         """
         api_path = f"/users/{user_id}/calendar/events/{event_id}"
-        response = self.client.make_patch_request(
-            api_path, json, extra_headers=extra_headers
-        )
-        return response.json()
+        headers = with_preference(extra_headers, RETURN_MINIMAL)
+        if etag:
+            headers["If-Match"] = etag
+        if self.etag_cache is not None:
+            self.etag_cache.discard(api_path)
+        try:
+            # Graph answers with a 204 instead of sending the whole event back
+            response = self.client.make_patch_request(
+                api_path, json, extra_headers=headers
+            )
+        except HTTPError as e:
+            if etag and is_precondition_failed_error(e):
+                raise ConflictError(f"Event {event_id} changed since {etag}") from e
+            raise
+        return decode_response(response) if response.content else {}
 
     def delete_event(
         self,
@@ -109,4 +217,6 @@ class EventsComponent:
             dict: The response of the request
         """
         api_path = f"/users/{user_id}/calendar/events/{event_id}"
+        if self.etag_cache is not None:
+            self.etag_cache.discard(api_path)
         self.client.make_delete_request(api_path, extra_headers=extra_headers)
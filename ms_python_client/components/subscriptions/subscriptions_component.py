@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Any, Iterator, Mapping, Optional
+
+from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.services.calendar_sync import format_utc
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.pagination import iter_items
+
+
+class SubscriptionsComponent:
+    """Subscriptions to the change notifications of Graph"""
+
+    def __init__(self, client: MSClientInterface) -> None:
+        self.client = client
+
+    def iter_subscriptions(
+        self, extra_headers: Optional[Mapping[str, str]] = None
+    ) -> Iterator[dict]:
+        """Iterate over the subscriptions of the application
+
+        Args:
+            extra_headers (dict): Optional headers for the requests
+
+        Yields:
+            dict: The subscriptions
+        """
+        return iter_items(self.client, "/subscriptions", None, extra_headers)
+
+    def create_subscription(
+        self,
+        json: Mapping[str, Any],
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Create a subscription
+
+        Graph first sends a ``validationToken`` to the ``notificationUrl``,
+        the subscription is only created if it is echoed back.
+
+        Args:
+            json (Mapping[str, Any]): The ``changeType``, ``notificationUrl``,
+                ``resource``, ``expirationDateTime`` and ``clientState``
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The subscription
+        """
+        response = self.client.make_post_request(
+            "/subscriptions", json, extra_headers=extra_headers
+        )
+        return decode_response(response)
+
+    def renew_subscription(
+        self,
+        subscription_id: str,
+        expiration: datetime,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """Move the expiration of a subscription
+
+        Args:
+            subscription_id (str): The subscription id
+            expiration (datetime): The new expiration, naive dates are UTC
+            extra_headers (dict): Optional headers for the request
+
+        Returns:
+            dict: The subscription
+        """
+        api_path = f"/subscriptions/{subscription_id}"
+        response = self.client.make_patch_request(
+            api_path,
+            {"expirationDateTime": format_utc(expiration)},
+            extra_headers=extra_headers,
+        )
+        return decode_response(response)
+
+    def delete_subscription(
+        self,
+        subscription_id: str,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Delete a subscription
+
+        Args:
+            subscription_id (str): The subscription id
+            extra_headers (dict): Optional headers for the request
+        """
+        api_path = f"/subscriptions/{subscription_id}"
+        self.client.make_delete_request(api_path, extra_headers=extra_headers)
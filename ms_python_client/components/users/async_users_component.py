@@ -0,0 +1,41 @@
+from typing import Mapping, Optional, Sequence
+
+from ms_python_client.interfaces.async_ms_client_interface import (
+    AsyncMSClientInterface,
+)
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.odata import USER_SELECT, with_select
+
+
+class AsyncUsersComponent:
+    """Users of the tenant
+
+    Only the fields in ``select`` are requested, unless the parameters of a
+    call have their own ``$select``. An empty ``$select`` requests all the
+    fields.
+    """
+
+    select: Sequence[str] = USER_SELECT
+
+    def __init__(self, client: AsyncMSClientInterface) -> None:
+        self.client = client
+
+    async def list_users(
+        self,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> dict:
+        """List all users
+
+        Args:
+            parameters (Optional[Mapping[str, str]], optional): Parameters for the request. Defaults to None.
+            extra_headers (Optional[Mapping[str, str]], optional): Additional headers for the request. Defaults to None.
+
+        Returns:
+            dict: The response of the request
+        """
+        api_path = "/users"
+        response = await self.client.make_get_request(
+            api_path, with_select(parameters, self.select), extra_headers
+        )
+        return decode_response(response)
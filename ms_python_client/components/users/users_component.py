@@ -1,9 +1,21 @@
-from typing import Mapping, Optional
+from typing import Iterator, Mapping, Optional, Sequence
 
 from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.odata import USER_SELECT, with_select
+from ms_python_client.utils.pagination import iter_items
 
 
 class UsersComponent:
+    """Users of the tenant
+
+    Only the fields in ``select`` are requested, unless the parameters of a
+    call have their own ``$select``. An empty ``$select`` requests all the
+    fields.
+    """
+
+    select: Sequence[str] = USER_SELECT
+
     def __init__(self, client: MSClientInterface) -> None:
         self.client = client
 
@@ -22,5 +34,40 @@ class UsersComponent:
             dict: The response of the request
         """
         api_path = "/users"
-        response = self.client.make_get_request(api_path, parameters, extra_headers)
-        return response.json()
+        response = self.client.make_get_request(
+            api_path, with_select(parameters, self.select), extra_headers
+        )
+        return decode_response(response)
+
+    def iter_users(
+        self,
+        parameters: Optional[Mapping[str, str]] = None,
+        extra_headers: Optional[Mapping[str, str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[dict]:
+        """Iterate over all users, page after page
+
+        Pages are requested lazily, so only about one page is kept in memory.
+
+        Args:
+            parameters (Optional[Mapping[str, str]], optional): Parameters for the first request. Defaults to None.
+            extra_headers (Optional[Mapping[str, str]], optional): Extra headers for the requests. Defaults to None.
+            page_size (Optional[int], optional): Number of users per page (``$top``). Defaults to None.
+            prefetch (bool, optional): Request the next page in the background. Defaults to False.
+            stream (bool, optional): Decode the users while the pages are read. Defaults to False.
+
+        Yields:
+            dict: The users
+        """
+        api_path = "/users"
+        return iter_items(
+            self.client,
+            api_path,
+            with_select(parameters, self.select),
+            extra_headers,
+            page_size,
+            prefetch,
+            stream,
+        )
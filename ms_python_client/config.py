@@ -7,6 +7,10 @@ class Config:
     AZURE_AUTHORITY: str
     AZURE_CLIENT_ID: str
     AZURE_SCOPE: list[str] = []
+    AZURE_CLIENT_SECRET: Optional[str] = None
+    AZURE_CLIENT_CERTIFICATE_FILE: Optional[str] = None
+    AZURE_CLIENT_CERTIFICATE_THUMBPRINT: Optional[str] = None
+    AZURE_AUTHORITY_METADATA_FILE: Optional[str] = None
 
     def __init__(
         self,
@@ -14,6 +18,10 @@ class Config:
         azure_authority: Optional[str] = None,
         azure_client_id: Optional[str] = None,
         azure_scope: Optional[list[str]] = None,
+        azure_client_secret: Optional[str] = None,
+        azure_client_certificate_file: Optional[str] = None,
+        azure_client_certificate_thumbprint: Optional[str] = None,
+        azure_authority_metadata_file: Optional[str] = None,
     ):
         if token_cache_file:
             self.TOKEN_CACHE_FILE = token_cache_file
@@ -31,3 +39,16 @@ class Config:
             self.AZURE_SCOPE = azure_scope
         else:
             raise ValueError("Azure scope is not set")
+
+        if azure_client_certificate_file and not azure_client_certificate_thumbprint:
+            raise ValueError("Azure client certificate thumbprint is not set")
+        self.AZURE_CLIENT_SECRET = azure_client_secret
+        self.AZURE_CLIENT_CERTIFICATE_FILE = azure_client_certificate_file
+        self.AZURE_CLIENT_CERTIFICATE_THUMBPRINT = azure_client_certificate_thumbprint
+        self.AZURE_AUTHORITY_METADATA_FILE = azure_authority_metadata_file
+
+    @property
+    def app_only(self) -> bool:
+        """Whether the client authenticates as an application (client
+        credentials) instead of as a user (device flow)"""
+        return bool(self.AZURE_CLIENT_SECRET or self.AZURE_CLIENT_CERTIFICATE_FILE)
@@ -17,6 +17,7 @@ class MSClientInterface(ABC):
         api_path: str,
         parameters: Optional[Mapping[str, str]] = None,
         extra_headers: Optional[_Headers] = None,
+        stream: bool = False,
     ) -> requests.Response:
         logger.warning("Method not implemented")
         raise NotImplementedError
@@ -27,6 +28,7 @@ class MSClientInterface(ABC):
         api_path: str,
         json: _Data,
         extra_headers: Optional[_Headers] = None,
+        idempotent: bool = False,
     ) -> requests.Response:
         logger.warning("Method not implemented")
         raise NotImplementedError
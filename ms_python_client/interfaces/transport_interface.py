@@ -0,0 +1,58 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Mapping, Optional
+
+import requests
+
+from ms_python_client.utils.http_pool import PoolStats
+
+logger = logging.getLogger("ms_python_client")
+
+_Headers = Mapping[str, str]
+
+
+class TransportInterface(ABC):
+    """Sends the HTTP requests of ApiClient
+
+    Every transport returns ``requests.Response`` objects and raises the
+    ``requests`` exceptions, so ApiClient and its callers don't depend on the
+    HTTP library behind it. The body is either an object to encode, ``json``,
+    or bytes already encoded, ``data``. With ``stream``, the body of the
+    response is read when it is iterated, if the transport supports it.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[_Headers] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        data: Optional[bytes] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        logger.warning("Method not implemented")
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        logger.warning("Method not implemented")
+        raise NotImplementedError
+
+    def get_pool_stats(self, url: str) -> Optional[PoolStats]:
+        """Get the usage of the connection pool used for a URL
+
+        Args:
+            url (str): The URL
+
+        Returns:
+            PoolStats: The statistics, None if the transport does not collect them
+        """
+        return None
+
+    def __enter__(self) -> "TransportInterface":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,147 @@
+import logging
+import sys
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from ms_python_client.services.zoom_id_index import find_zoom_id
+from ms_python_client.utils import json_codec
+from ms_python_client.utils.windows_timezones import WINDOWS_TIMEZONES
+
+logger = logging.getLogger("ms_python_client")
+
+# Members decoded right away, the others are kept encoded until they are read
+EVENT_FIELDS = frozenset(
+    ["id", "subject", "start", "end", "location", "singleValueExtendedProperties"]
+)
+
+
+@lru_cache(maxsize=None)
+def get_timezone(name: str) -> tzinfo:
+    """Get the timezone of a Graph ``timeZone``, shared by all the events
+
+    Args:
+        name (str): ``UTC``, a Windows name such as ``Romance Standard Time``
+            or an IANA name such as ``Europe/Zurich``
+
+    Returns:
+        tzinfo: The timezone, UTC for the names that are not known here
+    """
+    if name == "UTC":
+        return timezone.utc
+    try:
+        return ZoneInfo(WINDOWS_TIMEZONES.get(name, name))
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning("Unknown timezone %r, its dates are considered UTC", name)
+        return timezone.utc
+
+
+def parse_graph_datetime(value: Optional[Mapping[str, str]]) -> Optional[datetime]:
+    """Parse a ``dateTimeTimeZone`` of Graph
+
+    Args:
+        value (dict): The ``dateTime`` and ``timeZone`` of the date
+
+    Returns:
+        datetime: The date, always aware
+    """
+    if not value or not value.get("dateTime"):
+        return None
+    # Graph sends 7 digits of fractions of seconds, Python reads up to 6
+    date = datetime.fromisoformat(value["dateTime"][:26])
+    return date.replace(tzinfo=get_timezone(value.get("timeZone", "UTC")))
+
+
+class Event:
+    """Memory efficient view of an event returned by Graph
+
+    The fields read all the time are decoded when the event is built. The
+    other members of the response, such as ``body`` and ``attendees``, are
+    kept as encoded JSON and decoded every time they are read.
+
+    Attributes:
+        id (str): The event id
+        subject (str): The subject
+        start (datetime): The start, aware
+        end (datetime): The end, aware
+        location (str): The display name of the location
+        zoom_id (str): The zoom id, if the extended property was expanded
+    """
+
+    __slots__ = ("id", "subject", "start", "end", "location", "zoom_id", "_others")
+
+    def __init__(
+        self,
+        id: str,  # pylint: disable=redefined-builtin
+        subject: str = "",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        location: str = "",
+        zoom_id: Optional[str] = None,
+        others: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.id = id
+        self.subject = subject
+        self.start = start
+        self.end = end
+        self.location = location
+        self.zoom_id = zoom_id
+        self._others: Optional[bytes] = json_codec.dumps(others) if others else None
+
+    @classmethod
+    def from_graph(cls, data: Mapping[str, Any]) -> "Event":
+        """Build an event from the JSON of Graph
+
+        Args:
+            data (dict): The event, as returned by ``EventsComponent``
+
+        Returns:
+            Event: The event
+        """
+        location = data.get("location") or {}
+        return cls(
+            id=data.get("id", ""),
+            subject=data.get("subject") or "",
+            start=parse_graph_datetime(data.get("start")),
+            end=parse_graph_datetime(data.get("end")),
+            location=sys.intern(location.get("displayName") or ""),
+            zoom_id=find_zoom_id(data),
+            others={
+                key: value for key, value in data.items() if key not in EVENT_FIELDS
+            },
+        )
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Decode another member of the event
+
+        Args:
+            name (str): The name of the member in the Graph JSON
+            default (Any): Returned when the event has no such member
+
+        Returns:
+            Any: The value of the member
+        """
+        if self._others is None:
+            return default
+        return json_codec.loads(self._others).get(name, default)
+
+    @property
+    def body(self) -> Optional[dict]:
+        """The ``contentType`` and ``content`` of the body, if selected"""
+        return self.get("body")
+
+    @property
+    def attendees(self) -> list:
+        """The attendees, if selected"""
+        return self.get("attendees", [])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return f"Event(id={self.id!r}, subject={self.subject!r}, start={self.start!r})"
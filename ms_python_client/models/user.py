@@ -0,0 +1,80 @@
+from typing import Any, Mapping, Optional
+
+from ms_python_client.utils import json_codec
+
+# Members decoded right away, the others are kept encoded until they are read
+USER_FIELDS = frozenset(["id", "displayName", "mail", "userPrincipalName"])
+
+
+class User:
+    """Memory efficient view of a user returned by Graph
+
+    The other members of the response are kept as encoded JSON and decoded
+    every time they are read.
+
+    Attributes:
+        id (str): The user id
+        display_name (str): The display name
+        mail (str): The email address
+        user_principal_name (str): The principal name
+    """
+
+    __slots__ = ("id", "display_name", "mail", "user_principal_name", "_others")
+
+    def __init__(
+        self,
+        id: str,  # pylint: disable=redefined-builtin
+        display_name: str = "",
+        mail: Optional[str] = None,
+        user_principal_name: str = "",
+        others: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.id = id
+        self.display_name = display_name
+        self.mail = mail
+        self.user_principal_name = user_principal_name
+        self._others: Optional[bytes] = json_codec.dumps(others) if others else None
+
+    @classmethod
+    def from_graph(cls, data: Mapping[str, Any]) -> "User":
+        """Build a user from the JSON of Graph
+
+        Args:
+            data (dict): The user, as returned by ``UsersComponent``
+
+        Returns:
+            User: The user
+        """
+        return cls(
+            id=data.get("id", ""),
+            display_name=data.get("displayName") or "",
+            mail=data.get("mail"),
+            user_principal_name=data.get("userPrincipalName") or "",
+            others={
+                key: value for key, value in data.items() if key not in USER_FIELDS
+            },
+        )
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Decode another member of the user
+
+        Args:
+            name (str): The name of the member in the Graph JSON
+            default (Any): Returned when the user has no such member
+
+        Returns:
+            Any: The value of the member
+        """
+        if self._others is None:
+            return default
+        return json_codec.loads(self._others).get(name, default)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, User):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return f"User(id={self.id!r}, display_name={self.display_name!r})"
@@ -1,16 +1,27 @@
 import logging
 import os
+from datetime import datetime
 from typing import Any, Mapping, Optional
 
 import requests
 
 from ms_python_client.api_client import ApiClient
+from ms_python_client.batch_request import BatchRequest
 from ms_python_client.components.events.events_component import EventsComponent
+from ms_python_client.components.subscriptions.subscriptions_component import (
+    SubscriptionsComponent,
+)
 from ms_python_client.components.users.users_component import UsersComponent
 from ms_python_client.config import Config
 from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.interfaces.transport_interface import TransportInterface
+from ms_python_client.services.calendar_sync import CalendarSync, DeltaStateStore
 from ms_python_client.services.oauth2_flow import Oauth2Flow
+from ms_python_client.services.token_holder import AccessTokenHolder
 from ms_python_client.utils import init_from_env
+from ms_python_client.utils.http_pool import PoolStats
+from ms_python_client.utils.response_cache import ResponseCache
+from ms_python_client.utils.retry import RetryPolicy, RetryStats
 
 logging.getLogger("ms_python_client").addHandler(logging.NullHandler())
 logger = logging.getLogger("ms_python_client")
@@ -38,26 +49,52 @@ class MSApiClient(MSClientInterface):
         # Add all the new components here
         self.events = EventsComponent(self)
         self.users = UsersComponent(self)
+        self.subscriptions = SubscriptionsComponent(self)
 
     def __init__(
         self,
         config: Config,
         api_endpoint: str = "https://graph.microsoft.com/v1.0",
+        retry_policy: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+        http2: bool = False,
+        transport: Optional[TransportInterface] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
+        self.response_cache = response_cache
         if "MS_ACCESS_TOKEN" in os.environ and os.getenv("MS_ACCESS_TOKEN") != "":
             self.dev_token = os.environ["MS_ACCESS_TOKEN"]
         else:
             self.dev_token = None
             self.oauth = Oauth2Flow(config)
-
-        self.api_client = ApiClient(api_base_url=api_endpoint)
+            self.token_holder = AccessTokenHolder(
+                self.oauth.get_access_token_with_expiry
+            )
+
+        self.api_client = ApiClient(
+            api_base_url=api_endpoint,
+            retry_policy=retry_policy,
+            session=session,
+            http2=http2,
+            transport=transport,
+        )
         self.init_components()
 
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Counters of the retries and of the time spent waiting for them"""
+        return self.api_client.retry_stats
+
+    @property
+    def pool_stats(self) -> Optional[PoolStats]:
+        """Usage of the connection pool, None for a transport without stats"""
+        return self.api_client.pool_stats
+
     def build_headers(self, extra_headers: Optional[_Headers] = None) -> _Headers:
         if self.dev_token:
             token = self.dev_token
         else:
-            token = self.oauth.get_access_token()[0]
+            token = self.token_holder.get_token()
 
         headers = self.api_client.build_headers(
             extra_headers={"Authorization": f"Bearer {token}"}
@@ -80,25 +117,43 @@ class MSApiClient(MSClientInterface):
         api_path: str,
         parameters: Optional[Mapping[str, str]] = None,
         extra_headers: Optional[_Headers] = None,
+        stream: bool = False,
     ) -> requests.Response:
         headers = self.build_headers(extra_headers)
         query_string = self.build_query_string_from_dict(parameters)
+        path = f"{api_path}{query_string}"
+
+        # Streamed bodies are not read at once, they are not cached
+        cache = None if stream else self.response_cache
+        if cache is not None:
+            cache_path = self._relative_path(path)
+            cached = cache.get(cache_path, headers)
+            if cached is not None:
+                return cached
 
         response = self.api_client.make_get_request(
-            api_path=f"{api_path}{query_string}",
+            api_path=path,
             headers=headers,
+            stream=stream,
         )
 
+        if cache is not None:
+            cache.put(cache_path, headers, response)
         return response
 
     def make_post_request(
-        self, api_path: str, json: _Data, extra_headers: Optional[_Headers] = None
+        self,
+        api_path: str,
+        json: _Data,
+        extra_headers: Optional[_Headers] = None,
+        idempotent: bool = False,
     ) -> requests.Response:
         headers = self.build_headers(extra_headers)
 
         response = self.api_client.make_post_request(
-            api_path=api_path, headers=headers, json=json
+            api_path=api_path, headers=headers, json=json, idempotent=idempotent
         )
+        self._invalidate(api_path)
 
         return response
 
@@ -110,6 +165,7 @@ class MSApiClient(MSClientInterface):
         response = self.api_client.make_patch_request(
             api_path=api_path, headers=headers, json=json
         )
+        self._invalidate(api_path)
 
         return response
 
@@ -121,5 +177,64 @@ class MSApiClient(MSClientInterface):
         response = self.api_client.make_delete_request(
             api_path=api_path, headers=headers
         )
+        self._invalidate(api_path)
 
         return response
+
+    def _relative_path(self, api_path: str) -> str:
+        # The next links of the pages are absolute URLs
+        return api_path.removeprefix(self.api_client.api_base_url)
+
+    def _invalidate(self, api_path: str) -> None:
+        if self.response_cache is not None:
+            self.response_cache.invalidate(self._relative_path(api_path))
+
+    def _invalidate_batch_write(self, api_path: str) -> None:
+        # The writes of a batch don't go through the components, which drop
+        # the etags of the events they write
+        self._invalidate(api_path)
+        etag_cache = self.events.etag_cache
+        if etag_cache is not None:
+            etag_cache.discard(api_path.split("?", 1)[0])
+
+    def batch(self, max_retries: Optional[int] = None) -> BatchRequest:
+        """Create a batch to send several requests in a single one
+
+        The requests of the batch are retried with the retry policy of the
+        client, like the requests sent on their own. Their writes drop the
+        cached responses and etags of the resources they change.
+
+        Args:
+            max_retries (int): Number of times a throttled or failed request
+                of the batch is sent again, the one of the policy by default
+
+        Returns:
+            BatchRequest: The batch, executed with ``execute()`` or when
+            leaving its ``with`` block
+        """
+        return BatchRequest(
+            self,
+            max_retries,
+            self.api_client.retry_policy,
+            on_write=self._invalidate_batch_write,
+        )
+
+    def calendar_sync(
+        self,
+        store: DeltaStateStore,
+        start: datetime,
+        end: datetime,
+        page_size: Optional[int] = None,
+    ) -> CalendarSync:
+        """Create a sync engine returning the changes of calendars
+
+        Args:
+            store (DeltaStateStore): Where the delta links are kept between syncs
+            start (datetime): Start of the synchronized time window
+            end (datetime): End of the synchronized time window
+            page_size (int): Maximum number of changes per page
+
+        Returns:
+            CalendarSync: The sync engine, call ``sync(user_id)`` on it
+        """
+        return CalendarSync(self, store, start, end, page_size)
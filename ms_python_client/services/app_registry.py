@@ -0,0 +1,172 @@
+"""Process-wide registry of MSAL applications.
+
+Building an MSAL application runs the authority discovery requests, so the
+application (and its token cache) is built once per process and shared by
+all the clients using the same configuration.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+from typing import Any, Optional, Union
+
+import msal
+from msal.throttled_http_client import NormalizedResponse
+
+from ms_python_client.config import Config
+from ms_python_client.services.token_cache import FileTokenCache
+
+logger = logging.getLogger("ms_python_client")
+
+_lock = threading.Lock()
+_applications: "dict[tuple, msal.ClientApplication]" = {}
+_http_caches: "dict[str, dict]" = {}
+
+
+def get_application(conf: Config) -> msal.ClientApplication:
+    """Get the MSAL application for a configuration, building it only once
+
+    Applications are shared by the configurations with the same client id,
+    authority, kind of authentication and token cache file.
+
+    Args:
+        conf (Config): The configuration of the client
+
+    Returns:
+        msal.ClientApplication: The application, with a FileTokenCache
+    """
+    key = (
+        conf.AZURE_CLIENT_ID,
+        conf.AZURE_AUTHORITY,
+        conf.app_only,
+        os.path.abspath(conf.TOKEN_CACHE_FILE),
+    )
+    with _lock:
+        app = _applications.get(key)
+        if app is None:
+            app = _applications[key] = _build_application(conf)
+        return app
+
+
+def clear_applications() -> None:
+    """Forget all the applications built so far"""
+    with _lock:
+        _applications.clear()
+        _http_caches.clear()
+
+
+@atexit.register
+def _save_all() -> None:
+    with _lock:
+        for app in _applications.values():
+            app.token_cache.persist()
+        for path, http_cache in _http_caches.items():
+            _save_http_cache(path, http_cache)
+
+
+def _build_application(conf: Config) -> msal.ClientApplication:
+    cache = FileTokenCache(conf.TOKEN_CACHE_FILE)
+
+    http_cache = _load_http_cache(conf.AZURE_AUTHORITY_METADATA_FILE)
+
+    app: msal.ClientApplication
+    if conf.app_only:
+        app = msal.ConfidentialClientApplication(
+            conf.AZURE_CLIENT_ID,
+            authority=conf.AZURE_AUTHORITY,
+            client_credential=_get_client_credential(conf),
+            token_cache=cache,
+            http_cache=http_cache,
+        )
+    else:
+        app = msal.PublicClientApplication(
+            conf.AZURE_CLIENT_ID,
+            authority=conf.AZURE_AUTHORITY,
+            token_cache=cache,
+            http_cache=http_cache,
+        )
+
+    if conf.AZURE_AUTHORITY_METADATA_FILE:
+        _save_http_cache(conf.AZURE_AUTHORITY_METADATA_FILE, http_cache)
+        _http_caches[conf.AZURE_AUTHORITY_METADATA_FILE] = http_cache
+    return app
+
+
+def _get_client_credential(conf: Config) -> Union[str, dict]:
+    if conf.AZURE_CLIENT_SECRET:
+        return conf.AZURE_CLIENT_SECRET
+
+    with open(conf.AZURE_CLIENT_CERTIFICATE_FILE, "r", encoding="utf-8") as f:
+        return {
+            "private_key": f.read(),
+            "thumbprint": conf.AZURE_CLIENT_CERTIFICATE_THUMBPRINT,
+        }
+
+
+def _load_http_cache(path: Optional[str]) -> Optional[dict]:
+    # The MSAL http cache holds the responses of the authority and instance
+    # discovery, loading it saves those round trips on startup
+    if not path:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            http_cache = json.load(f, object_hook=_decode_response)
+            logger.debug("Authority metadata loaded from %s", path)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable authority metadata file %s: %s", path, e)
+        return {}
+    if not isinstance(http_cache, dict):
+        logger.warning("Ignoring unreadable authority metadata file %s", path)
+        return {}
+    return http_cache
+
+
+def _save_http_cache(path: str, http_cache: dict) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError as e:
+        logger.warning("Cannot save authority metadata to %s: %s", path, e)
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(http_cache, f, default=_encode_response)
+        os.replace(tmp_path, path)
+    except (TypeError, ValueError) as e:
+        os.unlink(tmp_path)
+        logger.warning("Cannot save authority metadata to %s: %s", path, e)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _encode_response(value: Any) -> dict:
+    # The cached values are the responses normalized by MSAL, the rest of
+    # the cache (its index of expiration times) is plain JSON already
+    if isinstance(value, NormalizedResponse):
+        return {
+            "__response__": True,
+            "status_code": value.status_code,
+            "text": value.text,
+            "headers": value.headers,
+        }
+    raise TypeError(f"Cannot save {type(value).__name__} in the authority metadata")
+
+
+def _decode_response(value: dict) -> Any:
+    if value.get("__response__") is not True:
+        return value
+    return NormalizedResponse(
+        SimpleNamespace(
+            status_code=value["status_code"],
+            text=value["text"],
+            headers=value["headers"],
+        )
+    )
@@ -0,0 +1,321 @@
+"""Incremental synchronization of calendars with Graph delta queries."""
+
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from requests import HTTPError
+
+from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.utils.pagination import iter_pages
+
+logger = logging.getLogger("ms_python_client")
+
+DELTA_LINK = "@odata.deltaLink"
+REMOVED = "@removed"
+# Returned when the delta token is no longer valid and a full sync is needed
+SYNC_STATE_GONE = 410
+
+ADDED = "added"
+UPDATED = "updated"
+DELETED = "removed"
+
+
+def format_utc(value: datetime) -> str:
+    """Format a date for a query string, naive dates are considered UTC
+
+    The query string is not encoded, so the ``+`` of an offset can't be used.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class EventChange(NamedTuple):
+    """A change of an event in a calendar
+
+    Args:
+        kind (str): ``added``, ``updated`` or ``removed``
+        event_id (str): The id of the event
+        event (dict): The event, only the id for removed events
+    """
+
+    kind: str
+    event_id: str
+    event: dict
+
+
+class DeltaStateStore(ABC):
+    """Where the delta links and the ids of the known events are kept
+
+    The ids are needed to tell added events from updated ones, Graph returns
+    both the same way.
+    """
+
+    @abstractmethod
+    def get_delta_link(self, mailbox: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def contains(self, mailbox: str, event_id: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_event_ids(self, mailbox: str) -> "set[str]":
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(
+        self,
+        mailbox: str,
+        delta_link: str,
+        added: Iterable[str],
+        removed: Iterable[str],
+    ) -> None:
+        """Store the new delta link along with the changes that led to it
+
+        Args:
+            mailbox (str): The user id or email of the calendar owner
+            delta_link (str): The link to request the next changes
+            added (list[str]): Ids of the events that are now known
+            removed (list[str]): Ids of the events that are gone
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self, mailbox: str) -> None:
+        """Forget the delta link of a mailbox, the next sync will be a full one"""
+        raise NotImplementedError
+
+
+class MemoryDeltaStateStore(DeltaStateStore):
+    """Keep the sync state in memory, it is lost when the process exits"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._delta_links: dict[str, str] = {}
+        self._event_ids: dict[str, set[str]] = {}
+
+    def get_delta_link(self, mailbox: str) -> Optional[str]:
+        return self._delta_links.get(mailbox)
+
+    def contains(self, mailbox: str, event_id: str) -> bool:
+        return event_id in self._event_ids.get(mailbox, set())
+
+    def get_event_ids(self, mailbox: str) -> "set[str]":
+        return set(self._event_ids.get(mailbox, set()))
+
+    def save(
+        self,
+        mailbox: str,
+        delta_link: str,
+        added: Iterable[str],
+        removed: Iterable[str],
+    ) -> None:
+        with self._lock:
+            event_ids = self._event_ids.setdefault(mailbox, set())
+            event_ids.update(added)
+            event_ids.difference_update(removed)
+            self._delta_links[mailbox] = delta_link
+
+    def reset(self, mailbox: str) -> None:
+        with self._lock:
+            self._delta_links.pop(mailbox, None)
+
+
+class SQLiteDeltaStateStore(DeltaStateStore):
+    """Keep the sync state in a SQLite database, so it survives restarts
+
+    Args:
+        path (str): The path of the database file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS delta_links "
+                "(mailbox TEXT PRIMARY KEY, delta_link TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS events "
+                "(mailbox TEXT NOT NULL, event_id TEXT NOT NULL, "
+                "PRIMARY KEY (mailbox, event_id))"
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get_delta_link(self, mailbox: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT delta_link FROM delta_links WHERE mailbox = ?", (mailbox,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def contains(self, mailbox: str, event_id: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM events WHERE mailbox = ? AND event_id = ?",
+                (mailbox, event_id),
+            ).fetchone()
+        return row is not None
+
+    def get_event_ids(self, mailbox: str) -> "set[str]":
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT event_id FROM events WHERE mailbox = ?", (mailbox,)
+            ).fetchall()
+        return set(row[0] for row in rows)
+
+    def save(
+        self,
+        mailbox: str,
+        delta_link: str,
+        added: Iterable[str],
+        removed: Iterable[str],
+    ) -> None:
+        # Everything is written in a single transaction, so a crash never
+        # leaves a delta link that does not match the known events
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO events (mailbox, event_id) VALUES (?, ?)",
+                ((mailbox, event_id) for event_id in added),
+            )
+            self._connection.executemany(
+                "DELETE FROM events WHERE mailbox = ? AND event_id = ?",
+                ((mailbox, event_id) for event_id in removed),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO delta_links (mailbox, delta_link) "
+                "VALUES (?, ?)",
+                (mailbox, delta_link),
+            )
+
+    def reset(self, mailbox: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM delta_links WHERE mailbox = ?", (mailbox,)
+            )
+
+
+class CalendarSync:
+    """Get the changes of calendars since the previous sync
+
+    The first sync of a mailbox lists all the events of the time window as
+    added. The following ones start from the stored delta link and only
+    return what changed, so their cost depends on the number of changes and
+    not on the size of the calendar.
+
+    The delta link is stored once all the changes of a sync have been
+    consumed. If the iteration is stopped before, the next sync returns the
+    same changes again.
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        store (DeltaStateStore): Where the sync state is kept
+        start (datetime): Start of the synchronized time window
+        end (datetime): End of the synchronized time window
+        page_size (int): Maximum number of changes per page
+    """
+
+    def __init__(
+        self,
+        client: MSClientInterface,
+        store: DeltaStateStore,
+        start: datetime,
+        end: datetime,
+        page_size: Optional[int] = None,
+    ) -> None:
+        self.client = client
+        self.store = store
+        self.start = start
+        self.end = end
+        self.page_size = page_size
+
+    def sync(self, user_id: str) -> Iterator[EventChange]:
+        """Yield the changes of the calendar of a user since the last sync
+
+        Args:
+            user_id (str): The user id
+
+        Yields:
+            EventChange: The added, updated and removed events
+        """
+        delta_link = self.store.get_delta_link(user_id)
+        if delta_link is None:
+            yield from self._sync(user_id, None)
+            return
+
+        try:
+            yield from self._sync(user_id, delta_link)
+        except HTTPError as e:
+            if e.response is None or e.response.status_code != SYNC_STATE_GONE:
+                raise
+            logger.warning("Delta token of %s expired, doing a full sync", user_id)
+            self.store.reset(user_id)
+            yield from self._sync(user_id, None)
+
+    def _sync(self, user_id: str, delta_link: Optional[str]) -> Iterator[EventChange]:
+        full_sync = delta_link is None
+        known = self.store.get_event_ids(user_id) if full_sync else set()
+        seen: set[str] = set()
+        removed: set[str] = set()
+
+        for page in self._iter_pages(user_id, delta_link):
+            for event in page.get("value", []):
+                change = self._to_change(user_id, event, known, full_sync)
+                if change.kind == DELETED:
+                    removed.add(change.event_id)
+                    seen.discard(change.event_id)
+                else:
+                    seen.add(change.event_id)
+                    removed.discard(change.event_id)
+                yield change
+
+            if DELTA_LINK in page:
+                delta_link = page[DELTA_LINK]
+
+        if full_sync:
+            # Events that were known but are not there anymore were removed
+            # while there was no valid delta link
+            for event_id in known - seen - removed:
+                removed.add(event_id)
+                yield EventChange(DELETED, event_id, {"id": event_id})
+
+        if delta_link is None:
+            raise ValueError(f"The delta query of {user_id} returned no delta link")
+        self.store.save(user_id, delta_link, seen, removed)
+
+    def _iter_pages(self, user_id: str, delta_link: Optional[str]) -> Iterator[dict]:
+        headers = {}
+        if self.page_size:
+            # Delta queries ignore $top
+            headers["Prefer"] = f"odata.maxpagesize={self.page_size}"
+
+        if delta_link:
+            return iter_pages(self.client, delta_link, None, headers)
+
+        parameters = {
+            "startDateTime": format_utc(self.start),
+            "endDateTime": format_utc(self.end),
+        }
+        api_path = f"/users/{user_id}/calendarView/delta"
+        return iter_pages(self.client, api_path, parameters, headers)
+
+    def _to_change(
+        self, user_id: str, event: dict, known: "set[str]", full_sync: bool
+    ) -> EventChange:
+        event_id = event["id"]
+        if REMOVED in event:
+            return EventChange(DELETED, event_id, event)
+        if full_sync:
+            is_known = event_id in known
+        else:
+            is_known = self.store.contains(user_id, event_id)
+        return EventChange(UPDATED if is_known else ADDED, event_id, event)
@@ -0,0 +1,344 @@
+"""In memory index of the events of mailboxes by time, for current event lookups."""
+
+import bisect
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.models.event import parse_graph_datetime
+from ms_python_client.services.calendar_sync import (
+    DELETED,
+    CalendarSync,
+    EventChange,
+    MemoryDeltaStateStore,
+)
+from ms_python_client.utils.bulk import DEFAULT_MAX_WORKERS, BulkResult, run_bulk
+
+logger = logging.getLogger("ms_python_client")
+
+DEFAULT_WINDOW = timedelta(days=7)
+DEFAULT_MAX_AGE = timedelta(minutes=5)
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def get_event_interval(event: dict) -> Optional["tuple[datetime, datetime]"]:
+    """Get the start and end of an event in UTC
+
+    Args:
+        event (dict): The event, with its ``start`` and ``end``
+
+    Returns:
+        tuple[datetime, datetime]: The start and end, None if the event has
+        no dates
+    """
+    start = parse_graph_datetime(event.get("start"))
+    end = parse_graph_datetime(event.get("end"))
+    if start is None or end is None:
+        return None
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+class _Interval(NamedTuple):
+    start: datetime
+    end: datetime
+    event_id: str
+
+
+class IntervalIndex:
+    """Events of a calendar sorted by start
+
+    Next to the events sorted by start, the latest end of the events up to
+    each position is kept. The events happening at a time all start before
+    it, so they are found by a binary search on the starts, followed by a
+    walk back that stops as soon as no earlier event ends after the time.
+    On calendars without overlapping events, such as rooms, a lookup is
+    therefore O(log n). Adding or removing an event is O(n).
+    """
+
+    def __init__(self) -> None:
+        self._intervals: list[_Interval] = []
+        self._starts: list[datetime] = []
+        self._max_ends: list[datetime] = []
+        self._events: dict[str, tuple[_Interval, dict]] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def set(self, event_id: str, start: datetime, end: datetime, event: dict) -> None:
+        """Add an event, or move it if it is already there
+
+        Args:
+            event_id (str): The event id
+            start (datetime): The start, aware
+            end (datetime): The end, aware
+            event (dict): The event returned by the lookups
+        """
+        self.remove(event_id)
+        interval = _Interval(start, end, event_id)
+        position = bisect.bisect_right(self._intervals, interval)
+        self._intervals.insert(position, interval)
+        self._starts.insert(position, start)
+        self._max_ends.insert(position, end)
+        self._events[event_id] = (interval, event)
+        self._update_max_ends(position)
+
+    def remove(self, event_id: str) -> None:
+        """Remove an event, if it is there
+
+        Args:
+            event_id (str): The event id
+        """
+        entry = self._events.pop(event_id, None)
+        if entry is None:
+            return
+        position = bisect.bisect_left(self._intervals, entry[0])
+        del self._intervals[position]
+        del self._starts[position]
+        del self._max_ends[position]
+        self._update_max_ends(position)
+
+    def clear(self) -> None:
+        self._intervals.clear()
+        self._starts.clear()
+        self._max_ends.clear()
+        self._events.clear()
+
+    def at(self, time: datetime) -> "list[dict]":
+        """Get the events happening at a time, the latest started first
+
+        Args:
+            time (datetime): The time, aware
+
+        Returns:
+            list[dict]: The events with ``start <= time < end``
+        """
+        return [self._events[interval.event_id][1] for interval in self._iter_at(time)]
+
+    def next_after(self, time: datetime) -> Optional[dict]:
+        """Get the first event starting after a time
+
+        Args:
+            time (datetime): The time, aware
+
+        Returns:
+            dict: The event, None if there is none
+        """
+        position = bisect.bisect_right(self._starts, time)
+        if position == len(self._intervals):
+            return None
+        return self._events[self._intervals[position].event_id][1]
+
+    def _iter_at(self, time: datetime) -> Iterator[_Interval]:
+        position = bisect.bisect_right(self._starts, time) - 1
+        while position >= 0 and self._max_ends[position] > time:
+            interval = self._intervals[position]
+            if interval.end > time:
+                yield interval
+            position -= 1
+
+    def _update_max_ends(self, position: int) -> None:
+        for index in range(position, len(self._intervals)):
+            end = self._intervals[index].end
+            if index > 0 and self._max_ends[index - 1] > end:
+                end = self._max_ends[index - 1]
+            if index > position and self._max_ends[index] == end:
+                # The following ones do not change either
+                break
+            self._max_ends[index] = end
+
+
+class EventIntervalIndex:
+    """Current and next events of mailboxes, answered from memory
+
+    The events of a window around the current time are loaded with a
+    calendar view delta query, and ``refresh`` only downloads what changed
+    since. When the current time gets past the middle of the window, the
+    window is moved and loaded again. The lookups never make requests.
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        window (timedelta): Length of the time window loaded
+        max_age (timedelta): How old the events of a mailbox can be before
+            ``refresh_due`` refreshes them
+        max_workers (int): Maximum number of concurrent refreshes
+        clock (Callable): Returns the current UTC time
+    """
+
+    def __init__(
+        self,
+        client: MSClientInterface,
+        window: timedelta = DEFAULT_WINDOW,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self.client = client
+        self.window = window
+        self.max_age = max_age
+        self.max_workers = max_workers
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._indexes: dict[str, IntervalIndex] = {}
+        self._refreshed: dict[str, datetime] = {}
+        self._window_start: Optional[datetime] = None
+        self._sync: Optional[CalendarSync] = None
+
+    def refresh(self, mailbox: str) -> int:
+        """Load the changes of the events of a mailbox
+
+        Args:
+            mailbox (str): The user id or email of the mailbox
+
+        Returns:
+            int: The number of changes applied
+        """
+        calendar_sync = self._get_sync()
+        with self._lock:
+            index = self._indexes.get(mailbox)
+        if index is None or calendar_sync.store.get_delta_link(mailbox) is None:
+            index = IntervalIndex()
+        else:
+            # Changes are applied to a copy, the lookups are never blocked
+            index = _copy(index)
+
+        changes = 0
+        for change in calendar_sync.sync(mailbox):
+            apply_change(index, change)
+            changes += 1
+        with self._lock:
+            self._indexes[mailbox] = index
+            self._refreshed[mailbox] = self.clock()
+        return changes
+
+    def refresh_due(self, mailboxes: Iterable[str]) -> "list[BulkResult]":
+        """Refresh the mailboxes not refreshed within ``max_age``
+
+        Args:
+            mailboxes (list[str]): The user ids or emails of the mailboxes
+
+        Returns:
+            list[BulkResult]: The number of changes or the error of every
+            refreshed mailbox
+        """
+        limit = self.clock() - self.max_age
+        with self._lock:
+            due = [
+                mailbox
+                for mailbox in mailboxes
+                if mailbox not in self._refreshed or self._refreshed[mailbox] <= limit
+            ]
+        results = list(
+            run_bulk(
+                self.refresh,
+                due,
+                key=lambda mailbox: mailbox,
+                max_workers=self.max_workers,
+            )
+        )
+        for result in results:
+            if not result.ok:
+                logger.error("Refresh of %s failed: %s", result.key, result.error)
+        return results
+
+    def get_current_events(
+        self, mailbox: str, now: Optional[datetime] = None
+    ) -> "list[dict]":
+        """Get the events of a mailbox happening now
+
+        Args:
+            mailbox (str): The user id or email of the mailbox
+            now (datetime): The time, the current one by default
+
+        Returns:
+            list[dict]: The events, the latest started first
+        """
+        return self._get_index(mailbox).at(now or self.clock())
+
+    def get_current_event(
+        self, mailbox: str, now: Optional[datetime] = None
+    ) -> Optional[dict]:
+        """Get the event of a mailbox happening now
+
+        Args:
+            mailbox (str): The user id or email of the mailbox
+            now (datetime): The time, the current one by default
+
+        Returns:
+            dict: The latest started event, None if there is none
+        """
+        events = self.get_current_events(mailbox, now)
+        return events[0] if events else None
+
+    def get_next_event(
+        self, mailbox: str, now: Optional[datetime] = None
+    ) -> Optional[dict]:
+        """Get the next event of a mailbox
+
+        Args:
+            mailbox (str): The user id or email of the mailbox
+            now (datetime): The time, the current one by default
+
+        Returns:
+            dict: The first event starting after ``now``, None if there is none
+        """
+        return self._get_index(mailbox).next_after(now or self.clock())
+
+    def _get_index(self, mailbox: str) -> IntervalIndex:
+        with self._lock:
+            index = self._indexes.get(mailbox)
+        if index is None:
+            raise KeyError(f"The events of {mailbox} were not loaded, refresh it first")
+        return index
+
+    def _get_sync(self) -> CalendarSync:
+        now = self.clock()
+        with self._lock:
+            if (
+                self._sync is None
+                or self._window_start is None
+                or now >= self._window_start + self.window / 2
+            ):
+                # Start a quarter of the window before, for the long events
+                self._window_start = now - self.window / 4
+                self._sync = CalendarSync(
+                    self.client,
+                    MemoryDeltaStateStore(),
+                    self._window_start,
+                    self._window_start + self.window,
+                )
+            return self._sync
+
+
+def apply_change(index: IntervalIndex, change: EventChange) -> None:
+    """Apply a change of a calendar sync to an index
+
+    Args:
+        index (IntervalIndex): The index
+        change (EventChange): The change
+    """
+    if change.kind == DELETED or change.event.get("isCancelled"):
+        index.remove(change.event_id)
+        return
+    interval = get_event_interval(change.event)
+    if interval is None:
+        index.remove(change.event_id)
+        return
+    index.set(change.event_id, *interval, change.event)
+
+
+def _copy(index: IntervalIndex) -> IntervalIndex:
+    # pylint: disable=protected-access
+    result = IntervalIndex()
+    result._intervals = list(index._intervals)
+    result._starts = list(index._starts)
+    result._max_ends = list(index._max_ends)
+    result._events = dict(index._events)
+    return result
@@ -0,0 +1,173 @@
+"""Receiver of the change notifications sent by Graph to the subscriptions."""
+
+import hmac
+import logging
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Mapping, NamedTuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from ms_python_client.utils import json_codec
+
+logger = logging.getLogger("ms_python_client")
+
+_Handler = Union[Callable[[dict], None], "queue.Queue[dict]"]
+
+
+class HandlerResponse(NamedTuple):
+    """What to answer to Graph
+
+    Args:
+        status (int): The status code
+        content_type (str): The content type of the body
+        body (bytes): The body
+    """
+
+    status: int
+    content_type: str = "text/plain"
+    body: bytes = b""
+
+
+class NotificationHandler:
+    """Check the requests of Graph and hand the notifications over
+
+    Requests with a ``validationToken`` are answered with the token, which
+    Graph requires to create a subscription. The notifications are handed to
+    ``handler`` one at a time, unless their ``clientState`` is not one of
+    ``client_states``: they are then dropped, since they do not come from
+    the subscriptions of the application.
+
+    Graph waits up to 3 seconds for the answer and sends the notifications
+    again after that, so a slow handler should rather be a queue consumed by
+    other threads.
+
+    It can be called from any web framework with the query string and the
+    body of the requests, or run in a ``NotificationReceiver``.
+
+    Args:
+        client_states (list[str]): The ``clientState`` of the subscriptions
+        handler (Callable or queue.Queue): Called with each notification, or
+            the queue where they are put
+    """
+
+    def __init__(self, client_states: Iterable[str], handler: _Handler) -> None:
+        self.client_states = [state.encode() for state in client_states]
+        self.handler = handler
+
+    def handle(self, query_string: str, body: bytes) -> HandlerResponse:
+        """Process a request sent to the notification URL
+
+        Args:
+            query_string (str): The query string of the request
+            body (bytes): The body of the request
+
+        Returns:
+            HandlerResponse: What to answer
+        """
+        tokens = parse_qs(query_string).get("validationToken")
+        if tokens:
+            # Echoed as plain text, so it can't be interpreted by a browser
+            return HandlerResponse(200, "text/plain", tokens[0].encode())
+
+        try:
+            notifications = json_codec.loads(body)["value"]
+        except (ValueError, KeyError, TypeError):
+            return HandlerResponse(400)
+
+        for notification in notifications:
+            if not isinstance(notification, dict) or not self.is_valid(notification):
+                logger.warning("Dropping a notification with a wrong clientState")
+                continue
+            self._dispatch(notification)
+        return HandlerResponse(202)
+
+    def is_valid(self, notification: Mapping) -> bool:
+        """Check the ``clientState`` of a notification, in constant time"""
+        state = str(notification.get("clientState") or "").encode()
+        return any(hmac.compare_digest(state, valid) for valid in self.client_states)
+
+    def _dispatch(self, notification: dict) -> None:
+        if isinstance(self.handler, queue.Queue):
+            self.handler.put(notification)
+            return
+        try:
+            self.handler(notification)
+        except Exception:  # pylint: disable=broad-except
+            # The other notifications of the request are still handed over
+            logger.exception("The notification handler failed")
+
+
+class NotificationReceiver:
+    """Small HTTP server receiving the notifications of Graph
+
+    Graph only sends the notifications to public HTTPS URLs, so the receiver
+    is usually behind a reverse proxy terminating TLS. Requests to other
+    paths than ``path`` are answered with a 404.
+
+    Args:
+        handler (NotificationHandler): Processes the requests
+        host (str): The address to listen on
+        port (int): The port to listen on, 0 for any free port
+        path (str): The path of the notification URL
+    """
+
+    def __init__(
+        self,
+        handler: NotificationHandler,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/notifications",
+    ) -> None:
+        self.handler = handler
+        self.path = path
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The local URL of the notifications"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host!s}:{port}{self.path}"
+
+    def start(self) -> "NotificationReceiver":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "NotificationReceiver":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _handler_class(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                if url.path != receiver.path:
+                    self._send(HandlerResponse(404))
+                else:
+                    self._send(receiver.handler.handle(url.query, body))
+
+            def _send(self, response: HandlerResponse) -> None:
+                self.send_response(response.status)
+                self.send_header("Content-Type", response.content_type)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            def log_message(self, format, *args):  # pylint: disable=W0622
+                logger.debug("Notification receiver: " + format, *args)
+
+        return Handler
@@ -1,14 +1,13 @@
 """Process Oauth2 authentication flow."""
 
-import atexit
 import json
 import logging
-import os
 import sys
 
-import msal
-
 from ms_python_client.config import Config
+from ms_python_client.services.app_registry import get_application
+from ms_python_client.services.token_cache import FileTokenCache
+from ms_python_client.utils.single_flight import SingleFlight
 
 logger = logging.getLogger("ms_python_client")
 
@@ -19,38 +18,77 @@ class Oauth2Flow:
     def __init__(self, conf: Config) -> None:
         """Initialize the Oauth2 Flow."""
         self.conf = conf
-        self.cache = msal.SerializableTokenCache()
-
-        if os.path.exists(self.conf.TOKEN_CACHE_FILE):
-            with open(self.conf.TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
-                self.cache.deserialize(f.read())
-                logger.debug("Token cache loaded")
+        self.app = get_application(self.conf)
+        self.cache: FileTokenCache = self.app.token_cache
+        self._single_flight = SingleFlight()
 
-        atexit.register(
-            lambda: self._save_cache() if self.cache.has_state_changed else None
-        )
+    def get_access_token(self) -> "tuple[str, str]":
+        """Get access token.
 
-        self.app = msal.PublicClientApplication(
-            self.conf.AZURE_CLIENT_ID,
-            authority=self.conf.AZURE_AUTHORITY,
-            token_cache=self.cache,
-        )
+        Raises:
+            ValueError: Error on doing the Device Flow
+            ValueError: Error on getting the access token
 
-    def _save_cache(self):
-        with open(self.conf.TOKEN_CACHE_FILE, "w", encoding="utf-8") as f:
-            f.write(self.cache.serialize())
-            logger.debug("Token cache saved")
+        Returns:
+            tuple[str, str]: Access token and username (the client id when
+            using app-only authentication)
+        """
+        result, username = self._acquire_token()
+        return result["access_token"], username
 
-    def get_access_token(self) -> "tuple[str, str]":
-        """Get access token.
+    def get_access_token_with_expiry(self) -> "tuple[str, int]":
+        """Get access token and its remaining lifetime.
 
         Raises:
             ValueError: Error on doing the Device Flow
             ValueError: Error on getting the access token
 
         Returns:
-            tuple[str, str]: Access token and username
+            tuple[str, int]: Access token and seconds until it expires
         """
+        result, _ = self._acquire_token()
+        return result["access_token"], int(result.get("expires_in", 0))
+
+    def _acquire_token(self) -> "tuple[dict, str]":
+        # Threads arriving while a token is being acquired wait for it and
+        # reuse it instead of sending their own identical request to AAD
+        return self._single_flight.do("access_token", self._acquire_token_locked)
+
+    def _acquire_token_locked(self) -> "tuple[dict, str]":
+        # Holding the cache file lock means that when several processes need
+        # a new token only the first one refreshes it, the others reload the
+        # cache it wrote and find the token there
+        with self.cache.locked():
+            return self._acquire_token_from_aad()
+
+    def _acquire_token_from_aad(self) -> "tuple[dict, str]":
+        if self.conf.app_only:
+            return self._acquire_app_token()
+        return self._acquire_user_token()
+
+    def _acquire_app_token(self) -> "tuple[dict, str]":
+        # Client credentials never involve a user, so this never blocks on a
+        # sign in. Look in the cache first, older MSAL versions do not do it
+        result = self.app.acquire_token_silent(
+            scopes=self.conf.AZURE_SCOPE, account=None
+        )
+
+        if not result:
+            logger.info("No suitable app token exists in cache. Getting one from AAD.")
+            result = self.app.acquire_token_for_client(scopes=self.conf.AZURE_SCOPE)
+
+        if "access_token" in result:
+            logger.debug("App token aquired for: %s", self.conf.AZURE_CLIENT_ID)
+            return result, self.conf.AZURE_CLIENT_ID
+
+        raise ValueError(
+            "Error getting access_token",
+            result.get("error"),
+            result.get("error_description"),
+            result.get("correlation_id"),
+        )
+
+    def _acquire_user_token(self) -> "tuple[dict, str]":
         result = None
         # Try to reload token from the cache
         accounts = self.app.get_accounts()
@@ -99,7 +137,7 @@ class Oauth2Flow:
             if "scope" in result:
                 logger.debug(f"Scopes: {result['scope']}")
 
-            return result["access_token"], accounts[0]["username"]
+            return result, accounts[0]["username"]
 
         raise ValueError(
             "Error getting access_token",
@@ -0,0 +1,293 @@
+"""Subscriptions to the changes of the events of many mailboxes."""
+
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, Optional
+
+from requests import HTTPError
+
+from ms_python_client.components.subscriptions.subscriptions_component import (
+    SubscriptionsComponent,
+)
+from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.services.calendar_sync import format_utc
+from ms_python_client.utils.bulk import DEFAULT_MAX_WORKERS, BulkResult, run_bulk
+from ms_python_client.utils.error import is_not_found_error
+
+logger = logging.getLogger("ms_python_client")
+
+DEFAULT_CHANGE_TYPE = "created,updated,deleted"
+# Graph accepts up to 7 days for the events, renewing well before keeps a
+# margin for the processes that are down for a while
+DEFAULT_LIFETIME = timedelta(days=3)
+DEFAULT_RENEW_BEFORE = timedelta(hours=12)
+
+REAUTHORIZATION_REQUIRED = "reauthorizationRequired"
+SUBSCRIPTION_REMOVED = "subscriptionRemoved"
+MISSED = "missed"
+
+_EVENTS_RESOURCE = re.compile(r"^/?users/([^/]+)/events$", re.IGNORECASE)
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def parse_expiration(value: str) -> datetime:
+    """Parse the ``expirationDateTime`` of a subscription"""
+    # Graph sends 7 digits of fractions of seconds, Python reads up to 6
+    date, _, fraction = value.rstrip("Z").partition(".")
+    return datetime.fromisoformat(date).replace(
+        microsecond=int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        tzinfo=timezone.utc,
+    )
+
+
+def events_resource(mailbox: str) -> str:
+    return f"/users/{mailbox}/events"
+
+
+class Subscription(NamedTuple):
+    """A subscription to the events of a mailbox
+
+    Args:
+        id (str): The subscription id
+        mailbox (str): The user id or email of the mailbox
+        expiration (datetime): When Graph deletes the subscription
+    """
+
+    id: str
+    mailbox: str
+    expiration: datetime
+
+
+class SubscriptionManager:
+    """Keep a subscription to the events of every mailbox, instead of polling them
+
+    Call ``subscribe`` with the mailboxes, then ``renew_due`` periodically
+    (e.g. every hour) to renew the subscriptions before they expire. The
+    requests to many mailboxes are sent concurrently. The notifications are
+    received by a ``NotificationReceiver`` listening at ``notification_url``.
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        notification_url (str): The public HTTPS URL of the receiver
+        client_state (str): Secret sent back with every notification, to
+            check that it comes from Graph
+        lifecycle_notification_url (str): Optional URL of the receiver of
+            the lifecycle notifications, see ``handle_lifecycle_notification``
+        change_type (str): The changes notified
+        lifetime (timedelta): How long the subscriptions are valid
+        renew_before (timedelta): How long before their expiration they are
+            renewed
+        max_workers (int): Maximum number of concurrent requests
+        clock (Callable): Returns the current UTC time
+    """
+
+    def __init__(
+        self,
+        client: MSClientInterface,
+        notification_url: str,
+        client_state: str,
+        lifecycle_notification_url: Optional[str] = None,
+        change_type: str = DEFAULT_CHANGE_TYPE,
+        lifetime: timedelta = DEFAULT_LIFETIME,
+        renew_before: timedelta = DEFAULT_RENEW_BEFORE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self.subscriptions_component = SubscriptionsComponent(client)
+        self.notification_url = notification_url
+        self.client_state = client_state
+        self.lifecycle_notification_url = lifecycle_notification_url
+        self.change_type = change_type
+        self.lifetime = lifetime
+        self.renew_before = renew_before
+        self.max_workers = max_workers
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, Subscription] = {}
+
+    @property
+    def subscriptions(self) -> "dict[str, Subscription]":
+        """The subscriptions, by mailbox"""
+        with self._lock:
+            return dict(self._subscriptions)
+
+    def get_mailbox(self, subscription_id: str) -> Optional[str]:
+        """Get the mailbox of a subscription, to route its notifications
+
+        Args:
+            subscription_id (str): The ``subscriptionId`` of a notification
+
+        Returns:
+            str: The mailbox, None for an unknown subscription
+        """
+        with self._lock:
+            for subscription in self._subscriptions.values():
+                if subscription.id == subscription_id:
+                    return subscription.mailbox
+        return None
+
+    def load(self) -> int:
+        """Reuse the subscriptions made to the same URL by a previous process
+
+        Returns:
+            int: The number of subscriptions found
+        """
+        found = 0
+        for item in self.subscriptions_component.iter_subscriptions():
+            match = _EVENTS_RESOURCE.match(item.get("resource", ""))
+            if item.get("notificationUrl") != self.notification_url or not match:
+                continue
+            self._set(
+                Subscription(
+                    item["id"],
+                    match.group(1),
+                    parse_expiration(item["expirationDateTime"]),
+                )
+            )
+            found += 1
+        return found
+
+    def subscribe(self, mailboxes: Iterable[str]) -> "list[BulkResult]":
+        """Subscribe to the events of the mailboxes that have no subscription
+
+        Args:
+            mailboxes (list[str]): The user ids or emails of the mailboxes
+
+        Returns:
+            list[BulkResult]: The subscription or the error of every mailbox
+            that was not subscribed yet
+        """
+        known = self.subscriptions
+        missing = [mailbox for mailbox in mailboxes if mailbox not in known]
+        return self._run(self._create, missing)
+
+    def renew_due(self) -> "list[BulkResult]":
+        """Renew the subscriptions expiring within ``renew_before``
+
+        A subscription that Graph does not know anymore is created again.
+
+        Returns:
+            list[BulkResult]: The subscription or the error of every mailbox
+            that was renewed
+        """
+        limit = self.clock() + self.renew_before
+        due = [
+            subscription.mailbox
+            for subscription in self.subscriptions.values()
+            if subscription.expiration <= limit
+        ]
+        return self._run(self._renew, due)
+
+    def unsubscribe(self, mailboxes: Iterable[str]) -> "list[BulkResult]":
+        """Delete the subscriptions of mailboxes
+
+        Args:
+            mailboxes (list[str]): The user ids or emails of the mailboxes
+
+        Returns:
+            list[BulkResult]: The outcome for every subscribed mailbox
+        """
+        known = self.subscriptions
+        return self._run(
+            self._delete, [mailbox for mailbox in mailboxes if mailbox in known]
+        )
+
+    def unsubscribe_all(self) -> "list[BulkResult]":
+        return self.unsubscribe(self.subscriptions)
+
+    def handle_lifecycle_notification(self, notification: Mapping) -> None:
+        """React to a lifecycle notification of Graph
+
+        The subscription is renewed when Graph asks for a reauthorization,
+        and created again when Graph removed it. Missed notifications are
+        only logged: the calendar should be synchronized again, e.g. with
+        ``CalendarSync``.
+
+        Args:
+            notification (dict): The notification
+        """
+        event = notification.get("lifecycleEvent")
+        mailbox = self.get_mailbox(notification.get("subscriptionId", ""))
+        if mailbox is None:
+            logger.warning("Lifecycle notification of an unknown subscription")
+            return
+        if event == REAUTHORIZATION_REQUIRED:
+            self._renew(mailbox)
+        elif event == SUBSCRIPTION_REMOVED:
+            with self._lock:
+                self._subscriptions.pop(mailbox, None)
+            self._create(mailbox)
+        elif event == MISSED:
+            logger.warning("Notifications of %s were missed", mailbox)
+
+    def _run(
+        self, func: Callable[[str], Any], mailboxes: "list[str]"
+    ) -> "list[BulkResult]":
+        results = list(
+            run_bulk(
+                func,
+                mailboxes,
+                key=lambda mailbox: mailbox,
+                max_workers=self.max_workers,
+            )
+        )
+        for result in results:
+            if not result.ok:
+                logger.error("Subscription of %s failed: %s", result.key, result.error)
+        return results
+
+    def _set(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            self._subscriptions[subscription.mailbox] = subscription
+        return subscription
+
+    def _create(self, mailbox: str) -> Subscription:
+        json = {
+            "changeType": self.change_type,
+            "notificationUrl": self.notification_url,
+            "resource": events_resource(mailbox),
+            "expirationDateTime": format_utc(self.clock() + self.lifetime),
+            "clientState": self.client_state,
+        }
+        if self.lifecycle_notification_url:
+            json["lifecycleNotificationUrl"] = self.lifecycle_notification_url
+        response = self.subscriptions_component.create_subscription(json)
+        return self._set(
+            Subscription(
+                response["id"],
+                mailbox,
+                parse_expiration(response["expirationDateTime"]),
+            )
+        )
+
+    def _renew(self, mailbox: str) -> Subscription:
+        subscription = self.subscriptions[mailbox]
+        try:
+            response = self.subscriptions_component.renew_subscription(
+                subscription.id, self.clock() + self.lifetime
+            )
+        except HTTPError as e:
+            if not is_not_found_error(e):
+                raise
+            logger.warning("Subscription of %s expired, creating it again", mailbox)
+            return self._create(mailbox)
+        return self._set(
+            subscription._replace(
+                expiration=parse_expiration(response["expirationDateTime"])
+            )
+        )
+
+    def _delete(self, mailbox: str) -> None:
+        subscription = self.subscriptions[mailbox]
+        try:
+            self.subscriptions_component.delete_subscription(subscription.id)
+        except HTTPError as e:
+            if not is_not_found_error(e):
+                raise
+        with self._lock:
+            self._subscriptions.pop(mailbox, None)
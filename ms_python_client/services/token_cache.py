@@ -0,0 +1,92 @@
+"""Token cache shared by all the processes using the same cache file."""
+
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import msal
+
+from ms_python_client.utils.file_lock import file_lock
+
+logger = logging.getLogger("ms_python_client")
+
+
+class FileTokenCache(msal.SerializableTokenCache):
+    """MSAL token cache persisted to a file shared between processes
+
+    Every access to AAD should happen inside ``locked()``: the file is
+    reloaded if another process changed it, and any change is written back
+    before the lock is released. The file is always replaced atomically, so
+    readers never see a partially written cache.
+
+    Args:
+        path (str): The path of the cache file
+    """
+
+    has_state_changed: bool
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._signature: Optional[tuple] = None
+        self.reload_if_changed()
+
+    @contextmanager
+    def locked(self) -> Iterator["FileTokenCache"]:
+        """Lock the cache file, reload it and write it back on exit"""
+        with file_lock(self.lock_path):
+            self.reload_if_changed()
+            try:
+                yield self
+            finally:
+                self._write_if_changed()
+
+    def persist(self) -> None:
+        """Write the cache to the file if it has changed since the last write"""
+        if self.has_state_changed:
+            with file_lock(self.lock_path):
+                self._write_if_changed()
+
+    def reload_if_changed(self) -> bool:
+        """Reload the cache if the file was modified since it was last read
+
+        Returns:
+            bool: Whether the cache was reloaded
+        """
+        signature = self._get_signature()
+        if signature is None or signature == self._signature:
+            return False
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.deserialize(f.read())
+        self._signature = signature
+        logger.debug("Token cache loaded")
+        return True
+
+    def _write_if_changed(self) -> None:
+        if not self.has_state_changed:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.serialize())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self.has_state_changed = False
+        self._signature = self._get_signature()
+        logger.debug("Token cache saved")
+
+    def _get_signature(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,107 @@
+"""Keep the current access token in memory and refresh it before it expires."""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger("ms_python_client")
+
+# A token is considered expired this many seconds before its real expiry, so
+# it is never sent while it is about to be rejected by the API.
+EXPIRY_SKEW = 30
+
+
+class AccessTokenHolder:
+    """Hold a bearer token and refresh it on a background timer.
+
+    Args:
+        fetch_token (Callable): Returns a tuple with the access token and its
+            lifetime in seconds (``expires_in``)
+        refresh_margin (int): Seconds before expiry at which the background
+            refresh is triggered
+        retry_interval (int): Seconds to wait before retrying a failed
+            background refresh
+    """
+
+    def __init__(
+        self,
+        fetch_token: Callable[[], "tuple[str, int]"],
+        refresh_margin: int = 300,
+        retry_interval: int = 30,
+    ) -> None:
+        self.fetch_token = fetch_token
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self._lock = threading.Lock()
+        # (token, monotonic expiry) is swapped as a whole so readers never
+        # see a token paired with the expiry of another one
+        self._state: "tuple[Optional[str], float]" = (None, 0.0)
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def get_token(self) -> str:
+        """Get a valid access token
+
+        Returns:
+            str: The cached token, or a freshly acquired one if the cached
+            token is missing or expired
+        """
+        token = self.peek_token()
+        if token:
+            return token
+
+        with self._lock:
+            return self.peek_token() or self._refresh()
+
+    def peek_token(self) -> Optional[str]:
+        """Get the cached token without ever blocking
+
+        Returns:
+            Optional[str]: The cached token, or None if it is missing or expired
+        """
+        token, expires_at = self._state
+        if token and time.monotonic() < expires_at:
+            return token
+        return None
+
+    def close(self) -> None:
+        """Stop the background refresh"""
+        with self._lock:
+            self._closed = True
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+    def _refresh(self) -> str:
+        token, expires_in = self.fetch_token()
+        self._state = (token, time.monotonic() + expires_in - EXPIRY_SKEW)
+        logger.debug("Access token refreshed, expires in %ss", expires_in)
+
+        if expires_in > 2 * self.refresh_margin:
+            self._schedule(expires_in - self.refresh_margin)
+        else:
+            self._schedule(max(expires_in / 2, 1))
+        return token
+
+    def _schedule(self, delay: float) -> None:
+        if self._closed:
+            return
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._refresh()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Background token refresh failed. Retrying in %ss",
+                    self.retry_interval,
+                )
+                self._schedule(self.retry_interval)
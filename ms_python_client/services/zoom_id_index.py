@@ -0,0 +1,147 @@
+"""Local index of the events created for Zoom meetings."""
+
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Mapping, Optional
+
+from ms_python_client.utils.event_generator import ZOOM_ID_EXTENDED_PROPERTY_ID
+
+REMOVED = "@removed"
+
+
+def find_zoom_id(event: Mapping[str, Any]) -> Optional[str]:
+    """Get the zoom id of an event, if it was expanded in the response
+
+    Args:
+        event (Mapping[str, Any]): The event
+
+    Returns:
+        str: The zoom id, or None if the event has none
+    """
+    for extended_property in event.get("singleValueExtendedProperties", []):
+        if extended_property.get("id") == ZOOM_ID_EXTENDED_PROPERTY_ID:
+            return extended_property.get("value")
+    return None
+
+
+class ZoomIdIndex(ABC):
+    """Map the (user id, zoom id) of an event to its event id
+
+    It saves the ``$filter`` query over the extended properties that is
+    otherwise needed to find an event from its zoom id.
+    """
+
+    @abstractmethod
+    def get(self, user_id: str, zoom_id: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, user_id: str, zoom_id: str, event_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, user_id: str, zoom_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard_event(self, user_id: str, event_id: str) -> None:
+        raise NotImplementedError
+
+    def update_from_events(self, user_id: str, events: Iterable[dict]) -> None:
+        """Keep the index current with the events of a list or delta response
+
+        Removed events are dropped, the ones with a zoom id are added.
+
+        Args:
+            user_id (str): The user id
+            events (list[dict]): The events
+        """
+        for event in events:
+            if REMOVED in event:
+                self.discard_event(user_id, event["id"])
+                continue
+            zoom_id = find_zoom_id(event)
+            if zoom_id and "id" in event:
+                self.set(user_id, zoom_id, event["id"])
+
+
+class MemoryZoomIdIndex(ZoomIdIndex):
+    """Keep the index in memory, it is lost when the process exits"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._event_ids: dict[tuple[str, str], str] = {}
+
+    def get(self, user_id: str, zoom_id: str) -> Optional[str]:
+        return self._event_ids.get((user_id, zoom_id))
+
+    def set(self, user_id: str, zoom_id: str, event_id: str) -> None:
+        with self._lock:
+            self._event_ids[(user_id, zoom_id)] = event_id
+
+    def discard(self, user_id: str, zoom_id: str) -> None:
+        with self._lock:
+            self._event_ids.pop((user_id, zoom_id), None)
+
+    def discard_event(self, user_id: str, event_id: str) -> None:
+        with self._lock:
+            for key, value in list(self._event_ids.items()):
+                if key[0] == user_id and value == event_id:
+                    del self._event_ids[key]
+
+
+class SQLiteZoomIdIndex(ZoomIdIndex):
+    """Keep the index in a SQLite database, so it survives restarts
+
+    Args:
+        path (str): The path of the database file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS zoom_ids "
+                "(user_id TEXT NOT NULL, zoom_id TEXT NOT NULL, "
+                "event_id TEXT NOT NULL, PRIMARY KEY (user_id, zoom_id))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS zoom_ids_event_id "
+                "ON zoom_ids (user_id, event_id)"
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get(self, user_id: str, zoom_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT event_id FROM zoom_ids WHERE user_id = ? AND zoom_id = ?",
+                (user_id, zoom_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, user_id: str, zoom_id: str, event_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO zoom_ids (user_id, zoom_id, event_id) "
+                "VALUES (?, ?, ?)",
+                (user_id, zoom_id, event_id),
+            )
+
+    def discard(self, user_id: str, zoom_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM zoom_ids WHERE user_id = ? AND zoom_id = ?",
+                (user_id, zoom_id),
+            )
+
+    def discard_event(self, user_id: str, event_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM zoom_ids WHERE user_id = ? AND event_id = ?",
+                (user_id, event_id),
+            )
@@ -0,0 +1,93 @@
+"""Run many requests concurrently on a bounded thread pool."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+from requests.adapters import DEFAULT_POOLSIZE
+
+from ms_python_client.utils.concurrency_limiter import MAX_CONCURRENT_REQUESTS
+
+# For the requests spread over many mailboxes: same as the connection pool
+# of a requests session, more threads would only wait for a free connection
+DEFAULT_MAX_WORKERS = DEFAULT_POOLSIZE
+# For the requests of a single mailbox: its concurrency window is at most
+# this large, more threads would only wait for a slot of the window
+MAILBOX_MAX_WORKERS = MAX_CONCURRENT_REQUESTS
+
+_DONE = object()
+
+
+class BulkResult(NamedTuple):
+    """The outcome of one item of a bulk operation
+
+    Args:
+        key (Any): What identifies the item, usually its zoom id
+        result (Any): The value returned for the item, None if it failed
+        error (Exception): The error raised for the item, None if it succeeded
+    """
+
+    key: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_bulk(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    key: Callable[[Any], Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    stop_on_error: bool = False,
+) -> Iterator[BulkResult]:
+    """Call ``func`` on every item from a thread pool
+
+    Results are yielded as soon as they are ready, not in the order of the
+    items. Items are read lazily: only ``max_workers`` of them are in
+    flight at any time, so ``items`` can be a generator.
+
+    When ``stop_on_error`` is set, no new item is started after the first
+    error. The items that were already running are still yielded.
+
+    Args:
+        func (Callable): Called with each item
+        items (Iterable): The items
+        key (Callable): Gives the key of the result of an item
+        max_workers (int): Maximum number of concurrent calls
+        stop_on_error (bool): Stop at the first error
+
+    Yields:
+        BulkResult: The result or the error of every item
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    def call(item: Any) -> BulkResult:
+        try:
+            return BulkResult(key(item), func(item))
+        except Exception as e:  # pylint: disable=broad-except
+            return BulkResult(key(item), error=e)
+
+    iterator = iter(items)
+    stopped = False
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: "set[Future]" = set()
+        while True:
+            while not stopped and len(running) < max_workers:
+                item = next(iterator, _DONE)
+                if item is _DONE:
+                    stopped = True
+                    break
+                running.add(executor.submit(call, item))
+
+            if not running:
+                return
+
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not result.ok and stop_on_error:
+                    stopped = True
+                yield result
@@ -0,0 +1,173 @@
+"""Limit the concurrent requests made for each mailbox."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from ms_python_client.utils.mailbox import get_mailbox
+
+# Outlook accepts 4 concurrent requests per app and mailbox
+MAX_CONCURRENT_REQUESTS = 4
+THROTTLED_STATUS_CODE = 429
+
+
+class Slot:
+    """A request running inside the window of a limiter
+
+    Set ``status_code`` to the status of the response before the slot is
+    released, so the limiter can adapt its window.
+    """
+
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.status_code: Optional[int] = None
+
+
+class AdaptiveLimiter:
+    """Concurrency window growing additively and shrinking multiplicatively
+
+    The window grows by about one slot every time a full window of requests
+    succeeds, and is halved when a request is throttled. Requests over the
+    window wait for a slot to be free.
+
+    By default the window starts at its maximum, the limit of Outlook, since
+    going over it only gets requests throttled. The window then only shrinks
+    when requests are throttled, and the additive increase brings it back
+    to the maximum. Start below ``max_limit`` to probe upwards instead.
+
+    Args:
+        initial_limit (int): The window before any response
+        min_limit (int): The window is never smaller
+        max_limit (int): The window is never larger
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = MAX_CONCURRENT_REQUESTS,
+        min_limit: int = 1,
+        max_limit: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = float(initial_limit)
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self.window)
+
+    def acquire(self) -> Slot:
+        """Wait for a free slot in the window and take it
+
+        Returns:
+            Slot: The slot, to give back to ``release``
+        """
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+            return Slot(time.monotonic())
+
+    def release(self, slot: Slot) -> None:
+        """Give back a slot and adapt the window to the response
+
+        Args:
+            slot (Slot): The slot returned by ``acquire``
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if slot.status_code == THROTTLED_STATUS_CODE:
+                # The requests that were already running when the window
+                # was halved don't halve it again
+                if slot.started >= self._last_decrease:
+                    self.window = max(self.window / 2, self.min_limit)
+                    self._last_decrease = time.monotonic()
+            elif slot.status_code is not None:
+                self.window = min(self.window + 1 / self.window, self.max_limit)
+            self._condition.notify_all()
+
+
+class MailboxConcurrencyLimiter:
+    """One ``AdaptiveLimiter`` per mailbox, found in the path of the requests
+
+    Requests that are not made for a single mailbox are not limited. With
+    the default limits, the window of a mailbox starts at the limit of
+    Outlook and only shrinks and recovers.
+
+    Args:
+        initial_limit (int): The window of a mailbox before any response
+        min_limit (int): The window of a mailbox is never smaller
+        max_limit (int): The window of a mailbox is never larger
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = MAX_CONCURRENT_REQUESTS,
+        min_limit: int = 1,
+        max_limit: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._lock = threading.Lock()
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+        self._users: dict[str, int] = {}
+        # Fail now rather than on the first request
+        AdaptiveLimiter(initial_limit, min_limit, max_limit)
+
+    def get_limit(self, mailbox: str) -> int:
+        """Get the current window of a mailbox
+
+        Args:
+            mailbox (str): The user id or email
+
+        Returns:
+            int: The maximum number of concurrent requests for the mailbox
+        """
+        with self._lock:
+            limiter = self._limiters.get(mailbox.lower())
+        return limiter.limit if limiter else self.initial_limit
+
+    @contextmanager
+    def slot(self, api_path: str) -> Iterator[Optional[Slot]]:
+        """Run a request inside the window of its mailbox
+
+        Args:
+            api_path (str): The URL path, or the full URL, of the request
+
+        Yields:
+            Slot: The slot of the request, None if it is not limited
+        """
+        mailbox = get_mailbox(api_path)
+        if mailbox is None:
+            yield None
+            return
+
+        with self._lock:
+            limiter = self._limiters.get(mailbox)
+            if limiter is None:
+                limiter = AdaptiveLimiter(
+                    self.initial_limit, self.min_limit, self.max_limit
+                )
+                self._limiters[mailbox] = limiter
+            # Counted before waiting, so the limiter is not dropped meanwhile
+            self._users[mailbox] = self._users.get(mailbox, 0) + 1
+
+        try:
+            slot = limiter.acquire()
+            try:
+                yield slot
+            finally:
+                limiter.release(slot)
+        finally:
+            with self._lock:
+                self._users[mailbox] -= 1
+                # Limiters back to their full window hold no state
+                if self._users[mailbox] == 0 and limiter.window >= self.max_limit:
+                    del self._users[mailbox]
+                    del self._limiters[mailbox]
@@ -14,3 +14,19 @@ def generate_error_log(error: HTTPError) -> dict:
         "response": response,
     }
     return output
+
+
+def is_not_found_error(error: HTTPError) -> bool:
+    return error.response is not None and error.response.status_code == 404
+
+
+def is_precondition_failed_error(error: HTTPError) -> bool:
+    return error.response is not None and error.response.status_code == 412
+
+
+class ConflictError(Exception):
+    """Exception raised when an ``If-Match`` update finds a newer version
+
+    Args:
+        Exception (Exception): The base exception
+    """
@@ -0,0 +1,140 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Mapping, NamedTuple, Optional
+
+from requests import Response
+
+from ms_python_client.utils.json_codec import decode_response, loads
+
+DEFAULT_ETAG_CACHE_SIZE = 1000
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    content: bytes
+
+
+def build_variant_key(
+    parameters: Mapping[str, str], headers: Optional[Mapping[str, str]]
+) -> Hashable:
+    """Key of the representation of a resource asked by a request
+
+    The ``$select`` and the ``Prefer`` header (e.g. the timezone of the
+    dates) change what Graph sends for the same etag.
+    """
+    prefer = next(
+        (value for name, value in (headers or {}).items() if name.lower() == "prefer"),
+        None,
+    )
+    return tuple(sorted(parameters.items())), prefer
+
+
+def get_etag(response: Response, item: Mapping) -> Optional[str]:
+    """Get the etag of an item, from its body or from the headers"""
+    return item.get("@odata.etag") or response.headers.get("ETag")
+
+
+class ETagCache:
+    """Last responses of the resources, with their etags, to send conditional GETs
+
+    Up to ``max_size`` resources are kept, the least recently used ones are
+    dropped first. The bodies are kept encoded, so each 304 gives a new copy
+    the caller can modify.
+
+    Args:
+        max_size (int): Number of resources kept
+    """
+
+    def __init__(self, max_size: int = DEFAULT_ETAG_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._resources: "OrderedDict[str, dict[Hashable, CachedResponse]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def get(self, api_path: str, variant: Hashable) -> Optional[CachedResponse]:
+        """Get the last response of a resource
+
+        Args:
+            api_path (str): The path of the resource
+            variant (Hashable): The key of the representation, from
+                ``build_variant_key``
+
+        Returns:
+            CachedResponse: The etag and body, None if they are not cached
+        """
+        with self._lock:
+            variants = self._resources.get(api_path)
+            if variants is None:
+                return None
+            self._resources.move_to_end(api_path)
+            return variants.get(variant)
+
+    def put(self, api_path: str, variant: Hashable, cached: CachedResponse) -> None:
+        """Store the last response of a resource
+
+        Args:
+            api_path (str): The path of the resource
+            variant (Hashable): The key of the representation
+            cached (CachedResponse): The etag and body
+        """
+        with self._lock:
+            variants = self._resources.setdefault(api_path, {})
+            self._resources.move_to_end(api_path)
+            variants[variant] = cached
+            while len(self._resources) > self.max_size:
+                self._resources.popitem(last=False)
+
+    def discard(self, api_path: str) -> None:
+        """Forget a resource, after it was updated or deleted
+
+        Args:
+            api_path (str): The path of the resource
+        """
+        with self._lock:
+            self._resources.pop(api_path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._resources.clear()
+
+
+def with_if_none_match(
+    headers: Optional[Mapping[str, str]], cached: Optional[CachedResponse]
+) -> dict:
+    """Add the ``If-None-Match`` of a cached response to the headers"""
+    result = dict(headers or {})
+    if cached is not None:
+        result["If-None-Match"] = cached.etag
+    return result
+
+
+def decode_conditional_response(
+    cache: ETagCache,
+    api_path: str,
+    variant: Hashable,
+    cached: Optional[CachedResponse],
+    response: Response,
+) -> dict:
+    """Decode the response of a conditional GET, updating the cache
+
+    Args:
+        cache (ETagCache): The cache
+        api_path (str): The path of the resource
+        variant (Hashable): The key of the representation
+        cached (CachedResponse): The response the request was conditioned on
+        response (Response): The response
+
+    Returns:
+        dict: The item, decoded from the cache on a 304
+    """
+    if response.status_code == 304 and cached is not None:
+        return loads(cached.content)
+    item = decode_response(response)
+    etag = get_etag(response, item)
+    if etag:
+        cache.put(api_path, variant, CachedResponse(etag, response.content))
+    return item
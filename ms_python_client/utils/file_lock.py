@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows: locking is skipped, only one process should use a given file
+    fcntl = None  # type: ignore
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False) -> Iterator[IO[bytes]]:
+    """Hold an advisory lock on a file, shared between processes
+
+    The lock is tied to the file opened here, so it also serializes threads of
+    the same process. It is not reentrant: do not take it again while held.
+
+    Args:
+        path (str): The path of the lock file, created if missing
+        shared (bool): Take a shared (read) lock instead of an exclusive one
+
+    Yields:
+        IO[bytes]: The opened lock file
+    """
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield f
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
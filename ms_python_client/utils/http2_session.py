@@ -0,0 +1,85 @@
+"""Transport sending the requests over HTTP/2 with httpx."""
+
+from typing import Any, Mapping, Optional
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import Response
+from requests import Timeout as RequestsTimeout
+
+from ms_python_client.interfaces.transport_interface import TransportInterface
+from ms_python_client.utils.httpx_response import to_requests_response
+from ms_python_client.utils.retry import MAX_RETRIES
+
+try:
+    import h2  # noqa: F401 pylint: disable=unused-import
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+# Graph accepts many concurrent streams on a connection, so a few
+# connections are enough for a lot of threads
+DEFAULT_MAX_CONNECTIONS = 4
+
+
+class HTTP2Session(TransportInterface):
+    """Transport of ApiClient sending the requests over HTTP/2
+
+    The requests of all the threads are multiplexed as streams over at most
+    ``max_connections`` connections, instead of taking one connection each.
+    Responses are returned as ``requests.Response`` objects and the errors
+    are raised as the requests ones, so the callers see no difference.
+
+    Args:
+        max_connections (int): Maximum number of connections per host
+        http2_prior_knowledge (bool): Talk HTTP/2 without negotiating it,
+            needed for servers without TLS. Over TLS, HTTP/2 is negotiated
+            and HTTP/1.1 is used if the server does not support it
+        retries (int): Retries of the failed connections
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        http2_prior_knowledge: bool = False,
+        retries: int = MAX_RETRIES,
+    ) -> None:
+        if httpx is None:  # pragma: no cover
+            raise ImportError(
+                "HTTP2Session requires httpx and h2: "
+                "pip install ms-python-client[http2]"
+            )
+        transport = httpx.HTTPTransport(
+            http1=not http2_prior_knowledge,
+            http2=True,
+            retries=retries,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self.client = httpx.Client(transport=transport)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        data: Optional[bytes] = None,
+        stream: bool = False,
+    ) -> Response:
+        # The body is always read at once, a streamed response iterates over it
+        try:
+            response = self.client.request(
+                method, url, headers=headers, json=json, content=data, timeout=timeout
+            )
+        except httpx.TimeoutException as e:
+            raise RequestsTimeout(e) from e
+        except httpx.TransportError as e:
+            raise RequestsConnectionError(e) from e
+        return to_requests_response(response)
+
+    def close(self) -> None:
+        """Close all the connections"""
+        self.client.close()
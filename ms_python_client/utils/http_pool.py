@@ -0,0 +1,217 @@
+"""Connection pools of the requests sessions, with usage statistics."""
+
+import threading
+import time
+from typing import Any, Optional
+
+from requests import Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager, Retry
+
+from ms_python_client.utils.retry import BACKOFF_FACTOR, MAX_RETRIES, RETRY_METHODS
+
+
+class PoolStats:
+    """Usage of the connection pools of an adapter, shared by all threads
+
+    Attributes:
+        checkouts (int): Connections taken from the pools
+        new_connections (int): Connections that had to be opened
+        discarded_connections (int): Connections closed because the pool was
+            full when they were given back
+        checkout_wait_seconds (float): Total time spent waiting for a
+            connection, only when the pool blocks
+        max_checkout_wait_seconds (float): Longest wait for a connection
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.new_connections = 0
+        self.discarded_connections = 0
+        self.checkout_wait_seconds = 0.0
+        self.max_checkout_wait_seconds = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_seconds += wait
+            self.max_checkout_wait_seconds = max(self.max_checkout_wait_seconds, wait)
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def record_discarded_connection(self) -> None:
+        with self._lock:
+            self.discarded_connections += 1
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of the checkouts that got an already open connection"""
+        with self._lock:
+            if not self.checkouts:
+                return 0.0
+            return max(self.checkouts - self.new_connections, 0) / self.checkouts
+
+    def as_dict(self) -> dict:
+        reuse_ratio = self.reuse_ratio
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "new_connections": self.new_connections,
+                "discarded_connections": self.discarded_connections,
+                "checkout_wait_seconds": self.checkout_wait_seconds,
+                "max_checkout_wait_seconds": self.max_checkout_wait_seconds,
+                "reuse_ratio": reuse_ratio,
+            }
+
+
+class _InstrumentedPoolMixin:
+    stats: PoolStats
+    pool: Any
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        start = time.monotonic()
+        conn = super()._get_conn(timeout)  # type: ignore
+        self.stats.record_checkout(time.monotonic() - start)
+        return conn
+
+    def _new_conn(self) -> Any:
+        self.stats.record_new_connection()
+        return super()._new_conn()  # type: ignore
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None and self.pool is not None and self.pool.full():
+            self.stats.record_discarded_connection()
+        super()._put_conn(conn)  # type: ignore
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class InstrumentedPoolManager(PoolManager):
+    """PoolManager whose pools report to a ``PoolStats``"""
+
+    def __init__(self, *args: Any, stats: PoolStats, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+        self.pool_classes_by_scheme = {
+            "http": InstrumentedHTTPConnectionPool,
+            "https": InstrumentedHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, *args: Any, **kwargs: Any) -> HTTPConnectionPool:
+        pool = super()._new_pool(*args, **kwargs)
+        pool.stats = self.stats  # type: ignore
+        return pool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter collecting the usage of its connection pools in ``stats``
+
+    Args:
+        pool_connections (int): Number of hosts whose pool is kept
+        pool_maxsize (int): Maximum number of connections kept per host
+        pool_block (bool): Wait for a free connection instead of opening a
+            new one that is thrown away afterwards when the pool is full
+        max_retries (Retry): Retries of the connection errors
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        max_retries: Any = 0,
+    ) -> None:
+        self.stats = PoolStats()
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = InstrumentedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            stats=self.stats,
+            **pool_kwargs,
+        )
+
+
+def create_connection_retry() -> Retry:
+    """Create the urllib3 retries of the connection and read errors
+
+    Statuses are left to the retry policy of the clients, which knows about
+    ``Retry-After`` and idempotent requests.
+
+    Returns:
+        Retry: The retry configuration
+    """
+    return Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=None,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=False,
+    )
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+) -> Session:
+    """Create a session that can be shared by several clients
+
+    Connection errors are retried, the statuses are left to the retry
+    policy of the clients.
+
+    Args:
+        pool_connections (int): Number of hosts whose pool is kept
+        pool_maxsize (int): Maximum number of connections kept per host,
+            should be at least the number of threads using the session
+        pool_block (bool): Wait for a free connection when all of them are
+            in use, instead of opening one that is closed afterwards
+
+    Returns:
+        Session: The session
+    """
+    adapter = PooledHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=create_connection_retry(),
+    )
+    session = Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_pool_stats(session: Session, url: str) -> Optional[PoolStats]:
+    """Get the pool statistics of the adapter used for a URL
+
+    Args:
+        session (Session): The session
+        url (str): The URL
+
+    Returns:
+        PoolStats: The statistics, None if the adapter does not collect them
+    """
+    adapter = session.get_adapter(url)
+    return adapter.stats if isinstance(adapter, PooledHTTPAdapter) else None
@@ -0,0 +1,40 @@
+import io
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+
+def to_requests_response(response: Any) -> Response:
+    """Convert an httpx response into a requests one
+
+    The clients built on httpx return requests responses, so the callers get
+    the same ``json()``, ``raise_for_status()`` and ``HTTPError`` whatever the
+    transport is.
+
+    Args:
+        response (httpx.Response): The response, already read
+
+    Returns:
+        Response: The equivalent requests response
+    """
+    request = PreparedRequest()
+    request.method = response.request.method
+    request.url = str(response.request.url)
+    request.headers = CaseInsensitiveDict(response.request.headers)
+    request.body = response.request.content
+
+    converted = Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted.elapsed = response.elapsed
+    converted.request = request
+    # pylint: disable=protected-access
+    converted._content = response.content
+    # Already read: iter_content serves the content and close() is a no-op
+    converted._content_consumed = True  # type: ignore[attr-defined]
+    converted.raw = io.BytesIO(response.content)
+    return converted
@@ -27,6 +27,16 @@ def init_from_env() -> Config:
             azure_authority=azure_authority,
             azure_client_id=azure_client_id,
             azure_scope=azure_scope,
+            azure_client_secret=os.environ.get("AZURE_CLIENT_SECRET"),
+            azure_client_certificate_file=os.environ.get(
+                "AZURE_CLIENT_CERTIFICATE_FILE"
+            ),
+            azure_client_certificate_thumbprint=os.environ.get(
+                "AZURE_CLIENT_CERTIFICATE_THUMBPRINT"
+            ),
+            azure_authority_metadata_file=os.environ.get(
+                "AZURE_AUTHORITY_METADATA_FILE"
+            ),
         )
 
     except KeyError as error:
@@ -0,0 +1,168 @@
+"""Encoding and decoding of the JSON bodies, with the fastest library installed.
+
+orjson is used when it is installed, then msgspec, then the ``json`` module of
+the standard library. The codec of all the clients can be changed with
+``set_json_codec``.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+from requests import Response
+
+try:
+    from requests.exceptions import JSONDecodeError
+except ImportError:  # pragma: no cover
+    # requests < 2.27 raises the one of the json module
+    from json import JSONDecodeError  # type: ignore[assignment]
+
+_Bytes = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """Functions encoding objects to JSON bytes and decoding them
+
+    Args:
+        name (str): The name of the library
+        dumps (Callable): Encodes an object into UTF-8 JSON bytes
+        loads (Callable): Decodes JSON bytes or text into an object, raises
+            a ``ValueError`` when they are not valid
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[_Bytes], Any],
+    ) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Same options as requests
+    return json.dumps(obj, allow_nan=False).encode()
+
+
+def _stdlib_loads(data: _Bytes) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+STDLIB_CODEC = JsonCodec("json", _stdlib_dumps, _stdlib_loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    return JsonCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: _Bytes) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return JsonCodec("msgspec", encoder.encode, loads)
+
+
+_CODECS: "dict[str, Callable[[], JsonCodec]]" = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": lambda: STDLIB_CODEC,
+}
+
+
+def get_codec_by_name(name: str) -> JsonCodec:
+    """Create the codec of a library
+
+    Args:
+        name (str): ``orjson``, ``msgspec`` or ``json``
+
+    Raises:
+        ValueError: The library is not supported
+        ImportError: The library is not installed
+
+    Returns:
+        JsonCodec: The codec
+    """
+    if name not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON library {name}, expected one of {list(_CODECS)}"
+        )
+    return _CODECS[name]()
+
+
+def _find_codec() -> JsonCodec:
+    for name in _CODECS:
+        try:
+            return get_codec_by_name(name)
+        except ImportError:
+            continue
+    return STDLIB_CODEC  # pragma: no cover
+
+
+_codec = _find_codec()
+
+
+def get_json_codec() -> JsonCodec:
+    """Get the codec used by the clients
+
+    Returns:
+        JsonCodec: The codec
+    """
+    return _codec
+
+
+def set_json_codec(codec: Union[str, JsonCodec]) -> None:
+    """Change the codec used by the clients
+
+    Args:
+        codec (str | JsonCodec): A codec, or the name of the library to use
+    """
+    global _codec  # pylint: disable=global-statement
+    _codec = get_codec_by_name(codec) if isinstance(codec, str) else codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object into JSON bytes with the current codec"""
+    return _codec.dumps(obj)
+
+
+def loads(data: _Bytes) -> Any:
+    """Decode JSON bytes with the current codec"""
+    return _codec.loads(data)
+
+
+def decode_response(response: Response) -> Any:
+    """Decode the JSON body of a response, like ``response.json()``
+
+    Args:
+        response (Response): The response
+
+    Raises:
+        requests.exceptions.JSONDecodeError: The body is not valid JSON, a
+            ``json.JSONDecodeError`` with requests older than 2.27
+
+    Returns:
+        Any: The decoded body
+    """
+    try:
+        return _codec.loads(response.content)
+    except ValueError as e:
+        # orjson and msgspec errors are ValueErrors, but not the one requests raises
+        if isinstance(e, JSONDecodeError):
+            raise
+        raise JSONDecodeError(str(e), response.text, 0) from e
@@ -0,0 +1,135 @@
+"""Decode the items of a JSON page while its body is being read."""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, NoReturn
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+_NUMBER_START = "-0123456789"
+_VALUE_END = ",]}"
+
+
+class JsonPageStream:
+    """Items of the ``value`` array of a JSON page, decoded one at a time
+
+    Only the item being decoded and the chunk being read are kept in memory,
+    instead of the whole body and the whole list of items. The other members
+    of the page, such as ``@odata.nextLink``, are decoded as well and are in
+    ``properties`` once all the items have been consumed.
+
+    Args:
+        chunks (Iterable[bytes]): The body of the response, in UTF-8 chunks
+        key (str): The member of the page holding the items
+
+    Attributes:
+        properties (dict): The other members of the page
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str = "value") -> None:
+        self.key = key
+        self.properties: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._parse()
+
+    def _parse(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._skip_whitespace() == "}":
+            self._pos += 1
+        else:
+            while True:
+                name = self._decode_value()
+                if not isinstance(name, str):
+                    self._error("Expecting a property name")
+                self._expect(":")
+                if name == self.key and self._skip_whitespace() == "[":
+                    yield from self._parse_items()
+                else:
+                    self.properties[name] = self._decode_value()
+                if self._expect(",}") == "}":
+                    break
+
+        if self._skip_whitespace():
+            self._error("Extra data")
+
+    def _parse_items(self) -> Iterator[Any]:
+        self._pos += 1
+        if self._skip_whitespace() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._expect(",]") == "]":
+                return
+
+    def _read(self, size: int = 1) -> bool:
+        # Read until at least ``size`` characters are left, dropping the
+        # ones already parsed
+        parsed, self._pos = self._pos, 0
+        self._buffer = self._buffer[parsed:]
+        read = False
+        while len(self._buffer) < size and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._buffer += self._text_decoder.decode(b"", final=True)
+                self._eof = True
+            else:
+                self._buffer += self._text_decoder.decode(chunk)
+                read = True
+        return read
+
+    def _skip_whitespace(self) -> str:
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def _expect(self, characters: str) -> str:
+        character = self._skip_whitespace()
+        if not character or character not in characters:
+            self._error(f"Expecting one of {characters!r}")
+        self._pos += 1
+        return character
+
+    def _decode_value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Probably cut in the middle, read as much again so a large
+                # value is not decoded again for every chunk
+                if not self._read(2 * (len(self._buffer) - self._pos)):
+                    raise
+                continue
+            # A number may continue in the next chunk, e.g. ``1`` of ``1e-05``,
+            # it is complete once the character following it is read
+            if (
+                self._buffer[self._pos] in _NUMBER_START
+                and not self._is_value_end(end)
+                and self._read(len(self._buffer) - self._pos + 1)
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def _is_value_end(self, end: int) -> bool:
+        while end < len(self._buffer) and self._buffer[end] in _WHITESPACE:
+            end += 1
+        if end == len(self._buffer):
+            return self._eof
+        return self._buffer[end] in _VALUE_END
+
+    def _error(self, message: str) -> NoReturn:
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
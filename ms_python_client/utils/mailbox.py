@@ -0,0 +1,19 @@
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+
+def get_mailbox(api_path: str) -> Optional[str]:
+    """Get the mailbox a request is made for, from its ``/users/{id}`` path
+
+    Args:
+        api_path (str): The URL path, or the full URL, of the request
+
+    Returns:
+        str: The user id or email, in lower case, or None if the request is
+        not made for a single mailbox
+    """
+    segments = [segment for segment in urlsplit(api_path).path.split("/") if segment]
+    for index, segment in enumerate(segments[:-1]):
+        if segment.lower() == "users":
+            return unquote(segments[index + 1]).lower()
+    return None
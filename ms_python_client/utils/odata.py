@@ -0,0 +1,54 @@
+"""Default OData query options and preferences of the requests."""
+
+from typing import Mapping, Optional, Sequence
+
+# Fields read from the events and the users, the others are not sent by Graph
+EVENT_SELECT = ("id", "subject", "start", "end", "location")
+USER_SELECT = ("id", "displayName", "mail", "userPrincipalName")
+
+RETURN_MINIMAL = "return=minimal"
+
+
+def with_select(parameters: Optional[Mapping[str, str]], fields: Sequence[str]) -> dict:
+    """Add a default ``$select`` to the parameters of a request
+
+    A ``$select`` already in the parameters is kept, and an empty one
+    disables the default to get all the fields.
+
+    Args:
+        parameters (dict): The parameters of the request
+        fields (list[str]): The fields selected by default
+
+    Returns:
+        dict: The parameters with the ``$select``
+    """
+    result = dict(parameters or {})
+    if "$select" not in result:
+        if fields:
+            result["$select"] = ",".join(fields)
+    elif not result["$select"]:
+        del result["$select"]
+    return result
+
+
+def with_preference(headers: Optional[Mapping[str, str]], preference: str) -> dict:
+    """Add a preference to the ``Prefer`` header of a request
+
+    It is not added when the header already has a preference of the same
+    name, such as ``return=representation`` instead of ``return=minimal``.
+
+    Args:
+        headers (dict): The headers of the request
+        preference (str): The preference, as ``name=value``
+
+    Returns:
+        dict: The headers with the preference
+    """
+    result = dict(headers or {})
+    name = preference.split("=")[0].strip().lower()
+    key = next((key for key in result if key.lower() == "prefer"), "Prefer")
+    current = result.get(key, "")
+    names = [item.split("=")[0].strip().lower() for item in current.split(",")]
+    if name not in names:
+        result[key] = f"{current}, {preference}" if current else preference
+    return result
@@ -0,0 +1,127 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Mapping, Optional
+
+from ms_python_client.interfaces.ms_client_interface import MSClientInterface
+from ms_python_client.utils.json_codec import decode_response
+from ms_python_client.utils.json_stream import JsonPageStream
+
+NEXT_LINK = "@odata.nextLink"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_pages(
+    client: MSClientInterface,
+    api_path: str,
+    parameters: Optional[Mapping[str, str]] = None,
+    extra_headers: Optional[Mapping[str, str]] = None,
+    prefetch: bool = False,
+) -> Iterator[dict]:
+    """Yield the pages of a collection, following ``@odata.nextLink``
+
+    A page is only requested when the previous one has been consumed, or
+    while it is being consumed when ``prefetch`` is set.
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        api_path (str): The URL path of the collection
+        parameters (dict): Optional parameters for the first request
+        extra_headers (dict): Optional headers for every request
+        prefetch (bool): Request the next page in a background thread
+
+    Yields:
+        dict: The pages, as returned by the API
+    """
+
+    def get_page(path: str, page_parameters: Optional[Mapping[str, str]]) -> dict:
+        return decode_response(
+            client.make_get_request(path, page_parameters, extra_headers)
+        )
+
+    if not prefetch:
+        page: Optional[dict] = get_page(api_path, parameters)
+        while page is not None:
+            next_link = page.get(NEXT_LINK)
+            yield page
+            page = get_page(next_link, None) if next_link else None
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future: Optional[Future] = executor.submit(get_page, api_path, parameters)
+        while future is not None:
+            page = future.result()
+            next_link = page.get(NEXT_LINK)
+            future = executor.submit(get_page, next_link, None) if next_link else None
+            yield page
+
+
+def iter_items(
+    client: MSClientInterface,
+    api_path: str,
+    parameters: Optional[Mapping[str, str]] = None,
+    extra_headers: Optional[Mapping[str, str]] = None,
+    page_size: Optional[int] = None,
+    prefetch: bool = False,
+    stream: bool = False,
+) -> Iterator[dict]:
+    """Yield the items of all the pages of a collection
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        api_path (str): The URL path of the collection
+        parameters (dict): Optional parameters for the first request
+        extra_headers (dict): Optional headers for every request
+        page_size (int): Number of items per page (``$top``)
+        prefetch (bool): Request the next page in a background thread
+        stream (bool): Decode the items while the pages are read, so only
+            one item is in memory at a time instead of a whole page
+
+    Raises:
+        ValueError: Both ``prefetch`` and ``stream`` are set
+
+    Yields:
+        dict: The items of the collection
+    """
+    if prefetch and stream:
+        raise ValueError("The pages can't be both prefetched and streamed")
+    parameters = dict(parameters or {})
+    if page_size:
+        parameters["$top"] = str(page_size)
+
+    if stream:
+        yield from iter_streamed_items(client, api_path, parameters, extra_headers)
+        return
+    for page in iter_pages(client, api_path, parameters, extra_headers, prefetch):
+        yield from page.get("value", [])
+
+
+def iter_streamed_items(
+    client: MSClientInterface,
+    api_path: str,
+    parameters: Optional[Mapping[str, str]] = None,
+    extra_headers: Optional[Mapping[str, str]] = None,
+) -> Iterator[dict]:
+    """Yield the items of all the pages of a collection as they are read
+
+    The body of every page is read in chunks and each item is yielded as soon
+    as it is decoded. The next page is requested once the current one has
+    been read entirely, since ``@odata.nextLink`` comes after the items.
+
+    Args:
+        client (MSClientInterface): The client used to make the requests
+        api_path (str): The URL path of the collection
+        parameters (dict): Optional parameters for the first request
+        extra_headers (dict): Optional headers for every request
+
+    Yields:
+        dict: The items of the collection
+    """
+    path: Optional[str] = api_path
+    page_parameters = parameters
+    while path:
+        response = client.make_get_request(
+            path, page_parameters, extra_headers, stream=True
+        )
+        with response:
+            page = JsonPageStream(response.iter_content(STREAM_CHUNK_SIZE))
+            yield from page
+        path, page_parameters = page.properties.get(NEXT_LINK), None
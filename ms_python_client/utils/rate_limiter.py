@@ -0,0 +1,206 @@
+"""Token buckets shared by all the processes of a host through a file."""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import time
+
+from ms_python_client.utils.file_lock import file_lock
+from ms_python_client.utils.mailbox import get_mailbox
+
+logger = logging.getLogger("ms_python_client")
+
+# Outlook accepts 10000 requests per 10 minutes per app and mailbox
+MAILBOX_RATE = 10000 / 600
+MAILBOX_BURST = 100
+# Graph accepts 130000 requests per 10 seconds per app
+APP_RATE = 130000 / 10
+APP_BURST = 13000
+
+APP_KEY = "app"
+MAGIC = b"MSRATE01"
+HEADER = struct.Struct("<8sI")
+# Hash of the key (0 for a free slot), tokens, time of the last update
+BUCKET = struct.Struct("<Qdd")
+# Number of neighbouring slots looked at for a key before reusing one
+MAX_PROBES = 16
+
+
+def _hash_key(key: str) -> int:
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedRateLimiter:
+    """Rate limits of the app and of every mailbox, shared between processes
+
+    Every request takes a token from the bucket of the app and, if it is made
+    for a mailbox, from the bucket of the mailbox. Buckets are refilled at
+    ``rate`` tokens per second, up to ``burst`` tokens. The buckets live in a
+    memory mapped file, changed under a file lock, so all the processes using
+    the same file share the same budgets.
+
+    Args:
+        path (str): The path of the shared file, created if missing
+        app_rate (float): Requests per second for the whole app
+        app_burst (float): Requests the app can send at once
+        mailbox_rate (float): Requests per second for a mailbox
+        mailbox_burst (float): Requests that can be sent at once to a mailbox
+        slots (int): Maximum number of mailboxes tracked at the same time
+    """
+
+    def __init__(
+        self,
+        path: str,
+        app_rate: float = APP_RATE,
+        app_burst: float = APP_BURST,
+        mailbox_rate: float = MAILBOX_RATE,
+        mailbox_burst: float = MAILBOX_BURST,
+        slots: int = 4096,
+    ) -> None:
+        if min(app_rate, app_burst, mailbox_rate, mailbox_burst) <= 0:
+            raise ValueError("Rates and bursts must be positive")
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.app_rate = app_rate
+        self.app_burst = app_burst
+        self.mailbox_rate = mailbox_rate
+        self.mailbox_burst = mailbox_burst
+        self.slots = slots
+        self._mmap = self._open()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _open(self) -> mmap.mmap:
+        size = HEADER.size + BUCKET.size * self.slots
+        with file_lock(self.lock_path):
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if os.fstat(fd).st_size == 0:
+                    os.ftruncate(fd, size)
+                    os.pwrite(fd, HEADER.pack(MAGIC, self.slots), 0)
+                elif os.fstat(fd).st_size != size:
+                    raise ValueError(
+                        f"{self.path} was created for another number of slots"
+                    )
+                shared = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+
+        magic, slots = HEADER.unpack_from(shared, 0)
+        if magic != MAGIC or slots != self.slots:
+            shared.close()
+            raise ValueError(f"{self.path} is not a rate limiter file")
+        return shared
+
+    def acquire(self, api_path: str) -> float:
+        """Wait until the request can be sent within the budgets and take them
+
+        Args:
+            api_path (str): The URL path, or the full URL, of the request
+
+        Returns:
+            float: The seconds spent waiting
+        """
+        buckets = self._get_buckets(api_path)
+        waited = 0.0
+        while True:
+            with file_lock(self.lock_path):
+                now = time.time()
+                states = [
+                    self._refill(key, rate, burst, now) for key, rate, burst in buckets
+                ]
+                wait = max(
+                    (1 - tokens) / rate
+                    for (_, rate, _), (_, tokens) in zip(buckets, states)
+                )
+                if wait <= 0:
+                    for (key, _, _), (slot, tokens) in zip(buckets, states):
+                        self._write(slot, key, tokens - 1, now)
+                    return waited
+
+            logger.debug("Rate budget of %s exhausted, waiting %.3fs", api_path, wait)
+            time.sleep(wait)
+            waited += wait
+
+    def throttled(self, api_path: str, retry_after: float) -> None:
+        """Empty the budget of a request that was throttled
+
+        All the processes wait ``retry_after`` seconds before sending another
+        request for the same mailbox, or for the app if it is not made for a
+        mailbox.
+
+        Args:
+            api_path (str): The URL path, or the full URL, of the request
+            retry_after (float): The seconds to wait before the next request
+        """
+        key, rate, burst = self._get_buckets(api_path)[-1]
+        with file_lock(self.lock_path):
+            now = time.time()
+            slot, tokens = self._refill(key, rate, burst, now)
+            self._write(slot, key, min(tokens, 1 - retry_after * rate), now)
+
+    def get_tokens(self, key: str) -> float:
+        """Get the tokens left in a bucket, mostly for monitoring
+
+        Args:
+            key (str): ``app`` or the mailbox
+
+        Returns:
+            float: The number of requests that can be sent right now
+        """
+        if key == APP_KEY:
+            rate, burst = self.app_rate, self.app_burst
+        else:
+            key = f"mailbox:{key.lower()}"
+            rate, burst = self.mailbox_rate, self.mailbox_burst
+        with file_lock(self.lock_path):
+            return self._refill(key, rate, burst, time.time())[1]
+
+    def _get_buckets(self, api_path: str) -> "list[tuple[str, float, float]]":
+        buckets = [(APP_KEY, self.app_rate, self.app_burst)]
+        mailbox = get_mailbox(api_path)
+        if mailbox is not None:
+            buckets.append(
+                (f"mailbox:{mailbox}", self.mailbox_rate, self.mailbox_burst)
+            )
+        return buckets
+
+    def _refill(
+        self, key: str, rate: float, burst: float, now: float
+    ) -> "tuple[int, float]":
+        key_hash = _hash_key(key)
+        start = key_hash % self.slots
+        reusable = None
+        oldest = None
+        for probe in range(min(MAX_PROBES, self.slots)):
+            slot = (start + probe) % self.slots
+            slot_hash, tokens, updated = BUCKET.unpack_from(
+                self._mmap, HEADER.size + slot * BUCKET.size
+            )
+            if slot_hash == key_hash:
+                tokens = min(tokens + max(now - updated, 0) * rate, burst)
+                self._write(slot, key, tokens, now)
+                return slot, tokens
+            if slot_hash == 0 and reusable is None:
+                reusable = slot
+            if oldest is None or updated < oldest[1]:
+                oldest = (slot, updated)
+
+        # A bucket not used for long is full again, so forgetting the least
+        # recently used one loses little
+        if reusable is None and oldest is not None:
+            reusable = oldest[0]
+        slot = reusable if reusable is not None else start
+        # Written right away, so the other bucket of a request can't take
+        # the same slot
+        self._write(slot, key, burst, now)
+        return slot, burst
+
+    def _write(self, slot: int, key: str, tokens: float, now: float) -> None:
+        BUCKET.pack_into(
+            self._mmap, HEADER.size + slot * BUCKET.size, _hash_key(key), tokens, now
+        )
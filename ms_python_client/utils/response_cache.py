@@ -0,0 +1,233 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Callable, Hashable, Mapping, NamedTuple, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_SIZE = 1000
+DEFAULT_TTL = 60.0
+# Headers changing the body Graph sends for the same URL
+VARY_HEADERS = ("Prefer", "ConsistencyLevel")
+# Delta queries return each change once, they must always reach Graph
+DEFAULT_ROUTE_TTLS = {"*/delta": 0.0}
+
+
+class _Entry(NamedTuple):
+    path: str
+    expires: float
+    status_code: int
+    headers: dict
+    content: bytes
+    url: str
+
+
+class CacheStats:
+    """Counters of a response cache, shared by all threads
+
+    Attributes:
+        hits (int): Requests answered from the cache
+        misses (int): Cacheable requests sent to Graph
+        evictions (int): Entries dropped to stay under the size limit
+        invalidations (int): Entries dropped after a write to their resource
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def record(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": self.hit_ratio,
+            }
+
+
+def parent_path(path: str) -> str:
+    """Path of the collection of a resource, e.g. the events of an event"""
+    return path.rsplit("/", 1)[0]
+
+
+class ResponseCache:
+    """Successful GET responses, kept for a while to answer the same requests
+
+    Entries are keyed by the path, the query string, the headers in
+    ``VARY_HEADERS`` and a hash of the ``Authorization`` header, so a cache
+    shared by clients with different credentials doesn't answer one of them
+    with what Graph sent to another. The least recently used entries are dropped first once
+    there are ``max_size`` of them. A write to a resource drops the cached
+    responses of the resource, of its sub-resources and of its collection.
+
+    Args:
+        max_size (int): Number of responses kept
+        ttl (float): Seconds a response is kept, for the routes without their
+            own TTL
+        route_ttls (dict): TTLs of the paths matching glob patterns, such as
+            ``{"/users": 600, "/users/*/calendar/events*": 30}``. The first
+            matching pattern is used, and a TTL of 0 disables the cache for
+            the route. Delta queries are never cached.
+        clock (Callable): Returns the current time in seconds
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_TTL,
+        route_ttls: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.route_ttls = {**DEFAULT_ROUTE_TTLS, **(route_ttls or {})}
+        self.clock = clock
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, path: str) -> float:
+        """Get the TTL of a path
+
+        Args:
+            path (str): The path, without the query string
+
+        Returns:
+            float: The TTL in seconds, 0 when the path is not cached
+        """
+        for pattern, ttl in self.route_ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    def build_key(self, api_path: str, headers: Mapping[str, str]) -> Hashable:
+        """Key of a request
+
+        Args:
+            api_path (str): The path with its query string
+            headers (dict): The headers of the request
+
+        Returns:
+            Hashable: The key
+        """
+        headers = CaseInsensitiveDict(headers)
+        authorization = headers.get("Authorization")
+        # The token is hashed to not keep the credentials in the keys
+        principal = (
+            hashlib.sha256(authorization.encode()).hexdigest()
+            if authorization
+            else None
+        )
+        return (api_path, principal, *(headers.get(name) for name in VARY_HEADERS))
+
+    def get(self, api_path: str, headers: Mapping[str, str]) -> Optional[Response]:
+        """Get a cached response of a request
+
+        Args:
+            api_path (str): The path with its query string
+            headers (dict): The headers of the request
+
+        Returns:
+            Response: A new copy of the cached response, None if there is
+            none or if it expired
+        """
+        key = self.build_key(api_path, headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            self.stats.record("misses")
+            return None
+        self.stats.record("hits")
+        return _build_response(entry)
+
+    def put(
+        self, api_path: str, headers: Mapping[str, str], response: Response
+    ) -> None:
+        """Cache the response of a request, if it is a success of a cached route
+
+        Args:
+            api_path (str): The path with its query string
+            headers (dict): The headers of the request
+            response (Response): The response, with its body already read
+        """
+        path = api_path.split("?", 1)[0]
+        ttl = self.get_ttl(path)
+        if ttl <= 0 or response.status_code != 200:
+            return
+        entry = _Entry(
+            path,
+            self.clock() + ttl,
+            response.status_code,
+            dict(response.headers),
+            response.content,
+            response.url,
+        )
+        key = self.build_key(api_path, headers)
+        evicted = 0
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.stats.record("evictions", evicted)
+
+    def invalidate(self, api_path: str) -> None:
+        """Drop the responses made stale by a write to a resource
+
+        Args:
+            api_path (str): The path of the written resource
+        """
+        path = api_path.split("?", 1)[0].rstrip("/")
+        collection = parent_path(path)
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.path in (path, collection) or entry.path.startswith(path + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            self.stats.record("invalidations", len(stale))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _build_response(entry: _Entry) -> Response:
+    response = Response()
+    response.status_code = entry.status_code
+    response.headers = CaseInsensitiveDict(entry.headers)
+    # pylint: disable=protected-access
+    response._content = entry.content
+    response.url = entry.url
+    response.encoding = "utf-8"
+    return response
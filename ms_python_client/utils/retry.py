@@ -0,0 +1,200 @@
+"""When and how long to wait before sending a failed request again."""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Mapping, Optional, Sequence
+
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1
+MAX_BACKOFF = 120
+JITTER = 0.25
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+RETRY_METHODS = ["HEAD", "GET", "PUT", "PATCH", "DELETE", "OPTIONS"]
+# A throttled request was rejected before being processed, so any method can
+# be sent again safely
+THROTTLED_STATUS_CODES = [429]
+RETRY_AFTER_STATUS_CODES = [413, 429, 503]
+
+
+class RetryStats:
+    """Counters of the retries made with a policy, shared by all threads
+
+    Attributes:
+        retries (int): Number of requests sent again
+        retry_after_waits (int): Retries that waited for a ``Retry-After``
+        backoff_seconds (float): Total time spent waiting before retries
+        exhausted (int): Requests that still failed after the last retry
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.retry_after_waits = 0
+        self.backoff_seconds = 0.0
+        self.exhausted = 0
+
+    def record_retry(self, delay: float, retry_after: bool) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            if retry_after:
+                self.retry_after_waits += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retry_after_waits": self.retry_after_waits,
+                "backoff_seconds": self.backoff_seconds,
+                "exhausted": self.exhausted,
+            }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Get the number of seconds to wait from a ``Retry-After`` header
+
+    Args:
+        value (str): The header, in seconds or as an HTTP date
+
+    Returns:
+        float: The seconds to wait, None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        return None
+    return max(date.timestamp() - time.time(), 0)
+
+
+class RetryPolicy:
+    """Decide which responses are retried and how long to wait before it
+
+    The ``Retry-After`` header of Graph is followed when it is there,
+    otherwise the wait grows exponentially. A random jitter of up to
+    ``jitter`` times the wait is added, so throttled clients don't all come
+    back at the same time.
+
+    Methods in ``methods`` are retried on any status of ``status_codes``.
+    Other methods, like POST, are only retried when the request is marked
+    idempotent, or when it was throttled (429) since it was not processed.
+
+    Args:
+        max_retries (int): Maximum number of retries of a request
+        backoff_factor (float): Wait before the first retry without
+            ``Retry-After``, doubled for every following one
+        max_backoff (float): Maximum wait without ``Retry-After``
+        jitter (float): Maximum random extra wait, as a fraction of the wait
+        status_codes (list[int]): Statuses that are retried
+        methods (list[str]): Methods that are always safe to retry
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        max_backoff: float = MAX_BACKOFF,
+        jitter: float = JITTER,
+        status_codes: Sequence[int] = tuple(RETRY_STATUS_CODES),
+        methods: Sequence[str] = tuple(RETRY_METHODS),
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.stats = RetryStats()
+
+    def is_retryable(
+        self, method: str, status_code: int, idempotent: bool = False
+    ) -> bool:
+        """Check if a response with this status could be retried at all
+
+        Args:
+            method (str): The HTTP method of the request
+            status_code (int): The status of the response
+            idempotent (bool): The request can be sent twice safely
+
+        Returns:
+            bool: Whether the request may be sent again
+        """
+        if status_code not in self.status_codes:
+            return False
+        return (
+            idempotent
+            or method.upper() in self.methods
+            or status_code in THROTTLED_STATUS_CODES
+        )
+
+    def should_retry(
+        self, method: str, status_code: int, attempt: int, idempotent: bool = False
+    ) -> bool:
+        """Check if a response must be retried, counting exhausted requests
+
+        Args:
+            method (str): The HTTP method of the request
+            status_code (int): The status of the response
+            attempt (int): Number of retries already made
+            idempotent (bool): The request can be sent twice safely
+
+        Returns:
+            bool: Whether to send the request again
+        """
+        if not self.is_retryable(method, status_code, idempotent):
+            return False
+        if attempt >= self.max_retries:
+            self.stats.record_exhausted()
+            return False
+        return True
+
+    def get_backoff_time(self, attempt: int) -> float:
+        """Get the exponential wait before a retry, without jitter
+
+        Args:
+            attempt (int): The number of the retry, starting at 1
+
+        Returns:
+            float: The seconds to wait
+        """
+        return min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+
+    def get_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> float:
+        """Get the wait before a retry and count it in the stats
+
+        Args:
+            attempt (int): The number of the retry, starting at 1
+            status_code (int): The status of the response, if there is one
+            headers (dict): The headers of the response, if there is one
+
+        Returns:
+            float: The seconds to wait
+        """
+        retry_after = None
+        if status_code in RETRY_AFTER_STATUS_CODES and headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        delay = (
+            retry_after if retry_after is not None else self.get_backoff_time(attempt)
+        )
+        delay += delay * random.uniform(0, self.jitter)
+        self.stats.record_retry(delay, retry_after is not None)
+        return delay
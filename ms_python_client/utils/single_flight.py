@@ -0,0 +1,59 @@
+"""Share the result of a call between the threads making it at the same time."""
+
+import threading
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls sharing the same key
+
+    While a call for a key is in flight, other threads asking for the same
+    key wait for it and get its result (or its exception) instead of running
+    the function themselves.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run the function once for all the concurrent callers of a key
+
+        Args:
+            key (Hashable): The key identifying the call
+            func (Callable): The function to run
+
+        Returns:
+            Any: The result of the function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,196 @@
+"""Transports of ApiClient built on requests and on urllib3."""
+
+import time
+from datetime import timedelta
+from typing import Any, Mapping, Optional
+
+import urllib3
+from requests import ConnectionError as RequestsConnectionError
+from requests import PreparedRequest, Response, Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from requests.exceptions import ConnectTimeout, ReadTimeout, SSLError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from urllib3.exceptions import SSLError as Urllib3SSLError
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+
+from ms_python_client.interfaces.transport_interface import TransportInterface
+from ms_python_client.utils import json_codec
+from ms_python_client.utils.http_pool import (
+    InstrumentedPoolManager,
+    PoolStats,
+    create_connection_retry,
+    create_session,
+    get_pool_stats,
+)
+
+_Headers = Mapping[str, str]
+
+# Same as the ones of requests but the User-Agent, which names this client
+DEFAULT_HEADERS = urllib3.util.make_headers(
+    keep_alive=True, accept_encoding=True, user_agent="ms-python-client"
+)
+DEFAULT_HEADERS["Accept"] = "*/*"
+
+
+class RequestsTransport(TransportInterface):
+    """Transport sending the requests with a ``requests.Session``
+
+    Args:
+        session (Session): The session, a new one from ``create_session`` if
+            not given
+    """
+
+    def __init__(self, session: Optional[Session] = None) -> None:
+        self.session = session or create_session()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[_Headers] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        data: Optional[bytes] = None,
+        stream: bool = False,
+    ) -> Response:
+        return self.session.request(
+            method,
+            url,
+            headers=headers,
+            json=json,
+            data=data,
+            timeout=timeout,
+            stream=stream,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+    def get_pool_stats(self, url: str) -> Optional[PoolStats]:
+        return get_pool_stats(self.session, url)
+
+
+class Urllib3Transport(TransportInterface):
+    """Transport sending the requests straight to a ``urllib3.PoolManager``
+
+    It skips what ``requests.Session`` does on every call and is not needed
+    for Graph: hooks, cookies, proxies and ``.netrc`` lookups from the
+    environment and the preparation of the request. Connection errors are
+    retried and the pools report their usage like the ones of
+    ``create_session``.
+
+    Args:
+        pool_connections (int): Number of hosts whose pool is kept
+        pool_maxsize (int): Maximum number of connections kept per host,
+            should be at least the number of threads using the transport
+        pool_block (bool): Wait for a free connection when all of them are
+            in use, instead of opening one that is closed afterwards
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+    ) -> None:
+        self.stats = PoolStats()
+        self.retries = create_connection_retry()
+        self.pool_manager = InstrumentedPoolManager(
+            num_pools=pool_connections,
+            maxsize=pool_maxsize,
+            block=pool_block,
+            stats=self.stats,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=DEFAULT_CA_BUNDLE_PATH,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[_Headers] = None,
+        json: Optional[Any] = None,
+        timeout: Optional[float] = None,
+        data: Optional[bytes] = None,
+        stream: bool = False,
+    ) -> Response:
+        all_headers = dict(DEFAULT_HEADERS)
+        if headers:
+            all_headers.update(headers)
+        body = data
+        if json is not None:
+            body = json_codec.dumps(json)
+            all_headers.setdefault("Content-Type", "application/json")
+
+        start = time.monotonic()
+        try:
+            raw = self.pool_manager.request(
+                method,
+                url,
+                body=body,
+                headers=all_headers,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                retries=self.retries,
+                preload_content=not stream,
+            )
+        except MaxRetryError as e:
+            raise _convert_error(e.reason or e) from e
+        except Urllib3HTTPError as e:
+            raise _convert_error(e) from e
+
+        return _build_response(
+            raw, method, url, all_headers, body, time.monotonic() - start, stream
+        )
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+
+    def get_pool_stats(self, url: str) -> Optional[PoolStats]:
+        return self.stats
+
+
+def _convert_error(error: Exception) -> Exception:
+    # Same mapping as requests, where a refused connection is not a timeout
+    if isinstance(error, NewConnectionError):
+        return RequestsConnectionError(error)
+    if isinstance(error, Urllib3SSLError):
+        return SSLError(error)
+    if isinstance(error, ConnectTimeoutError):
+        return ConnectTimeout(error)
+    if isinstance(error, Urllib3TimeoutError):
+        return ReadTimeout(error)
+    return RequestsConnectionError(error)
+
+
+def _build_response(
+    raw: "urllib3.BaseHTTPResponse",
+    method: str,
+    url: str,
+    headers: _Headers,
+    body: Optional[bytes],
+    elapsed: float,
+    stream: bool,
+) -> Response:
+    request = PreparedRequest()
+    request.method = method
+    request.url = url
+    request.headers = CaseInsensitiveDict(headers)
+    request.body = body
+
+    response = Response()
+    response.status_code = raw.status
+    response.reason = raw.reason
+    response.headers = CaseInsensitiveDict(raw.headers)
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.elapsed = timedelta(seconds=elapsed)
+    response.request = request
+    response.raw = raw
+    if not stream:
+        # pylint: disable=protected-access
+        response._content = raw.data
+    return response
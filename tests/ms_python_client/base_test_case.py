@@ -19,13 +19,14 @@ def mock_oauth2_flow(mock_instance):
     # Make the __init__ method return the mock instance
     mock_instance.get_access_token.return_value = (MOCK_TOKEN, "username")
     mock_instance.__class__.get_access_token = mock_instance.get_access_token
+    mock_instance.get_access_token_with_expiry.return_value = (MOCK_TOKEN, 3600)
     mock_instance.__class__.__init__ = lambda self: None
 
 
-def mock_msal():
+def mock_msal(target="ms_python_client.ms_api_client.Oauth2Flow"):
     def decorator(func):
         def wrapper(*args, **kwargs):
-            with patch("ms_python_client.ms_api_client.Oauth2Flow") as mock_oauth:
+            with patch(target) as mock_oauth:
                 mock_instance = mock_oauth.return_value
                 mock_oauth2_flow(mock_instance)
                 return func(*args, **kwargs)
@@ -0,0 +1,111 @@
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from ms_python_client.async_cern_ms_api_client import AsyncCERNMSApiClient
+from ms_python_client.components.events.cern_events_component import NotFoundError
+from ms_python_client.utils.event_generator import (
+    ZOOM_ID_EXTENDED_PROPERTY_ID,
+    EventParameters,
+    PartialEventParameters,
+)
+from tests.ms_python_client.base_test_case import BaseTest, mock_msal
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+pytest.importorskip("httpx")
+
+EVENTS_PATH = "/users/user_id/calendar/events"
+
+
+class TestAsyncCERNEventsComponent(BaseTest, IsolatedAsyncioTestCase):
+    @mock_msal("ms_python_client.async_ms_api_client.Oauth2Flow")
+    def setUp(self) -> None:
+        super().setUp()
+        self.server = LocalHttpServer().__enter__()
+        self.ms_client = AsyncCERNMSApiClient(self.config, api_endpoint=self.server.url)
+        self.events_component = self.ms_client.events
+
+    async def asyncTearDown(self) -> None:
+        await self.ms_client.aclose()
+        self.server.__exit__()
+
+    async def test_get_event_by_zoom_id_not_found(self):
+        self.server.add("GET", EVENTS_PATH, {"@odata.count": 0})
+        with pytest.raises(NotFoundError):
+            await self.events_component.get_event_by_zoom_id("user_id", "zoom_id")
+
+    async def test_get_event_zoom_id(self):
+        self.server.add(
+            "GET",
+            f"{EVENTS_PATH}/event_id",
+            {
+                "id": "event_id",
+                "singleValueExtendedProperties": [
+                    {"id": ZOOM_ID_EXTENDED_PROPERTY_ID, "value": "1234567890"}
+                ],
+            },
+        )
+        zoom_id = await self.events_component.get_event_zoom_id("user_id", "event_id")
+        assert zoom_id == "1234567890"
+
+    async def test_create_event(self):
+        self.server.add("POST", EVENTS_PATH, {"id": "event_id"}, status=201)
+        event = await self.events_component.create_event(
+            "user_id",
+            "1234567890",
+            EventParameters(
+                zoom_url="https://zoom.us/j/1234567890",
+                subject="Test Event",
+                start_time="2021-01-01T00:00:00",
+                end_time="2021-01-01T01:00:00",
+            ),
+        )
+        assert event["id"] == "event_id"
+
+    async def test_update_and_delete_event_by_zoom_id(self):
+        self.server.add(
+            "GET", EVENTS_PATH, {"@odata.count": 1, "value": [{"id": "event_id"}]}
+        )
+        self.server.add("PATCH", f"{EVENTS_PATH}/event_id", {"response": "ok"})
+        self.server.add("DELETE", f"{EVENTS_PATH}/event_id", status=204)
+
+        event = await self.events_component.update_event_by_zoom_id(
+            "user_id", "zoom_id", PartialEventParameters(subject="Test Event")
+        )
+        await self.events_component.delete_event_by_zoom_id("user_id", "zoom_id")
+
+        assert event["response"] == "ok"
+        # The event id is in the zoom id index after the first lookup
+        assert [request.method for request in self.server.requests] == [
+            "GET",
+            "PATCH",
+            "DELETE",
+        ]
+        assert self.events_component.zoom_id_index.get("user_id", "zoom_id") is None
+
+    async def test_stale_zoom_id_index_entry(self):
+        self.events_component.zoom_id_index.set("user_id", "zoom_id", "old_id")
+        self.server.add("DELETE", f"{EVENTS_PATH}/old_id", status=404)
+        self.server.add(
+            "GET", EVENTS_PATH, {"@odata.count": 1, "value": [{"id": "event_id"}]}
+        )
+        self.server.add("DELETE", f"{EVENTS_PATH}/event_id", status=204)
+
+        await self.events_component.delete_event_by_zoom_id("user_id", "zoom_id")
+
+        assert [request.path for request in self.server.requests][-1] == (
+            f"{EVENTS_PATH}/event_id"
+        )
+
+    async def test_get_current_event(self):
+        self.server.add(
+            "GET",
+            EVENTS_PATH,
+            {"@odata.count": 1, "value": [{"id": "event_id", "subject": "Test"}]},
+        )
+        event = await self.events_component.get_current_event("user_id")
+        assert event["subject"] == "Test"
+        assert (
+            self.server.requests[0].headers["Prefer"]
+            == 'outlook.timezone="Europe/Zurich"'
+        )
@@ -0,0 +1,80 @@
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from ms_python_client.async_ms_api_client import AsyncMSApiClient
+from ms_python_client.components.events.async_events_component import (
+    AsyncEventsComponent,
+)
+from ms_python_client.utils.error import ConflictError
+from tests.ms_python_client.base_test_case import BaseTest, mock_msal
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+pytest.importorskip("httpx")
+
+EVENTS_PATH = "/users/user_id/calendar/events"
+
+
+class TestAsyncEventsComponent(BaseTest, IsolatedAsyncioTestCase):
+    @mock_msal("ms_python_client.async_ms_api_client.Oauth2Flow")
+    def setUp(self) -> None:
+        super().setUp()
+        self.server = LocalHttpServer().__enter__()
+        self.ms_client = AsyncMSApiClient(self.config, api_endpoint=self.server.url)
+        self.events_component = AsyncEventsComponent(self.ms_client)
+
+    async def asyncTearDown(self) -> None:
+        await self.ms_client.aclose()
+        self.server.__exit__()
+
+    async def test_list_events(self):
+        self.server.add("GET", EVENTS_PATH, {"response": "ok"})
+        events_list = await self.events_component.list_events(
+            "user_id", {"key": "value"}, {"test": "test"}
+        )
+        assert events_list["response"] == "ok"
+        assert (
+            self.server.requests[0].path
+            == f"{EVENTS_PATH}?key=value&$select=id,subject,start,end,location"
+        )
+        assert self.server.requests[0].headers["test"] == "test"
+
+    async def test_get_event(self):
+        self.server.add("GET", f"{EVENTS_PATH}/event_id", {"response": "ok"})
+        event = await self.events_component.get_event("user_id", "event_id")
+        assert event["response"] == "ok"
+
+    async def test_create_event(self):
+        self.server.add("POST", EVENTS_PATH, {"response": "ok"}, status=201)
+        event = await self.events_component.create_event("user_id", {"subject": "Test"})
+        assert event["response"] == "ok"
+        assert self.server.requests[0].json() == {"subject": "Test"}
+
+    async def test_update_event(self):
+        self.server.add("PATCH", f"{EVENTS_PATH}/event_id", {"response": "ok"})
+        event = await self.events_component.update_event(
+            "user_id", "event_id", {"subject": "Test"}
+        )
+        assert event["response"] == "ok"
+
+    async def test_get_event_not_modified(self):
+        event = {"@odata.etag": 'W/"1"', "id": "event_id"}
+        self.server.add("GET", f"{EVENTS_PATH}/event_id", event)
+        self.server.add("GET", f"{EVENTS_PATH}/event_id", status=304)
+
+        assert await self.events_component.get_event("user_id", "event_id") == event
+        assert await self.events_component.get_event("user_id", "event_id") == event
+        assert self.server.requests[1].headers["If-None-Match"] == 'W/"1"'
+
+    async def test_update_event_conflict(self):
+        self.server.add("PATCH", f"{EVENTS_PATH}/event_id", status=412)
+        with pytest.raises(ConflictError):
+            await self.events_component.update_event(
+                "user_id", "event_id", {"subject": "Test"}, etag='W/"1"'
+            )
+        assert self.server.requests[0].headers["If-Match"] == 'W/"1"'
+
+    async def test_delete_event(self):
+        self.server.add("DELETE", f"{EVENTS_PATH}/event_id", status=204)
+        await self.events_component.delete_event("user_id", "event_id")
+        assert self.server.requests[0].method == "DELETE"
@@ -1,10 +1,14 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 import responses
+from requests import HTTPError
 
 from ms_python_client.cern_ms_api_client import CERNMSApiClient
 from ms_python_client.components.events.cern_events_component import (
     CERNEventsComponents,
     NotFoundError,
+    build_current_event_parameters,
 )
 from ms_python_client.utils.event_generator import (
     ZOOM_ID_EXTENDED_PROPERTY_ID,
@@ -38,6 +42,16 @@ class TestEventsComponent(BaseTest):
         assert events_list["response"] == "ok"
         assert responses.calls[0].request.headers["test"] == "test"
 
+    @responses.activate
+    def test_iter_events(self):
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={"value": [{"id": "1"}, {"id": "2"}]},
+        )
+        events = list(self.events_component.iter_events("user_id"))
+        assert [event["id"] for event in events] == ["1", "2"]
+
     @responses.activate
     def test_get_event_by_zoom_id_0(self):
         responses.add(
@@ -123,6 +137,26 @@ class TestEventsComponent(BaseTest):
         assert event["response"] == "ok"
         assert responses.calls[0].request.headers["test"] == "test"
 
+    @responses.activate
+    def test_update_event_return_value(self):
+        self.events_component.zoom_id_index.set("user_id", "zoom_id", "event_id")
+        url = f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id"
+        responses.add(responses.PATCH, url, status=204)
+        responses.add(responses.PATCH, url, json={"id": "event_id"}, status=200)
+        parameters = PartialEventParameters(subject="New subject")
+
+        minimal = self.events_component.update_event_by_zoom_id(
+            "user_id", "zoom_id", parameters
+        )
+        event = self.events_component.update_event_by_zoom_id(
+            "user_id", "zoom_id", parameters, {"Prefer": "return=representation"}
+        )
+
+        assert minimal == {}
+        assert event == {"id": "event_id"}
+        assert responses.calls[0].request.headers["Prefer"] == "return=minimal"
+        assert responses.calls[1].request.headers["Prefer"] == "return=representation"
+
     @responses.activate
     def test_delete_event(self):
         responses.add(
@@ -145,6 +179,164 @@ class TestEventsComponent(BaseTest):
         self.events_component.delete_event_by_zoom_id("user_id", "zoom_id", headers)
         assert responses.calls[0].request.headers["test"] == "test"
 
+    @responses.activate
+    def test_update_event_from_zoom_id_index(self):
+        responses.add(
+            responses.POST,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={"id": "event_id"},
+            status=201,
+        )
+        responses.add(
+            responses.PATCH,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id",
+            json={"response": "ok"},
+            status=200,
+        )
+        self.events_component.create_event(
+            "user_id",
+            "1234567890",
+            EventParameters(
+                zoom_url="https://cern.zoom.us/j/1234567890",
+                subject="Test Event",
+                start_time="2021-01-01T00:00:00",
+                end_time="2021-01-01T01:00:00",
+            ),
+        )
+        event = self.events_component.update_event_by_zoom_id(
+            "user_id", "1234567890", PartialEventParameters(subject="New subject")
+        )
+        assert event["response"] == "ok"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_stale_zoom_id_index_entry(self):
+        self.events_component.zoom_id_index.set("user_id", "zoom_id", "old_id")
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/old_id",
+            status=404,
+        )
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={"@odata.count": 1, "value": [{"id": "event_id"}]},
+            status=200,
+        )
+        event = self.events_component.get_event_by_zoom_id("user_id", "zoom_id")
+        assert event["id"] == "event_id"
+        assert self.events_component.zoom_id_index.get("user_id", "zoom_id") == (
+            "event_id"
+        )
+
+    @responses.activate
+    def test_zoom_id_index_errors_are_raised(self):
+        self.events_component.zoom_id_index.set("user_id", "zoom_id", "event_id")
+        responses.add(
+            responses.DELETE,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id",
+            status=403,
+        )
+        with pytest.raises(HTTPError):
+            self.events_component.delete_event_by_zoom_id("user_id", "zoom_id")
+
+    @responses.activate
+    def test_list_events_fills_zoom_id_index(self):
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={
+                "value": [
+                    {
+                        "id": "event_id",
+                        "singleValueExtendedProperties": [
+                            {"id": ZOOM_ID_EXTENDED_PROPERTY_ID, "value": "123"}
+                        ],
+                    },
+                    {"id": "other_id"},
+                ]
+            },
+            status=200,
+        )
+        list(self.events_component.iter_events("user_id"))
+        assert self.events_component.zoom_id_index.get("user_id", "123") == "event_id"
+
+        self.events_component.update_zoom_id_index(
+            "user_id", [{"id": "event_id", "@removed": {"reason": "deleted"}}]
+        )
+        assert self.events_component.zoom_id_index.get("user_id", "123") is None
+
+    @responses.activate
+    def test_create_events(self):
+        responses.add(
+            responses.POST,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={"id": "event_id"},
+            status=201,
+        )
+        events = [
+            (
+                str(zoom_id),
+                EventParameters(
+                    zoom_url=f"https://cern.zoom.us/j/{zoom_id}",
+                    subject="Test Event",
+                    start_time="2021-01-01T00:00:00",
+                    end_time="2021-01-01T01:00:00",
+                ),
+            )
+            for zoom_id in range(25)
+        ]
+        results = list(
+            self.events_component.create_events("user_id", events, max_workers=5)
+        )
+        assert sorted(result.key for result in results) == sorted(
+            str(zoom_id) for zoom_id in range(25)
+        )
+        assert all(result.result == {"id": "event_id"} for result in results)
+        assert len(responses.calls) == 25
+
+    @responses.activate
+    def test_update_events_by_zoom_id(self):
+        self.events_component.zoom_id_index.set("user_id", "1", "event_1")
+        self.events_component.zoom_id_index.set("user_id", "2", "event_2")
+        responses.add(
+            responses.PATCH,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_1",
+            json={"id": "event_1"},
+        )
+        responses.add(
+            responses.PATCH,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_2",
+            status=403,
+        )
+        parameters = PartialEventParameters(subject="New subject")
+        results = {
+            result.key: result
+            for result in self.events_component.update_events_by_zoom_id(
+                "user_id", [("1", parameters), ("2", parameters)]
+            )
+        }
+        assert results["1"].result == {"id": "event_1"}
+        assert isinstance(results["2"].error, HTTPError)
+
+    @responses.activate
+    def test_delete_events_by_zoom_id(self):
+        for zoom_id in ["1", "2", "3"]:
+            self.events_component.zoom_id_index.set("user_id", zoom_id, zoom_id)
+        responses.add(
+            responses.DELETE,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/1",
+            status=403,
+        )
+        results = list(
+            self.events_component.delete_events_by_zoom_id(
+                "user_id", ["1", "2", "3"], max_workers=1, stop_on_error=True
+            )
+        )
+        assert len(results) == 1
+        assert not results[0].ok
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_get_event_zoom_id(self):
         responses.add(
@@ -259,3 +451,14 @@ class TestEventsComponent(BaseTest):
         )
         event = self.events_component.get_current_event("user_id")
         assert event["subject"] == "Test Event 1"
+
+
+def test_current_event_filter_is_in_utc():
+    zurich = timezone(timedelta(hours=2))
+    parameters = build_current_event_parameters(
+        datetime(2023, 6, 5, 12, 0, 0, 123456, tzinfo=zurich)
+    )
+
+    assert parameters["$filter"] == (
+        "start/dateTime le '2023-06-05T10:00:00' and end/dateTime ge '2023-06-05T10:00:00'"
+    )
@@ -1,7 +1,11 @@
+import json
+
+import pytest
 import responses
 
 from ms_python_client.components.events.events_component import EventsComponent
 from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.utils.error import ConflictError
 from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
 
 
@@ -31,9 +35,23 @@ class TestEventsComponent(BaseTest):
         assert (
             responses.calls[0].request.url
             == f"{TEST_API_ENDPOINT}/users/user_id/calendar/events?key=value"
+            "&$select=id,subject,start,end,location"
         )
         assert responses.calls[0].request.headers["test"] == "test"
 
+    @responses.activate
+    def test_select_can_be_overridden(self):
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id",
+            json={"response": "ok"},
+        )
+        self.events_component.get_event("user_id", "event_id", {"$select": "body"})
+        self.events_component.get_event("user_id", "event_id", {"$select": ""})
+
+        assert responses.calls[0].request.url.endswith("event_id?$select=body")
+        assert responses.calls[1].request.url.endswith("event_id")
+
     @responses.activate
     def test_get_event(self):
         responses.add(
@@ -67,7 +85,7 @@ class TestEventsComponent(BaseTest):
         }
         event = self.events_component.create_event("user_id", data, headers)
         assert event["response"] == "ok"
-        assert responses.calls[0].request.body == b'{"key": "value"}'
+        assert json.loads(responses.calls[0].request.body) == {"key": "value"}
         assert responses.calls[0].request.headers["Content-Type"] == "application/json"
         assert responses.calls[0].request.headers["test"] == "test"
 
@@ -87,9 +105,85 @@ class TestEventsComponent(BaseTest):
         }
         event = self.events_component.update_event("user_id", "event_id", data, headers)
         assert event["response"] == "ok"
-        assert responses.calls[0].request.body == b'{"key": "value"}'
+        assert json.loads(responses.calls[0].request.body) == {"key": "value"}
         assert responses.calls[0].request.headers["Content-Type"] == "application/json"
         assert responses.calls[0].request.headers["test"] == "test"
+        assert responses.calls[0].request.headers["Prefer"] == "return=minimal"
+
+    @responses.activate
+    def test_update_event_minimal_response(self):
+        responses.add(
+            responses.PATCH,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id",
+            status=204,
+        )
+        headers = {"Prefer": 'outlook.timezone="Europe/Zurich"'}
+        event = self.events_component.update_event(
+            "user_id", "event_id", {"key": "value"}, headers
+        )
+        assert event == {}
+        assert (
+            responses.calls[0].request.headers["Prefer"]
+            == 'outlook.timezone="Europe/Zurich", return=minimal'
+        )
+
+    @responses.activate
+    def test_get_event_not_modified(self):
+        url = f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id"
+        event = {"@odata.etag": 'W/"1"', "id": "event_id", "subject": "Test"}
+        responses.add(responses.GET, url, json=event)
+        responses.add(responses.GET, url, status=304)
+
+        assert self.events_component.get_event("user_id", "event_id") == event
+        second = self.events_component.get_event("user_id", "event_id")
+
+        assert second == event
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == 'W/"1"'
+
+    @responses.activate
+    def test_get_event_variants_are_cached_apart(self):
+        url = f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id"
+        responses.add(responses.GET, url, json={"@odata.etag": 'W/"1"'})
+        self.events_component.get_event("user_id", "event_id")
+        self.events_component.get_event("user_id", "event_id", {"$select": "body"})
+        self.events_component.get_event(
+            "user_id", "event_id", extra_headers={"Prefer": "outlook.timezone=x"}
+        )
+        self.events_component.etag_cache = None
+        self.events_component.get_event("user_id", "event_id")
+
+        assert all(
+            "If-None-Match" not in call.request.headers for call in responses.calls
+        )
+
+    @responses.activate
+    def test_update_event_if_match(self):
+        url = f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id"
+        responses.add(responses.GET, url, json={"@odata.etag": 'W/"1"'})
+        responses.add(responses.PATCH, url, status=204)
+        self.events_component.get_event("user_id", "event_id")
+
+        self.events_component.update_event(
+            "user_id", "event_id", {"subject": "New"}, etag='W/"1"'
+        )
+        self.events_component.get_event("user_id", "event_id")
+
+        assert responses.calls[1].request.headers["If-Match"] == 'W/"1"'
+        assert "If-None-Match" not in responses.calls[2].request.headers
+
+    @responses.activate
+    def test_update_event_conflict(self):
+        responses.add(
+            responses.PATCH,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events/event_id",
+            json={"error": {"code": "ErrorIrresolvableConflict"}},
+            status=412,
+        )
+        with pytest.raises(ConflictError):
+            self.events_component.update_event(
+                "user_id", "event_id", {"subject": "New"}, etag='W/"1"'
+            )
 
     @responses.activate
     def test_delete_event(self):
@@ -103,3 +197,29 @@ class TestEventsComponent(BaseTest):
         }
         self.events_component.delete_event("user_id", "event_id", headers)
         assert responses.calls[0].request.headers["test"] == "test"
+
+    @responses.activate
+    def test_iter_events(self):
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={
+                "value": [{"id": "1"}],
+                "@odata.nextLink": f"{TEST_API_ENDPOINT}/users/user_id/calendar/events?$skip=1",
+            },
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"$top": "1", "$select": "id,subject,start,end,location"}
+                )
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id/calendar/events",
+            json={"value": [{"id": "2"}]},
+            match=[responses.matchers.query_param_matcher({"$skip": "1"})],
+        )
+        events = list(
+            self.events_component.iter_events("user_id", page_size=1, prefetch=True)
+        )
+        assert [event["id"] for event in events] == ["1", "2"]
@@ -0,0 +1,65 @@
+import json
+from datetime import datetime, timezone
+
+import responses
+
+from ms_python_client.components.subscriptions.subscriptions_component import (
+    SubscriptionsComponent,
+)
+from ms_python_client.ms_api_client import MSApiClient
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+
+
+class TestSubscriptionsComponent(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        ms_client = MSApiClient(self.config, api_endpoint=TEST_API_ENDPOINT)
+        self.subscriptions_component = SubscriptionsComponent(ms_client)
+
+    @responses.activate
+    def test_iter_subscriptions(self):
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/subscriptions",
+            json={"value": [{"id": "1"}, {"id": "2"}]},
+        )
+        subscriptions = list(self.subscriptions_component.iter_subscriptions())
+        assert subscriptions == [{"id": "1"}, {"id": "2"}]
+
+    @responses.activate
+    def test_create_subscription(self):
+        responses.add(
+            responses.POST,
+            f"{TEST_API_ENDPOINT}/subscriptions",
+            json={"id": "1"},
+            status=201,
+        )
+        body = {"resource": "/users/user_id/events", "changeType": "updated"}
+        subscription = self.subscriptions_component.create_subscription(body)
+
+        assert subscription == {"id": "1"}
+        assert json.loads(responses.calls[0].request.body) == body
+
+    @responses.activate
+    def test_renew_subscription(self):
+        responses.add(
+            responses.PATCH,
+            f"{TEST_API_ENDPOINT}/subscriptions/1",
+            json={"id": "1", "expirationDateTime": "2023-06-05T10:00:00Z"},
+        )
+        self.subscriptions_component.renew_subscription(
+            "1", datetime(2023, 6, 5, 12, tzinfo=timezone.utc)
+        )
+
+        assert json.loads(responses.calls[0].request.body) == {
+            "expirationDateTime": "2023-06-05T12:00:00Z"
+        }
+
+    @responses.activate
+    def test_delete_subscription(self):
+        responses.add(
+            responses.DELETE, f"{TEST_API_ENDPOINT}/subscriptions/1", status=204
+        )
+        self.subscriptions_component.delete_subscription("1")
+        assert responses.calls[0].request.method == "DELETE"
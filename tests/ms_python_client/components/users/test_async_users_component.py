@@ -0,0 +1,33 @@
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from ms_python_client.async_ms_api_client import AsyncMSApiClient
+from tests.ms_python_client.base_test_case import BaseTest, mock_msal
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+pytest.importorskip("httpx")
+
+
+class TestAsyncUsersComponent(BaseTest, IsolatedAsyncioTestCase):
+    @mock_msal("ms_python_client.async_ms_api_client.Oauth2Flow")
+    def setUp(self) -> None:
+        super().setUp()
+        self.server = LocalHttpServer().__enter__()
+        self.ms_client = AsyncMSApiClient(self.config, api_endpoint=self.server.url)
+
+    async def asyncTearDown(self) -> None:
+        await self.ms_client.aclose()
+        self.server.__exit__()
+
+    async def test_list_users(self):
+        self.server.add("GET", "/users", {"response": "ok"})
+        users_list = await self.ms_client.users.list_users(
+            {"user_id": "user_id"}, {"test": "test"}
+        )
+        assert users_list["response"] == "ok"
+        assert (
+            self.server.requests[0].path
+            == "/users?user_id=user_id&$select=id,displayName,mail,userPrincipalName"
+        )
+        assert self.server.requests[0].headers["test"] == "test"
@@ -31,5 +31,30 @@ class TestUsersComponent(BaseTest):
         assert (
             responses.calls[0].request.url
             == f"{TEST_API_ENDPOINT}/users?user_id=user_id"
+            "&$select=id,displayName,mail,userPrincipalName"
         )
         assert responses.calls[0].request.headers["test"] == "test"
+
+    @responses.activate
+    def test_iter_users(self):
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users",
+            json={
+                "value": [{"id": "1"}],
+                "@odata.nextLink": f"{TEST_API_ENDPOINT}/users?$skiptoken=abc",
+            },
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"$top": "1", "$select": "id,displayName,mail,userPrincipalName"}
+                )
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users",
+            json={"value": [{"id": "2"}]},
+            match=[responses.matchers.query_param_matcher({"$skiptoken": "abc"})],
+        )
+        users = list(self.events_component.iter_users(page_size=1))
+        assert [user["id"] for user in users] == ["1", "2"]
@@ -0,0 +1,133 @@
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+import pytest
+
+from tests.ms_python_client.local_http_server import LocalHttpServer, RecordedRequest
+
+h2_config = pytest.importorskip("h2.config")
+h2_connection = pytest.importorskip("h2.connection")
+h2_events = pytest.importorskip("h2.events")
+
+if TYPE_CHECKING:
+    from h2.connection import H2Connection
+
+
+class LocalH2Server(LocalHttpServer):
+    """HTTP/2 version of LocalHttpServer, without TLS (prior knowledge)
+
+    Every response is sent from its own thread after ``delay`` seconds, so
+    the requests multiplexed on a connection are answered concurrently.
+    """
+
+    def __init__(self, delay: float = 0) -> None:
+        super().__init__(delay)
+        self.server.server_close()
+        self.socket = socket.create_server(("127.0.0.1", 0))
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self._closed = threading.Event()
+
+    @property
+    def url(self) -> str:
+        host, port = self.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __exit__(self, *args) -> None:
+        self._closed.set()
+        self.socket.close()
+
+    def _serve(self) -> None:
+        while not self._closed.is_set():
+            try:
+                sock, _ = self.socket.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.connections += 1
+            threading.Thread(target=self._handle, args=(sock,), daemon=True).start()
+
+    def _handle(self, sock: socket.socket) -> None:
+        config = h2_config.H2Configuration(client_side=False)
+        conn = h2_connection.H2Connection(config=config)
+        send_lock = threading.Lock()
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        streams: dict[int, tuple[dict, bytearray]] = {}
+
+        with sock:
+            while not self._closed.is_set():
+                try:
+                    data = sock.recv(65535)
+                except OSError:
+                    return
+                if not data:
+                    return
+
+                with send_lock:
+                    events = conn.receive_data(data)
+                    for event in events:
+                        if isinstance(event, h2_events.RequestReceived):
+                            headers = {
+                                _decode(key): _decode(value)
+                                for key, value in event.headers
+                            }
+                            streams[event.stream_id] = (headers, bytearray())
+                        elif isinstance(event, h2_events.DataReceived):
+                            streams[event.stream_id][1].extend(event.data)
+                            conn.acknowledge_received_data(
+                                event.flow_controlled_length, event.stream_id
+                            )
+                        elif isinstance(event, h2_events.StreamEnded):
+                            headers, body = streams.pop(event.stream_id)
+                            threading.Thread(
+                                target=self._respond,
+                                args=(sock, conn, send_lock, event.stream_id),
+                                kwargs={"headers": headers, "body": bytes(body)},
+                                daemon=True,
+                            ).start()
+                    self._send(sock, conn)
+
+    def _respond(
+        self,
+        sock: socket.socket,
+        conn: "H2Connection",
+        send_lock: threading.Lock,
+        stream_id: int,
+        headers: dict,
+        body: bytes,
+    ) -> None:
+        method, path = headers[":method"], headers[":path"]
+        with self.lock:
+            self.requests.append(RecordedRequest(method, path, headers, body))
+        if self.delay:
+            time.sleep(self.delay)
+
+        status, content, extra_headers = self._next_response(
+            method, urlsplit(path).path
+        )
+        response_headers = [
+            (":status", str(status)),
+            ("content-type", "application/json"),
+            ("content-length", str(len(content))),
+        ] + [(key.lower(), value) for key, value in extra_headers.items()]
+        with send_lock:
+            conn.send_headers(stream_id, response_headers, end_stream=not content)
+            if content:
+                conn.send_data(stream_id, content, end_stream=True)
+            self._send(sock, conn)
+
+    @staticmethod
+    def _send(sock: socket.socket, conn: "H2Connection") -> None:
+        data = conn.data_to_send()
+        if data:
+            try:
+                sock.sendall(data)
+            except OSError:
+                pass
+
+
+def _decode(value: Optional[object]) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
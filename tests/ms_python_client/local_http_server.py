@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+
+class RecordedRequest:
+    def __init__(self, method: str, path: str, headers: dict, body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class LocalHttpServer:
+    """Small HTTP server standing in for Microsoft Graph in the tests
+
+    Responses are queued per method and path (without the query string). The
+    last queued response of a route is repeated once the others are consumed.
+    Every response is sent after ``delay`` seconds, to simulate latency.
+    """
+
+    def __init__(self, delay: float = 0) -> None:
+        self.routes: "dict[tuple[str, str], deque]" = defaultdict(deque)
+        self.requests: list[RecordedRequest] = []
+        self.delay = delay
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[Any] = None,
+        status: int = 200,
+        headers: Optional[dict] = None,
+    ) -> None:
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        with self.lock:
+            self.routes[(method, path)].append((status, body, headers or {}))
+
+    def __enter__(self) -> "LocalHttpServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _next_response(self, method: str, path: str) -> tuple:
+        with self.lock:
+            queue = self.routes.get((method, path))
+            if not queue:
+                return 404, b'{"error": "not found"}', {}
+            if len(queue) > 1:
+                return queue.popleft()
+            return queue[0]
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body in one write, without waiting for delayed ACKs
+            wbufsize = 1 << 16
+
+            def setup(self) -> None:
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                with server.lock:
+                    server.requests.append(
+                        RecordedRequest(
+                            self.command, self.path, dict(self.headers), body
+                        )
+                    )
+
+                if server.delay:
+                    time.sleep(server.delay)
+                path = urlsplit(self.path).path
+                status, content, headers = server._next_response(self.command, path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
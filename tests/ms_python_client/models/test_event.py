@@ -0,0 +1,98 @@
+import logging
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from ms_python_client.models import Event
+from ms_python_client.models.event import parse_graph_datetime
+from ms_python_client.services.zoom_id_index import ZOOM_ID_EXTENDED_PROPERTY_ID
+
+EVENT = {
+    "id": "AAMkAGI2TAAA=",
+    "subject": "Weekly meeting",
+    "body": {"contentType": "html", "content": "<html><body>Join</body></html>"},
+    "start": {"dateTime": "2023-06-05T10:00:00.0000000", "timeZone": "UTC"},
+    "end": {"dateTime": "2023-06-05T11:00:00.0000000", "timeZone": "UTC"},
+    "location": {"displayName": "https://cern.zoom.us/j/123456789"},
+    "attendees": [
+        {"type": "required", "emailAddress": {"address": "attendee@cern.ch"}}
+    ],
+    "organizer": {"emailAddress": {"address": "zoom.room@cern.ch"}},
+    "singleValueExtendedProperties": [
+        {"id": ZOOM_ID_EXTENDED_PROPERTY_ID, "value": "123456789"}
+    ],
+}
+
+
+def test_from_graph():
+    data = EVENT
+    event = Event.from_graph(data)
+
+    assert event.id == data["id"]
+    assert event.subject == "Weekly meeting"
+    assert event.start == datetime(2023, 6, 5, 10, tzinfo=timezone.utc)
+    assert event.end == datetime(2023, 6, 5, 11, tzinfo=timezone.utc)
+    assert event.location == "https://cern.zoom.us/j/123456789"
+    assert event.zoom_id == "123456789"
+
+
+def test_lazy_fields():
+    data = EVENT
+    event = Event.from_graph(data)
+
+    assert event.body == data["body"]
+    assert event.attendees == data["attendees"]
+    assert event.get("organizer") == data["organizer"]
+    assert event.get("seriesMasterId", "none") == "none"
+    assert not hasattr(event, "__dict__")
+
+
+def test_selected_fields_only():
+    event = Event.from_graph({"id": "1", "subject": "Test"})
+
+    assert event == Event("1", "Test")
+    assert event.start is None
+    assert event.zoom_id is None
+    assert event.body is None
+    assert event.attendees == []
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            {"dateTime": "2023-06-05T10:00:00.1234567", "timeZone": "UTC"},
+            datetime(2023, 6, 5, 10, 0, 0, 123456, tzinfo=timezone.utc),
+        ),
+        (
+            {"dateTime": "2023-06-05T10:00:00", "timeZone": "Romance Standard Time"},
+            datetime(2023, 6, 5, 10, tzinfo=ZoneInfo("Europe/Paris")),
+        ),
+        (
+            {"dateTime": "2023-06-05T10:00:00", "timeZone": "Pacific Standard Time"},
+            datetime(2023, 6, 5, 17, tzinfo=timezone.utc),
+        ),
+        (None, None),
+    ],
+)
+def test_parse_graph_datetime(value, expected):
+    assert parse_graph_datetime(value) == expected
+
+
+def test_iana_timezone():
+    date = parse_graph_datetime(
+        {"dateTime": "2023-06-05T10:00:00.0000000", "timeZone": "Europe/Zurich"}
+    )
+
+    assert date == datetime(2023, 6, 5, 8, tzinfo=timezone.utc)
+
+
+def test_unknown_timezone(caplog):
+    with caplog.at_level(logging.WARNING, logger="ms_python_client"):
+        date = parse_graph_datetime(
+            {"dateTime": "2023-06-05T10:00:00", "timeZone": "Nowhere Standard Time"}
+        )
+
+    assert date == datetime(2023, 6, 5, 10, tzinfo=timezone.utc)
+    assert "Nowhere Standard Time" in caplog.text
@@ -0,0 +1,19 @@
+from ms_python_client.models import User
+
+
+def test_from_graph():
+    data = {
+        "id": "1",
+        "displayName": "Test User",
+        "mail": "test.user@cern.ch",
+        "userPrincipalName": "tuser@cern.ch",
+        "jobTitle": "Engineer",
+    }
+    user = User.from_graph(data)
+
+    assert user == User(
+        "1", "Test User", "test.user@cern.ch", "tuser@cern.ch", {"jobTitle": "Engineer"}
+    )
+    assert user.get("jobTitle") == "Engineer"
+    assert user.get("officeLocation") is None
+    assert not hasattr(user, "__dict__")
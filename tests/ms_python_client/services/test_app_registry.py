@@ -0,0 +1,104 @@
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from msal.throttled_http_client import NormalizedResponse
+
+from ms_python_client.config import Config
+from ms_python_client.services.app_registry import clear_applications, get_application
+from ms_python_client.services.token_cache import FileTokenCache
+from tests.ms_python_client.base_test_case import BaseTest
+
+
+@patch("ms_python_client.services.app_registry.msal.PublicClientApplication")
+class TestAppRegistry(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        clear_applications()
+
+    def tearDown(self) -> None:
+        clear_applications()
+        super().tearDown()
+
+    def _config(self, **kwargs) -> Config:
+        kwargs.setdefault("azure_authority", self.config.AZURE_AUTHORITY)
+        return Config(
+            token_cache_file=os.path.join(self.test_dir, "token_cache.bin"),
+            azure_client_id=self.config.AZURE_CLIENT_ID,
+            azure_scope=self.config.AZURE_SCOPE,
+            **kwargs,
+        )
+
+    def test_application_is_shared(self, mock_app: MagicMock):
+        app_1 = get_application(self._config())
+        app_2 = get_application(self._config())
+
+        assert app_1 is app_2
+        mock_app.assert_called_once()
+        assert isinstance(mock_app.call_args.kwargs["token_cache"], FileTokenCache)
+        assert mock_app.call_args.kwargs["http_cache"] is None
+
+    def test_different_authorities(self, mock_app: MagicMock):
+        get_application(self._config())
+        get_application(
+            self._config(azure_authority="https://login.microsoftonline.com/other")
+        )
+        assert mock_app.call_count == 2
+
+    def test_authority_metadata_file(self, mock_app: MagicMock):
+        metadata_file = os.path.join(self.test_dir, "authority.json")
+        with open(metadata_file, "w", encoding="utf-8") as f:
+            json.dump({"discovery": "response"}, f)
+
+        get_application(self._config(azure_authority_metadata_file=metadata_file))
+
+        http_cache = mock_app.call_args.kwargs["http_cache"]
+        assert http_cache == {"discovery": "response"}
+
+    def test_authority_metadata_file_is_created(self, mock_app: MagicMock):
+        metadata_file = os.path.join(self.test_dir, "authority.json")
+        mock_app.side_effect = lambda *args, **kwargs: kwargs["http_cache"].update(
+            {"discovery": "response"}
+        )
+
+        get_application(self._config(azure_authority_metadata_file=metadata_file))
+
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"discovery": "response"}
+
+    def test_unreadable_authority_metadata_file(self, mock_app: MagicMock):
+        metadata_file = os.path.join(self.test_dir, "authority.json")
+        with open(metadata_file, "wb") as f:
+            f.write(b"not json")
+
+        get_application(self._config(azure_authority_metadata_file=metadata_file))
+
+        assert mock_app.call_args.kwargs["http_cache"] == {}
+
+    def test_authority_metadata_responses_round_trip(self, mock_app: MagicMock):
+        metadata_file = os.path.join(self.test_dir, "authority.json")
+        response = NormalizedResponse(
+            SimpleNamespace(
+                status_code=200,
+                text='{"tenant_discovery_endpoint": "https://login"}',
+                headers={"Content-Type": "application/json"},
+            )
+        )
+        http_cache = {"GET https://login hash=0 2xx": response, "_index_": ([], {})}
+        mock_app.side_effect = lambda *args, **kwargs: kwargs["http_cache"].update(
+            http_cache
+        )
+        get_application(self._config(azure_authority_metadata_file=metadata_file))
+        clear_applications()
+        mock_app.side_effect = None
+
+        get_application(self._config(azure_authority_metadata_file=metadata_file))
+
+        loaded = mock_app.call_args.kwargs["http_cache"]
+        cached = loaded["GET https://login hash=0 2xx"]
+        assert isinstance(cached, NormalizedResponse)
+        assert cached.status_code == 200
+        assert cached.text == response.text
+        assert cached.headers == {"content-type": "application/json"}
+        assert loaded["_index_"] == [[], {}]
@@ -0,0 +1,176 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import responses
+from requests import HTTPError
+
+from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.services.calendar_sync import (
+    ADDED,
+    DELETED,
+    UPDATED,
+    MemoryDeltaStateStore,
+    SQLiteDeltaStateStore,
+    format_utc,
+)
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+
+DELTA_URL = f"{TEST_API_ENDPOINT}/users/user_id/calendarView/delta"
+START = datetime(2023, 1, 1)
+END = datetime(2023, 2, 1)
+
+
+def test_format_utc():
+    assert format_utc(datetime(2023, 1, 1, 10)) == "2023-01-01T10:00:00Z"
+    paris = timezone(timedelta(hours=1))
+    assert format_utc(datetime(2023, 1, 1, 10, tzinfo=paris)) == "2023-01-01T09:00:00Z"
+
+
+class TestCalendarSync(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = MSApiClient(self.config, api_endpoint=TEST_API_ENDPOINT)
+        self.store = MemoryDeltaStateStore()
+        self.calendar_sync = self.client.calendar_sync(self.store, START, END)
+
+    def add_full_sync(self, events, delta_token="1"):
+        responses.add(
+            responses.GET,
+            DELTA_URL,
+            json={
+                "value": events[:1],
+                "@odata.nextLink": f"{DELTA_URL}?$skiptoken=page2",
+            },
+            match=[
+                responses.matchers.query_param_matcher(
+                    {
+                        "startDateTime": "2023-01-01T00:00:00Z",
+                        "endDateTime": "2023-02-01T00:00:00Z",
+                    }
+                )
+            ],
+        )
+        responses.add(
+            responses.GET,
+            DELTA_URL,
+            json={
+                "value": events[1:],
+                "@odata.deltaLink": f"{DELTA_URL}?$deltatoken={delta_token}",
+            },
+            match=[responses.matchers.query_param_matcher({"$skiptoken": "page2"})],
+        )
+
+    def add_delta(self, events, delta_token, next_delta_token, status=200):
+        responses.add(
+            responses.GET,
+            DELTA_URL,
+            status=status,
+            json={
+                "value": events,
+                "@odata.deltaLink": f"{DELTA_URL}?$deltatoken={next_delta_token}",
+            },
+            match=[
+                responses.matchers.query_param_matcher({"$deltatoken": delta_token})
+            ],
+        )
+
+    @responses.activate
+    def test_full_sync(self):
+        self.add_full_sync([{"id": "1"}, {"id": "2"}])
+        changes = list(self.calendar_sync.sync("user_id"))
+
+        assert [(change.kind, change.event_id) for change in changes] == [
+            (ADDED, "1"),
+            (ADDED, "2"),
+        ]
+        assert self.store.get_delta_link("user_id") == f"{DELTA_URL}?$deltatoken=1"
+        assert self.store.get_event_ids("user_id") == {"1", "2"}
+
+    @responses.activate
+    def test_incremental_sync(self):
+        self.add_full_sync([{"id": "1"}, {"id": "2"}])
+        self.add_delta(
+            [
+                {"id": "1", "subject": "New subject"},
+                {"id": "2", "@removed": {"reason": "deleted"}},
+                {"id": "3"},
+            ],
+            delta_token="1",
+            next_delta_token="2",
+        )
+        list(self.calendar_sync.sync("user_id"))
+        changes = list(self.calendar_sync.sync("user_id"))
+
+        assert [(change.kind, change.event_id) for change in changes] == [
+            (UPDATED, "1"),
+            (DELETED, "2"),
+            (ADDED, "3"),
+        ]
+        assert changes[0].event["subject"] == "New subject"
+        assert len(responses.calls) == 3
+        assert self.store.get_delta_link("user_id") == f"{DELTA_URL}?$deltatoken=2"
+        assert self.store.get_event_ids("user_id") == {"1", "3"}
+
+    @responses.activate
+    def test_delta_link_is_saved_once_consumed(self):
+        self.add_full_sync([{"id": "1"}, {"id": "2"}])
+        changes = self.calendar_sync.sync("user_id")
+        next(changes)
+
+        assert self.store.get_delta_link("user_id") is None
+
+    @responses.activate
+    def test_expired_delta_token_does_a_full_sync(self):
+        self.add_full_sync([{"id": "1"}, {"id": "2"}])
+        self.add_full_sync([{"id": "1"}, {"id": "3"}], delta_token="2")
+        self.add_delta([], delta_token="1", next_delta_token="", status=410)
+        list(self.calendar_sync.sync("user_id"))
+        changes = list(self.calendar_sync.sync("user_id"))
+
+        assert sorted((change.kind, change.event_id) for change in changes) == [
+            (ADDED, "3"),
+            (DELETED, "2"),
+            (UPDATED, "1"),
+        ]
+        assert self.store.get_delta_link("user_id") == f"{DELTA_URL}?$deltatoken=2"
+
+    @responses.activate
+    def test_other_errors_are_raised(self):
+        self.add_full_sync([{"id": "1"}])
+        self.add_delta([], delta_token="1", next_delta_token="", status=403)
+        list(self.calendar_sync.sync("user_id"))
+
+        with pytest.raises(HTTPError):
+            list(self.calendar_sync.sync("user_id"))
+
+    @responses.activate
+    def test_page_size(self):
+        self.add_full_sync([{"id": "1"}])
+        calendar_sync = self.client.calendar_sync(self.store, START, END, page_size=50)
+        list(calendar_sync.sync("user_id"))
+
+        for call in responses.calls:
+            assert call.request.headers["Prefer"] == "odata.maxpagesize=50"
+
+
+class TestSQLiteDeltaStateStore(BaseTest):
+    def test_state_survives_restarts(self):
+        path = os.path.join(self.test_dir, "sync.db")
+        store = SQLiteDeltaStateStore(path)
+        store.save("user_id", "link_1", ["1", "2"], [])
+        store.save("user_id", "link_2", ["3"], ["1"])
+        store.close()
+
+        store = SQLiteDeltaStateStore(path)
+        assert store.get_delta_link("user_id") == "link_2"
+        assert store.get_event_ids("user_id") == {"2", "3"}
+        assert store.contains("user_id", "3")
+        assert not store.contains("user_id", "1")
+        assert store.get_delta_link("other_user") is None
+
+        store.reset("user_id")
+        assert store.get_delta_link("user_id") is None
+        assert store.get_event_ids("user_id") == {"2", "3"}
+        store.close()
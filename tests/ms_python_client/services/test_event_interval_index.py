@@ -0,0 +1,175 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import responses
+
+from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.services.event_interval_index import (
+    EventIntervalIndex,
+    IntervalIndex,
+    get_event_interval,
+)
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+
+DELTA_URL = f"{TEST_API_ENDPOINT}/users/room/calendarView/delta"
+NOW = datetime(2023, 6, 5, 10, 30, tzinfo=timezone.utc)
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2023, 6, 5, hour, minute, tzinfo=timezone.utc)
+
+
+def build_event(event_id: str, start: datetime, end: datetime) -> dict:
+    return {
+        "id": event_id,
+        "subject": f"Meeting {event_id}",
+        "start": {
+            "dateTime": start.strftime("%Y-%m-%dT%H:%M:%S.0000000"),
+            "timeZone": "UTC",
+        },
+        "end": {
+            "dateTime": end.strftime("%Y-%m-%dT%H:%M:%S.0000000"),
+            "timeZone": "UTC",
+        },
+    }
+
+
+def test_lookups():
+    index = IntervalIndex()
+    index.set("1", at(9), at(10), {"id": "1"})
+    index.set("2", at(10), at(11), {"id": "2"})
+    index.set("3", at(13), at(14), {"id": "3"})
+
+    assert index.at(at(9, 59)) == [{"id": "1"}]
+    assert index.at(at(10)) == [{"id": "2"}]
+    assert index.at(at(12)) == []
+    assert index.next_after(at(10)) == {"id": "3"}
+    assert index.next_after(at(13)) is None
+
+    index.set("2", at(12), at(13), {"id": "2", "moved": True})
+    index.remove("1")
+    index.remove("unknown")
+    assert index.at(at(9, 30)) == []
+    assert index.next_after(at(8)) == {"id": "2", "moved": True}
+    assert len(index) == 2
+
+
+def test_same_as_brute_force():
+    generator = random.Random(1)
+    index = IntervalIndex()
+    intervals = {}
+    for step in range(500):
+        event_id = str(generator.randrange(60))
+        if generator.random() < 0.2:
+            index.remove(event_id)
+            intervals.pop(event_id, None)
+        else:
+            start = at(0) + timedelta(minutes=generator.randrange(0, 24 * 60, 15))
+            end = start + timedelta(minutes=generator.choice([15, 30, 60, 600]))
+            index.set(event_id, start, end, {"id": event_id})
+            intervals[event_id] = (start, end)
+
+        time = at(0) + timedelta(minutes=generator.randrange(0, 26 * 60, 5))
+        expected = {
+            key for key, (start, end) in intervals.items() if start <= time < end
+        }
+        assert {event["id"] for event in index.at(time)} == expected, step
+
+
+def test_get_event_interval():
+    zurich = {"dateTime": "2023-06-05T12:00:00.0000000", "timeZone": "Europe/Zurich"}
+    paris = {
+        "dateTime": "2023-06-05T13:00:00.0000000",
+        "timeZone": "Romance Standard Time",
+    }
+
+    assert get_event_interval({"start": zurich, "end": paris}) == (at(10), at(11))
+    assert get_event_interval({"id": "1"}) is None
+
+
+class TestEventIntervalIndex(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = NOW
+        client = MSApiClient(self.config, api_endpoint=TEST_API_ENDPOINT)
+        self.index = EventIntervalIndex(
+            client,
+            window=timedelta(days=4),
+            max_age=timedelta(minutes=5),
+            clock=lambda: self.now,
+        )
+
+    def add_page(self, events, match, delta_token):
+        responses.add(
+            responses.GET,
+            DELTA_URL,
+            json={
+                "value": events,
+                "@odata.deltaLink": f"{DELTA_URL}?$deltatoken={delta_token}",
+            },
+            match=[responses.matchers.query_param_matcher(match)],
+        )
+
+    @responses.activate
+    def test_refresh(self):
+        self.add_page(
+            [
+                build_event("1", at(10), at(11)),
+                build_event("2", at(11), at(12)),
+                {**build_event("3", at(10), at(12)), "isCancelled": True},
+            ],
+            {
+                "startDateTime": "2023-06-04T10:30:00Z",
+                "endDateTime": "2023-06-08T10:30:00Z",
+            },
+            "1",
+        )
+        self.add_page(
+            [
+                {"id": "1", "@removed": {"reason": "deleted"}},
+                build_event("4", at(10), at(11)),
+            ],
+            {"$deltatoken": "1"},
+            "2",
+        )
+
+        with pytest.raises(KeyError):
+            self.index.get_current_event("room")
+        assert self.index.refresh("room") == 3
+        assert self.index.get_current_event("room")["id"] == "1"
+        assert self.index.get_next_event("room")["id"] == "2"
+
+        self.now = NOW + timedelta(minutes=1)
+        assert self.index.refresh_due(["room"]) == []
+        self.now = NOW + timedelta(minutes=5)
+        assert [result.result for result in self.index.refresh_due(["room"])] == [2]
+        assert [event["id"] for event in self.index.get_current_events("room")] == ["4"]
+        assert self.index.get_current_event("room", at(11, 30))["id"] == "2"
+        assert self.index.get_current_event("room", at(12)) is None
+
+    @responses.activate
+    def test_window_moves(self):
+        self.add_page(
+            [build_event("1", at(10), at(11))],
+            {
+                "startDateTime": "2023-06-04T10:30:00Z",
+                "endDateTime": "2023-06-08T10:30:00Z",
+            },
+            "1",
+        )
+        self.add_page(
+            [],
+            {
+                "startDateTime": "2023-06-06T10:30:00Z",
+                "endDateTime": "2023-06-10T10:30:00Z",
+            },
+            "2",
+        )
+        self.index.refresh("room")
+        self.now = NOW + timedelta(days=2)
+        self.index.refresh("room")
+
+        assert self.index.get_current_event("room", at(10, 30)) is None
+        assert len(responses.calls) == 2
@@ -0,0 +1,97 @@
+import queue
+from typing import Optional
+
+import pytest
+import requests
+
+from ms_python_client.services.notification_receiver import (
+    NotificationHandler,
+    NotificationReceiver,
+)
+
+
+class GraphStandIn:
+    """Posts what Graph posts to a notification URL"""
+
+    def __init__(self, notification_url: str) -> None:
+        self.notification_url = notification_url
+
+    def validate(self, token: str) -> requests.Response:
+        return requests.post(
+            self.notification_url, params={"validationToken": token}, timeout=5
+        )
+
+    def notify(self, *notifications: dict, body: Optional[bytes] = None):
+        if body is None:
+            return requests.post(
+                self.notification_url, json={"value": notifications}, timeout=5
+            )
+        return requests.post(self.notification_url, data=body, timeout=5)
+
+
+def build_notification(client_state: str = "secret", event_id: str = "1") -> dict:
+    return {
+        "subscriptionId": "sub-room1",
+        "clientState": client_state,
+        "changeType": "updated",
+        "resource": f"Users/room1/Events/{event_id}",
+        "resourceData": {"@odata.type": "#Microsoft.Graph.Event", "id": event_id},
+        "tenantId": "tenant",
+    }
+
+
+@pytest.fixture
+def received():
+    return queue.Queue()
+
+
+@pytest.fixture
+def graph(received):
+    handler = NotificationHandler(["old-secret", "secret"], received)
+    with NotificationReceiver(handler) as receiver:
+        yield GraphStandIn(receiver.url)
+
+
+def test_validation(graph):
+    response = graph.validate("Validation: Testing client application <ok>")
+
+    assert response.status_code == 200
+    assert response.text == "Validation: Testing client application <ok>"
+    assert response.headers["Content-Type"] == "text/plain"
+
+
+def test_notifications_are_queued(graph, received):
+    response = graph.notify(
+        build_notification(event_id="1"),
+        build_notification("wrong", event_id="2"),
+        build_notification("old-secret", event_id="3"),
+    )
+
+    assert response.status_code == 202
+    ids = [received.get_nowait()["resourceData"]["id"] for _ in range(2)]
+    assert ids == ["1", "3"]
+    assert received.empty()
+
+
+def test_invalid_requests(graph, received):
+    assert graph.notify(body=b"<html>").status_code == 400
+    assert graph.notify(body=b'{"other": []}').status_code == 400
+    wrong_path = graph.notification_url.replace("/notifications", "/other")
+    assert requests.post(wrong_path, json={}, timeout=5).status_code == 404
+    assert received.empty()
+
+
+def test_callback_errors_do_not_stop_the_others():
+    calls = []
+
+    def callback(notification):
+        calls.append(notification)
+        raise RuntimeError("failure")
+
+    handler = NotificationHandler(["secret"], callback)
+    response = handler.handle(
+        "", b'{"value": [{"clientState": "secret"}, {"clientState": "secret"}]}'
+    )
+
+    assert response.status == 202
+    assert len(calls) == 2
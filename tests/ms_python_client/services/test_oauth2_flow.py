@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from unittest.mock import patch
+
+from ms_python_client.config import Config
+from ms_python_client.services.app_registry import clear_applications
+from ms_python_client.services.oauth2_flow import Oauth2Flow
+from tests.ms_python_client.base_test_case import BaseTest
+
+
+class FakeMsalApplication:
+    """Stub of msal.PublicClientApplication with a slow silent acquisition"""
+
+    def __init__(self, *args, **kwargs):
+        self.token_cache = kwargs.get("token_cache")
+        self.lock = threading.Lock()
+        self.silent_calls = 0
+
+    def get_accounts(self):
+        return [{"username": "username"}]
+
+    def acquire_token_silent(self, **kwargs):
+        with self.lock:
+            self.silent_calls += 1
+        time.sleep(0.2)
+        return {"access_token": "token", "expires_in": 3600}
+
+
+class FakeConfidentialApplication:
+    """Stub of msal.ConfidentialClientApplication"""
+
+    def __init__(self, *args, **kwargs):
+        self.token_cache = kwargs.get("token_cache")
+        self.client_credential = kwargs.get("client_credential")
+        self.cached = False
+        self.client_calls = 0
+
+    def acquire_token_silent(self, **kwargs):
+        if self.cached:
+            return {"access_token": "app_token", "expires_in": 3000}
+        return None
+
+    def acquire_token_for_client(self, **kwargs):
+        self.client_calls += 1
+        self.cached = True
+        return {"access_token": "app_token", "expires_in": 3599}
+
+    def initiate_device_flow(self, **kwargs):
+        raise AssertionError("App-only authentication must not need a user")
+
+
+class TestOauth2Flow(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        clear_applications()
+        self.config = Config(
+            token_cache_file=os.path.join(self.test_dir, "token_cache.bin"),
+            azure_authority=self.config.AZURE_AUTHORITY,
+            azure_client_id=self.config.AZURE_CLIENT_ID,
+            azure_scope=self.config.AZURE_SCOPE,
+        )
+
+    def tearDown(self) -> None:
+        clear_applications()
+        super().tearDown()
+
+    @patch(
+        "ms_python_client.services.app_registry.msal.PublicClientApplication",
+        FakeMsalApplication,
+    )
+    def test_get_access_token(self):
+        oauth = Oauth2Flow(self.config)
+        assert oauth.get_access_token() == ("token", "username")
+        assert oauth.get_access_token_with_expiry() == ("token", 3600)
+
+    @patch(
+        "ms_python_client.services.app_registry.msal.PublicClientApplication",
+        FakeMsalApplication,
+    )
+    def test_concurrent_acquisitions_are_single_flight(self):
+        oauth = Oauth2Flow(self.config)
+        barrier = threading.Barrier(50)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(oauth.get_access_token())
+
+        threads = [threading.Thread(target=worker) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [("token", "username")] * 50
+        assert oauth.app.silent_calls == 1
+
+
+@patch(
+    "ms_python_client.services.app_registry.msal.ConfidentialClientApplication",
+    FakeConfidentialApplication,
+)
+class TestOauth2FlowAppOnly(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        clear_applications()
+
+    def tearDown(self) -> None:
+        clear_applications()
+        super().tearDown()
+
+    def _config(self, **kwargs) -> Config:
+        return Config(
+            token_cache_file=os.path.join(self.test_dir, "token_cache.bin"),
+            azure_authority=self.config.AZURE_AUTHORITY,
+            azure_client_id=self.config.AZURE_CLIENT_ID,
+            azure_scope=["https://graph.microsoft.com/.default"],
+            **kwargs,
+        )
+
+    def test_client_secret(self):
+        oauth = Oauth2Flow(self._config(azure_client_secret="secret"))
+        assert oauth.app.client_credential == "secret"
+        assert oauth.get_access_token_with_expiry() == ("app_token", 3599)
+        assert oauth.get_access_token() == ("app_token", self.config.AZURE_CLIENT_ID)
+        assert oauth.app.client_calls == 1
+
+    def test_client_certificate(self):
+        key_file = os.path.join(self.test_dir, "key.pem")
+        with open(key_file, "w", encoding="utf-8") as f:
+            f.write("private key")
+
+        oauth = Oauth2Flow(
+            self._config(
+                azure_client_certificate_file=key_file,
+                azure_client_certificate_thumbprint="thumbprint",
+            )
+        )
+        assert oauth.app.client_credential == {
+            "private_key": "private key",
+            "thumbprint": "thumbprint",
+        }
+        assert oauth.get_access_token()[0] == "app_token"
@@ -0,0 +1,150 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import responses
+
+from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.services.subscription_manager import (
+    SubscriptionManager,
+    parse_expiration,
+)
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+
+NOW = datetime(2023, 6, 5, 10, tzinfo=timezone.utc)
+SUBSCRIPTIONS_URL = f"{TEST_API_ENDPOINT}/subscriptions"
+NOTIFICATION_URL = "https://example.cern.ch/notifications"
+
+
+def created(request):
+    body = json.loads(request.body)
+    mailbox = body["resource"].split("/")[2]
+    subscription = {"id": f"sub-{mailbox}", **body}
+    return 201, {}, json.dumps(subscription)
+
+
+class TestSubscriptionManager(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = NOW
+        ms_client = MSApiClient(self.config, api_endpoint=TEST_API_ENDPOINT)
+        self.manager = SubscriptionManager(
+            ms_client,
+            NOTIFICATION_URL,
+            "secret",
+            lifetime=timedelta(days=2),
+            renew_before=timedelta(hours=6),
+            clock=lambda: self.now,
+        )
+
+    @responses.activate
+    def test_subscribe(self):
+        responses.add_callback(responses.POST, SUBSCRIPTIONS_URL, callback=created)
+        results = self.manager.subscribe(["room1", "room2"])
+        again = self.manager.subscribe(["room1", "room2", "room3"])
+
+        assert all(result.ok for result in results + again)
+        assert len(responses.calls) == 3
+        body = json.loads(responses.calls[0].request.body)
+        assert body["notificationUrl"] == NOTIFICATION_URL
+        assert body["clientState"] == "secret"
+        assert body["changeType"] == "created,updated,deleted"
+        assert body["expirationDateTime"] == "2023-06-07T10:00:00Z"
+        assert self.manager.get_mailbox("sub-room3") == "room3"
+        assert self.manager.subscriptions["room1"].expiration == NOW + timedelta(days=2)
+
+    @responses.activate
+    def test_renew_due(self):
+        responses.add_callback(responses.POST, SUBSCRIPTIONS_URL, callback=created)
+        responses.add(
+            responses.PATCH,
+            f"{SUBSCRIPTIONS_URL}/sub-room1",
+            json={"id": "sub-room1", "expirationDateTime": "2023-06-08T20:00:00Z"},
+        )
+        responses.add(responses.PATCH, f"{SUBSCRIPTIONS_URL}/sub-room2", status=404)
+        self.manager.subscribe(["room1", "room2"])
+
+        self.now = NOW + timedelta(hours=40)
+        assert self.manager.renew_due() == []
+        self.now = NOW + timedelta(hours=45)
+        results = self.manager.renew_due()
+
+        assert all(result.ok for result in results)
+        assert self.manager.subscriptions["room1"].expiration == datetime(
+            2023, 6, 8, 20, tzinfo=timezone.utc
+        )
+        # Deleted by Graph, so created again
+        methods = [call.request.method for call in responses.calls]
+        assert methods.count("POST") == 3
+        assert self.manager.subscriptions["room2"].expiration == self.now + timedelta(
+            days=2
+        )
+
+    @responses.activate
+    def test_load_and_unsubscribe(self):
+        responses.add(
+            responses.GET,
+            SUBSCRIPTIONS_URL,
+            json={
+                "value": [
+                    {
+                        "id": "1",
+                        "resource": "Users/room1/Events",
+                        "notificationUrl": NOTIFICATION_URL,
+                        "expirationDateTime": "2023-06-06T10:00:00.1234567Z",
+                    },
+                    {
+                        "id": "2",
+                        "resource": "/users/room2/events",
+                        "notificationUrl": "https://other.cern.ch",
+                        "expirationDateTime": "2023-06-06T10:00:00Z",
+                    },
+                ]
+            },
+        )
+        responses.add(responses.DELETE, f"{SUBSCRIPTIONS_URL}/1", status=204)
+
+        assert self.manager.load() == 1
+        assert self.manager.get_mailbox("1") == "room1"
+        assert [result.ok for result in self.manager.unsubscribe_all()] == [True]
+        assert self.manager.subscriptions == {}
+
+    @responses.activate
+    def test_lifecycle_notifications(self):
+        responses.add_callback(responses.POST, SUBSCRIPTIONS_URL, callback=created)
+        responses.add(
+            responses.PATCH,
+            f"{SUBSCRIPTIONS_URL}/sub-room1",
+            json={"id": "sub-room1", "expirationDateTime": "2023-06-08T20:00:00Z"},
+        )
+        self.manager.subscribe(["room1"])
+
+        self.manager.handle_lifecycle_notification(
+            {"subscriptionId": "sub-room1", "lifecycleEvent": "reauthorizationRequired"}
+        )
+        self.manager.handle_lifecycle_notification(
+            {"subscriptionId": "sub-room1", "lifecycleEvent": "subscriptionRemoved"}
+        )
+        self.manager.handle_lifecycle_notification(
+            {"subscriptionId": "unknown", "lifecycleEvent": "subscriptionRemoved"}
+        )
+
+        assert [call.request.method for call in responses.calls] == [
+            "POST",
+            "PATCH",
+            "POST",
+        ]
+
+    def test_failures_are_returned(self):
+        with responses.RequestsMock() as mock:
+            mock.add(responses.POST, SUBSCRIPTIONS_URL, status=400)
+            results = self.manager.subscribe(["room1"])
+
+        assert not results[0].ok
+        assert self.manager.subscriptions == {}
+
+
+def test_parse_expiration():
+    assert parse_expiration("2023-06-05T10:00:00.1234567Z") == datetime(
+        2023, 6, 5, 10, 0, 0, 123456, tzinfo=timezone.utc
+    )
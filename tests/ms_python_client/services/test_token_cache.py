@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+
+from ms_python_client.services.token_cache import FileTokenCache
+from tests.ms_python_client.base_test_case import BaseTest
+
+CACHE_STATE = {
+    "Account": {
+        "key": {
+            "home_account_id": "account",
+            "environment": "login.microsoftonline.com",
+            "realm": "tenant",
+            "username": "username",
+        }
+    }
+}
+
+
+def change_state(cache: FileTokenCache) -> None:
+    cache.deserialize(json.dumps(CACHE_STATE))
+    cache.has_state_changed = True
+
+
+class TestFileTokenCache(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_file = os.path.join(self.test_dir, "token_cache.bin")
+
+    def test_write_through(self):
+        cache = FileTokenCache(self.cache_file)
+        with cache.locked():
+            change_state(cache)
+
+        assert not cache.has_state_changed
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            assert json.loads(f.read())["Account"]["key"]["username"] == "username"
+        assert sorted(os.listdir(self.test_dir)) == [
+            ".env.sample",
+            "token_cache.bin",
+            "token_cache.bin.lock",
+        ]
+
+    def test_no_write_without_changes(self):
+        cache = FileTokenCache(self.cache_file)
+        with cache.locked():
+            pass
+        cache.persist()
+        assert not os.path.exists(self.cache_file)
+
+    def test_persist(self):
+        cache = FileTokenCache(self.cache_file)
+        change_state(cache)
+        cache.persist()
+        assert os.path.exists(self.cache_file)
+
+    def test_reload_when_file_changes(self):
+        worker_1 = FileTokenCache(self.cache_file)
+        worker_2 = FileTokenCache(self.cache_file)
+
+        with worker_1.locked():
+            change_state(worker_1)
+
+        assert "Account" not in json.loads(worker_2.serialize())
+        with worker_2.locked():
+            assert "Account" in json.loads(worker_2.serialize())
+        assert not worker_2.reload_if_changed()
+
+    def test_locked_is_exclusive(self):
+        cache_1 = FileTokenCache(self.cache_file)
+        cache_2 = FileTokenCache(self.cache_file)
+        inside = []
+        overlaps = []
+
+        def worker(cache):
+            for _ in range(20):
+                with cache.locked():
+                    inside.append(1)
+                    if len(inside) > 1:
+                        overlaps.append(1)
+                    inside.pop()
+
+        threads = [
+            threading.Thread(target=worker, args=(cache,))
+            for cache in (cache_1, cache_2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not overlaps
@@ -0,0 +1,75 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ms_python_client.services.token_holder import AccessTokenHolder
+
+
+class TestAccessTokenHolder(unittest.TestCase):
+    def test_get_token_is_cached(self):
+        fetch_token = MagicMock(return_value=("token", 3600))
+        holder = AccessTokenHolder(fetch_token)
+
+        assert holder.get_token() == "token"
+        assert holder.get_token() == "token"
+        fetch_token.assert_called_once()
+        holder.close()
+
+    def test_get_token_refreshes_when_expired(self):
+        fetch_token = MagicMock(side_effect=[("token_1", 3600), ("token_2", 3600)])
+        holder = AccessTokenHolder(fetch_token)
+
+        with patch(
+            "ms_python_client.services.token_holder.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 0
+            assert holder.get_token() == "token_1"
+            mock_monotonic.return_value = 3600
+            assert holder.get_token() == "token_2"
+
+        assert fetch_token.call_count == 2
+        holder.close()
+
+    def test_background_refresh(self):
+        refreshed = threading.Event()
+        tokens = iter([("token_1", 2), ("token_2", 3600)])
+
+        def fetch_token():
+            token = next(tokens)
+            if token[0] == "token_2":
+                refreshed.set()
+            return token
+
+        holder = AccessTokenHolder(fetch_token, refresh_margin=300)
+        holder.get_token()
+
+        assert refreshed.wait(timeout=5)
+        assert holder.get_token() == "token_2"
+        holder.close()
+
+    def test_background_refresh_failure_is_retried(self):
+        refreshed = threading.Event()
+        calls = []
+
+        def fetch_token():
+            calls.append(1)
+            if len(calls) == 2:
+                raise ValueError("AAD unavailable")
+            if len(calls) == 3:
+                refreshed.set()
+            return "token", 2
+
+        holder = AccessTokenHolder(fetch_token, retry_interval=0)
+        holder.get_token()
+
+        assert refreshed.wait(timeout=5)
+        holder.close()
+
+    def test_close_cancels_timer(self):
+        fetch_token = MagicMock(return_value=("token", 3600))
+        holder = AccessTokenHolder(fetch_token)
+        holder.get_token()
+        holder.close()
+
+        # pylint: disable=protected-access
+        assert holder._timer is None
@@ -0,0 +1,61 @@
+import os
+
+from ms_python_client.services.zoom_id_index import (
+    MemoryZoomIdIndex,
+    SQLiteZoomIdIndex,
+    ZoomIdIndex,
+    find_zoom_id,
+)
+from ms_python_client.utils.event_generator import ZOOM_ID_EXTENDED_PROPERTY_ID
+from tests.ms_python_client.base_test_case import BaseTest
+
+
+def check_index(index: ZoomIdIndex):
+    index.set("user_1", "zoom_1", "event_1")
+    index.set("user_1", "zoom_2", "event_2")
+    index.set("user_2", "zoom_1", "event_3")
+    assert index.get("user_1", "zoom_1") == "event_1"
+    assert index.get("user_2", "zoom_1") == "event_3"
+    assert index.get("user_2", "zoom_2") is None
+
+    index.set("user_1", "zoom_1", "event_4")
+    assert index.get("user_1", "zoom_1") == "event_4"
+
+    index.discard("user_1", "zoom_1")
+    assert index.get("user_1", "zoom_1") is None
+
+    index.discard_event("user_1", "event_2")
+    assert index.get("user_1", "zoom_2") is None
+    assert index.get("user_2", "zoom_1") == "event_3"
+
+
+def test_find_zoom_id():
+    event = {
+        "singleValueExtendedProperties": [
+            {"id": "other", "value": "other"},
+            {"id": ZOOM_ID_EXTENDED_PROPERTY_ID, "value": "123"},
+        ]
+    }
+    assert find_zoom_id(event) == "123"
+    assert find_zoom_id({"id": "event_id"}) is None
+
+
+def test_memory_index():
+    check_index(MemoryZoomIdIndex())
+
+
+class TestSQLiteZoomIdIndex(BaseTest):
+    def test_sqlite_index(self):
+        index = SQLiteZoomIdIndex(os.path.join(self.test_dir, "index.db"))
+        check_index(index)
+        index.close()
+
+    def test_index_survives_restarts(self):
+        path = os.path.join(self.test_dir, "index.db")
+        index = SQLiteZoomIdIndex(path)
+        index.set("user_1", "zoom_1", "event_1")
+        index.close()
+
+        index = SQLiteZoomIdIndex(path)
+        assert index.get("user_1", "zoom_1") == "event_1"
+        index.close()
@@ -1,8 +1,15 @@
+import threading
+import time
 import unittest
+from json import loads
+from unittest.mock import Mock, patch
 
+import pytest
 import responses
+from requests import HTTPError, Response
 
 from ms_python_client.api_client import ApiClient
+from ms_python_client.utils.concurrency_limiter import MailboxConcurrencyLimiter
 from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT
 
 
@@ -30,6 +37,15 @@ def test_api_client_build_headers_extra_no_duplicates():
     }
 
 
+def test_api_client_build_url():
+    api_client = ApiClient(TEST_API_ENDPOINT)
+    assert api_client.build_url("/test") == f"{TEST_API_ENDPOINT}/test"
+    assert (
+        api_client.build_url("https://graph.microsoft.com/v1.0/test?$skip=10")
+        == "https://graph.microsoft.com/v1.0/test?$skip=10"
+    )
+
+
 class TestApiClient(unittest.TestCase):
     def setUp(self) -> None:
         self.api_client = ApiClient(TEST_API_ENDPOINT)
@@ -74,7 +90,7 @@ class TestApiClient(unittest.TestCase):
         )
 
         assert response.status_code == 200
-        assert response.request.body == b'{"test": "test"}'
+        assert loads(response.request.body) == json
         assert response.request.headers["Content-Type"] == "application/json"
 
     @responses.activate
@@ -104,7 +120,7 @@ class TestApiClient(unittest.TestCase):
         )
 
         assert response.status_code == 200
-        assert response.request.body == b'{"test": "test"}'
+        assert loads(response.request.body) == json
         assert response.request.headers["Content-Type"] == "application/json"
 
     @responses.activate
@@ -134,7 +150,7 @@ class TestApiClient(unittest.TestCase):
         )
 
         assert response.status_code == 200
-        assert response.request.body == b'{"test": "test"}'
+        assert loads(response.request.body) == json
         assert response.request.headers["Content-Type"] == "application/json"
 
     @responses.activate
@@ -147,3 +163,115 @@ class TestApiClient(unittest.TestCase):
         )
         with self.assertRaises(Exception):
             self.api_client.make_delete_request("/test", headers=self.headers)
+
+
+@patch("ms_python_client.api_client.time.sleep")
+class TestApiClientRetries(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api_client = ApiClient(TEST_API_ENDPOINT)
+        self.url = f"{TEST_API_ENDPOINT}/test"
+
+    @responses.activate
+    def test_retry_after_is_followed(self, sleep):
+        responses.add(responses.GET, self.url, status=429, headers={"Retry-After": "5"})
+        responses.add(responses.GET, self.url, json={"response": "ok"})
+        response = self.api_client.make_get_request("/test", headers={})
+
+        assert response.status_code == 200
+        assert 5 <= sleep.call_args[0][0] <= 5 * 1.25
+        assert self.api_client.retry_stats.retry_after_waits == 1
+
+    @responses.activate
+    def test_retry_after_is_shared(self, sleep):
+        rate_limiter = Mock()
+        self.api_client.rate_limiter = rate_limiter
+        responses.add(
+            responses.GET,
+            f"{TEST_API_ENDPOINT}/users/user_id",
+            status=429,
+            headers={"Retry-After": "5"},
+        )
+        responses.add(responses.GET, f"{TEST_API_ENDPOINT}/users/user_id", json={})
+        self.api_client.make_get_request("/users/user_id", headers={})
+
+        assert rate_limiter.acquire.call_count == 2
+        rate_limiter.throttled.assert_called_once_with(
+            f"{TEST_API_ENDPOINT}/users/user_id", 5
+        )
+
+    @responses.activate
+    def test_retries_are_bounded(self, sleep):
+        responses.add(responses.GET, self.url, status=503)
+        with pytest.raises(HTTPError):
+            self.api_client.make_get_request("/test", headers={})
+
+        assert len(responses.calls) == 4
+        assert sleep.call_count == 3
+        assert self.api_client.retry_stats.exhausted == 1
+
+    @responses.activate
+    def test_patch_is_retried(self, sleep):
+        responses.add(responses.PATCH, self.url, status=502)
+        responses.add(responses.PATCH, self.url, json={"response": "ok"})
+        response = self.api_client.make_patch_request("/test", headers={}, json={})
+
+        assert response.status_code == 200
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_post_is_only_retried_when_throttled(self, sleep):
+        responses.add(responses.POST, self.url, status=503)
+        with pytest.raises(HTTPError):
+            self.api_client.make_post_request("/test", headers={}, json={})
+        assert len(responses.calls) == 1
+
+        responses.replace(responses.POST, self.url, status=429)
+        responses.add(responses.POST, self.url, json={"response": "ok"}, status=201)
+        response = self.api_client.make_post_request("/test", headers={}, json={})
+        assert response.status_code == 201
+
+    @responses.activate
+    def test_idempotent_post_is_retried(self, sleep):
+        responses.add(responses.POST, self.url, status=503)
+        responses.add(responses.POST, self.url, json={"response": "ok"})
+        response = self.api_client.make_post_request(
+            "/test", headers={}, json={}, idempotent=True
+        )
+
+        assert response.status_code == 200
+        assert self.api_client.retry_stats.retries == 1
+
+
+def test_requests_are_limited_per_mailbox():
+    limiter = MailboxConcurrencyLimiter(initial_limit=2, max_limit=2)
+    api_client = ApiClient(TEST_API_ENDPOINT, concurrency_limiter=limiter)
+    lock = threading.Lock()
+    running: dict = {}
+    max_running: dict = {}
+
+    def request(method, url, **kwargs):
+        mailbox = url.split("/")[-2]
+        with lock:
+            running[mailbox] = running.get(mailbox, 0) + 1
+            max_running[mailbox] = max(max_running.get(mailbox, 0), running[mailbox])
+        time.sleep(0.01)
+        with lock:
+            running[mailbox] -= 1
+        response = Response()
+        response.status_code = 200
+        return response
+
+    with patch.object(api_client.session, "request", side_effect=request):
+        threads = [
+            threading.Thread(
+                target=api_client.make_get_request,
+                args=(f"/users/{mailbox}/events", {}),
+            )
+            for mailbox in ["a", "b"] * 6
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert max_running == {"a": 2, "b": 2}
@@ -0,0 +1,131 @@
+import asyncio
+import socket
+import unittest
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError
+
+from ms_python_client.async_api_client import AsyncApiClient
+from ms_python_client.utils.retry import RetryPolicy
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+pytest.importorskip("httpx")
+
+
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = LocalHttpServer().__enter__()
+        self.api_client = AsyncApiClient(self.server.url)
+        self.headers = self.api_client.build_headers({"test": "test"})
+
+    async def asyncTearDown(self) -> None:
+        await self.api_client.aclose()
+        self.server.__exit__()
+
+    async def test_make_get_request(self):
+        self.server.add("GET", "/test", {"response": "ok"})
+        response = await self.api_client.make_get_request(
+            "/test?a=b", headers=self.headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"response": "ok"}
+        assert response.request.url == f"{self.server.url}/test?a=b"
+        assert self.server.requests[0].headers["test"] == "test"
+
+    async def test_make_get_request_error(self):
+        self.server.add("GET", "/test", {"response": "not-ok"}, status=400)
+        with pytest.raises(HTTPError):
+            await self.api_client.make_get_request("/test", headers=self.headers)
+
+    async def test_make_post_request(self):
+        self.server.add("POST", "/test", {"response": "ok"}, status=201)
+        response = await self.api_client.make_post_request(
+            "/test", headers=self.headers, json={"test": "test"}
+        )
+
+        assert response.status_code == 201
+        assert self.server.requests[0].json() == {"test": "test"}
+
+    async def test_make_patch_request(self):
+        self.server.add("PATCH", "/test", {"response": "ok"})
+        response = await self.api_client.make_patch_request(
+            "/test", headers=self.headers, json={"test": "test"}
+        )
+
+        assert response.status_code == 200
+        assert self.server.requests[0].json() == {"test": "test"}
+
+    async def test_make_delete_request(self):
+        self.server.add("DELETE", "/test", status=204)
+        response = await self.api_client.make_delete_request(
+            "/test", headers=self.headers
+        )
+
+        assert response.status_code == 204
+
+    async def test_get_is_retried(self):
+        self.server.add("GET", "/test", status=503, headers={"Retry-After": "0"})
+        self.server.add("GET", "/test", {"response": "ok"})
+        response = await self.api_client.make_get_request("/test", headers=self.headers)
+
+        assert response.status_code == 200
+        assert len(self.server.requests) == 2
+
+    async def test_get_retries_are_bounded(self):
+        self.server.add("GET", "/test", status=429, headers={"Retry-After": "0"})
+        with pytest.raises(HTTPError):
+            await self.api_client.make_get_request("/test", headers=self.headers)
+        assert len(self.server.requests) == 4
+
+    async def test_post_is_not_retried(self):
+        self.server.add("POST", "/test", status=503, headers={"Retry-After": "0"})
+        with pytest.raises(HTTPError):
+            await self.api_client.make_post_request("/test", headers=self.headers)
+        assert len(self.server.requests) == 1
+
+    async def test_throttled_post_is_retried(self):
+        self.server.add("POST", "/test", status=429, headers={"Retry-After": "0"})
+        self.server.add("POST", "/test", {"response": "ok"}, status=201)
+        response = await self.api_client.make_post_request(
+            "/test", headers=self.headers
+        )
+
+        assert response.status_code == 201
+        assert self.api_client.retry_stats.retry_after_waits == 1
+
+    async def test_idempotent_post_is_retried(self):
+        self.server.add("POST", "/test", status=503, headers={"Retry-After": "0"})
+        self.server.add("POST", "/test", {"response": "ok"})
+        response = await self.api_client.make_post_request(
+            "/test", headers=self.headers, idempotent=True
+        )
+
+        assert response.status_code == 200
+        assert len(self.server.requests) == 2
+
+    async def test_concurrent_requests(self):
+        self.server.add("GET", "/test", {"response": "ok"})
+        responses = await asyncio.gather(
+            *[
+                self.api_client.make_get_request("/test", headers=self.headers)
+                for _ in range(50)
+            ]
+        )
+        assert all(response.status_code == 200 for response in responses)
+
+
+class TestAsyncApiClientConnectionError(unittest.IsolatedAsyncioTestCase):
+    async def test_connection_error(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        api_client = AsyncApiClient(
+            f"http://127.0.0.1:{port}", retry_policy=RetryPolicy(backoff_factor=0)
+        )
+        with pytest.raises(RequestsConnectionError):
+            await api_client.make_get_request("/test", headers={})
+        await api_client.aclose()
+        assert api_client.retry_stats.retries == 3
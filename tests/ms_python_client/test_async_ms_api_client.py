@@ -0,0 +1,78 @@
+import os
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from ms_python_client.async_cern_ms_api_client import AsyncCERNMSApiClient
+from ms_python_client.async_ms_api_client import AsyncMSApiClient
+from ms_python_client.components.events.async_cern_events_component import (
+    AsyncCERNEventsComponents,
+)
+from tests.ms_python_client.base_test_case import MOCK_TOKEN, BaseTest, mock_msal
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+pytest.importorskip("httpx")
+
+ASYNC_OAUTH = "ms_python_client.async_ms_api_client.Oauth2Flow"
+
+
+class TestAsyncMSApiClientInit(BaseTest, IsolatedAsyncioTestCase):
+    @mock_msal(ASYNC_OAUTH)
+    def test_init_from_dotenv(self):
+        client = AsyncMSApiClient.init_from_dotenv(custom_dotenv=self.env_file)
+        assert client is not None
+
+    @mock_msal(ASYNC_OAUTH)
+    def test_cern_init_from_dotenv(self):
+        client = AsyncCERNMSApiClient.init_from_dotenv(custom_dotenv=self.env_file)
+        assert isinstance(client.events, AsyncCERNEventsComponents)
+
+    async def test_with_token(self):
+        os.environ["MS_ACCESS_TOKEN"] = "test_token"
+        try:
+            async with AsyncMSApiClient(self.config) as client:
+                headers = await client.build_headers()
+        finally:
+            os.environ.pop("MS_ACCESS_TOKEN")
+        assert headers["Authorization"] == "Bearer test_token"
+
+
+class TestAsyncMSApiClient(BaseTest, IsolatedAsyncioTestCase):
+    @mock_msal(ASYNC_OAUTH)
+    def setUp(self) -> None:
+        super().setUp()
+        self.server = LocalHttpServer().__enter__()
+        self.client = AsyncMSApiClient(self.config, api_endpoint=self.server.url)
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+        self.server.__exit__()
+
+    async def test_build_headers(self):
+        headers = await self.client.build_headers({"test": "test"})
+        assert headers["Authorization"] == f"Bearer {MOCK_TOKEN}"
+        assert headers["test"] == "test"
+
+    async def test_get_request(self):
+        self.server.add("GET", "/ms", {"response": "ok"})
+        response = await self.client.make_get_request("/ms", {"test": "test"})
+        assert response.status_code == 200
+        assert self.server.requests[0].path == "/ms?test=test"
+        assert (
+            self.server.requests[0].headers["Authorization"] == f"Bearer {MOCK_TOKEN}"
+        )
+
+    async def test_post_request(self):
+        self.server.add("POST", "/ms", {"response": "ok"})
+        response = await self.client.make_post_request("/ms", {})
+        assert response.status_code == 200
+
+    async def test_patch_request(self):
+        self.server.add("PATCH", "/ms", {"response": "ok"})
+        response = await self.client.make_patch_request("/ms", {})
+        assert response.status_code == 200
+
+    async def test_delete_request(self):
+        self.server.add("DELETE", "/ms", status=204)
+        response = await self.client.make_delete_request("/ms")
+        assert response.status_code == 204
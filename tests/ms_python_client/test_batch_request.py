@@ -0,0 +1,189 @@
+import email.utils
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from ms_python_client.ms_api_client import MSApiClient
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+
+BATCH_URL = f"{TEST_API_ENDPOINT}/$batch"
+
+
+class TestBatchRequest(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = MSApiClient(self.config, api_endpoint=TEST_API_ENDPOINT)
+        self.batches: list[dict] = []
+        self.statuses: dict[str, list] = {}
+        self.retry_after = "0"
+
+    def _callback(self, request):
+        body = json.loads(request.body)
+        self.batches.append(body)
+        sub_responses = []
+        for sub_request in body["requests"]:
+            statuses = self.statuses.get(sub_request["url"], [200])
+            status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+            headers = {"Retry-After": self.retry_after} if status == 429 else {}
+            sub_responses.append(
+                {
+                    "id": sub_request["id"],
+                    "status": status,
+                    "headers": headers,
+                    "body": {"url": sub_request["url"]},
+                }
+            )
+        return 200, {}, json.dumps({"responses": sub_responses})
+
+    def _register(self):
+        responses.add_callback(responses.POST, BATCH_URL, callback=self._callback)
+
+    @responses.activate
+    def test_batch(self):
+        self._register()
+        with self.client.batch() as batch:
+            get = batch.get("/users/user_id/calendar/events", {"$top": "10"})
+            post = batch.post("/users/user_id/calendar/events", {"subject": "Test"})
+            delete = batch.delete("/users/user_id/calendar/events/event_id")
+
+        assert len(responses.calls) == 1
+        requests = self.batches[0]["requests"]
+        assert requests[0] == {
+            "id": "1",
+            "method": "GET",
+            "url": "/users/user_id/calendar/events?$top=10",
+        }
+        assert requests[1]["body"] == {"subject": "Test"}
+        assert requests[1]["headers"] == {"Content-Type": "application/json"}
+        assert requests[2]["method"] == "DELETE"
+
+        assert get.response.json() == {"url": "/users/user_id/calendar/events?$top=10"}
+        assert post.status_code == 200
+        assert delete.done
+
+    @responses.activate
+    def test_batches_of_20(self):
+        self._register()
+        batch = self.client.batch()
+        items = [batch.get(f"/users/{i}") for i in range(45)]
+        batch.execute()
+
+        assert [len(body["requests"]) for body in self.batches] == [20, 20, 5]
+        assert all(item.status_code == 200 for item in items)
+        assert items[44].response.json() == {"url": "/users/44"}
+
+    @responses.activate
+    def test_depends_on_keeps_requests_together(self):
+        self._register()
+        batch = self.client.batch()
+        for i in range(15):
+            batch.get(f"/users/{i}")
+        first = batch.post("/users/a/calendar/events", {"subject": "a"})
+        second = batch.patch("/users/a/calendar/events/b", {}, depends_on=[first])
+        third = batch.delete("/users/a/calendar/events/b", depends_on=[second])
+        for i in range(5):
+            batch.get(f"/users/other/{i}")
+        batch.execute()
+
+        sent_ids = [[r["id"] for r in body["requests"]] for body in self.batches]
+        assert any({first.id, second.id, third.id} <= set(ids) for ids in sent_ids)
+        assert all(len(ids) <= 20 for ids in sent_ids)
+        dependent = [
+            r for body in self.batches for r in body["requests"] if "dependsOn" in r
+        ]
+        assert [r["dependsOn"] for r in dependent] == [[first.id], [second.id]]
+
+    def test_too_many_dependent_requests(self):
+        batch = self.client.batch()
+        previous = batch.get("/users/0")
+        for i in range(1, 21):
+            previous = batch.get(f"/users/{i}", depends_on=[previous])
+        with pytest.raises(ValueError):
+            batch.execute()
+
+    def test_dependency_outside_batch(self):
+        other = self.client.batch().get("/users/0")
+        with pytest.raises(ValueError):
+            self.client.batch().get("/users/1", depends_on=[other])
+
+    def test_response_before_execute(self):
+        item = self.client.batch().get("/users/0")
+        with pytest.raises(ValueError):
+            item.response  # pylint: disable=pointless-statement
+
+    @responses.activate
+    def test_only_failed_requests_are_retried(self):
+        self._register()
+        self.statuses = {"/users/throttled": [429, 200], "/users/error": [503, 200]}
+        batch = self.client.batch()
+        ok = batch.get("/users/ok")
+        throttled = batch.get("/users/throttled")
+        error = batch.get("/users/error")
+        with patch("ms_python_client.batch_request.time.sleep") as mock_sleep:
+            batch.execute()
+
+        assert len(self.batches) == 2
+        assert [r["url"] for r in self.batches[1]["requests"]] == [
+            "/users/throttled",
+            "/users/error",
+        ]
+        assert ok.status_code == throttled.status_code == error.status_code == 200
+        mock_sleep.assert_called_once()
+        # The backoff of the 503, with the jitter of the retry policy
+        assert 1 <= mock_sleep.call_args.args[0] <= 1.25
+        assert self.client.api_client.retry_stats.retries == 2
+
+    @responses.activate
+    def test_retry_after_date(self):
+        self._register()
+        self.statuses = {"/users/throttled": [429, 200]}
+        self.retry_after = email.utils.formatdate(time.time() + 30, usegmt=True)
+        batch = self.client.batch()
+        throttled = batch.get("/users/throttled")
+        with patch("ms_python_client.batch_request.time.sleep") as mock_sleep:
+            batch.execute()
+
+        assert throttled.status_code == 200
+        assert 28 <= mock_sleep.call_args.args[0] <= 30 * 1.25
+
+    @responses.activate
+    def test_post_is_not_retried_on_errors(self):
+        self._register()
+        self.statuses = {"/users/a/calendar/events": [503, 200]}
+        batch = self.client.batch()
+        created = batch.post("/users/a/calendar/events", {"subject": "a"})
+        batch.execute()
+
+        assert len(self.batches) == 1
+        assert created.status_code == 503
+
+    @responses.activate
+    def test_failed_dependency_is_retried(self):
+        self._register()
+        self.statuses = {"/users/a": [429, 200], "/users/b": [424, 200]}
+        batch = self.client.batch()
+        first = batch.get("/users/a")
+        second = batch.get("/users/b", depends_on=[first])
+        with patch("ms_python_client.batch_request.time.sleep"):
+            batch.execute()
+
+        assert len(self.batches) == 2
+        assert self.batches[1]["requests"][1]["dependsOn"] == [first.id]
+        assert second.status_code == 200
+
+    @responses.activate
+    def test_retries_are_bounded(self):
+        self._register()
+        self.statuses = {"/users/throttled": [429]}
+        batch = self.client.batch(max_retries=2)
+        throttled = batch.get("/users/throttled")
+        with patch("ms_python_client.batch_request.time.sleep"):
+            batch.execute()
+
+        assert len(self.batches) == 3
+        assert throttled.status_code == 429
+        assert self.client.api_client.retry_stats.exhausted == 1
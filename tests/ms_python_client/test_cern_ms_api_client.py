@@ -1,6 +1,7 @@
 import os
 
 from ms_python_client.cern_ms_api_client import CERNMSApiClient
+from ms_python_client.utils.etag_cache import CachedResponse
 from tests.ms_python_client.base_test_case import BaseTest, mock_msal
 
 
@@ -21,3 +22,14 @@ class TestCERNMSApiClientInit(BaseTest):
     def test_init_from_dotenv(self):
         client = CERNMSApiClient.init_from_dotenv(custom_dotenv=self.env_file)
         assert client is not None
+
+    @mock_msal()
+    def test_batch_writes_discard_the_etags(self):
+        client = CERNMSApiClient.init_from_dotenv(custom_dotenv=self.env_file)
+        etag_cache = client.events.events_component.etag_cache
+        etag_cache.put("/users/u/calendar/events/e", None, CachedResponse("1", b"{}"))
+
+        client.batch().on_write("/users/u/calendar/events/e")
+
+        assert client.events.etag_cache is etag_cache
+        assert len(etag_cache) == 0
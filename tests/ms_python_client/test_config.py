@@ -32,3 +32,30 @@ class TestConfig(unittest.TestCase):
                 azure_authority="https://login.microsoftonline.com/common",
                 azure_client_id="12345678-1234-5678-abcd-1234567890ab",
             )
+
+    def test_app_only_with_secret(self):
+        config = Config(
+            azure_authority="https://login.microsoftonline.com/common",
+            azure_client_id="12345678-1234-5678-abcd-1234567890ab",
+            azure_scope=["https://graph.microsoft.com/.default"],
+            azure_client_secret="secret",
+        )
+        self.assertTrue(config.app_only)
+        self.assertEqual(config.AZURE_CLIENT_SECRET, "secret")
+
+    def test_not_app_only_by_default(self):
+        config = Config(
+            azure_authority="https://login.microsoftonline.com/common",
+            azure_client_id="12345678-1234-5678-abcd-1234567890ab",
+            azure_scope=["User.Read"],
+        )
+        self.assertFalse(config.app_only)
+
+    def test_missing_certificate_thumbprint(self):
+        with self.assertRaises(ValueError):
+            Config(
+                azure_authority="https://login.microsoftonline.com/common",
+                azure_client_id="12345678-1234-5678-abcd-1234567890ab",
+                azure_scope=["https://graph.microsoft.com/.default"],
+                azure_client_certificate_file="/path/to/key.pem",
+            )
@@ -1,10 +1,15 @@
+import json
 import os
 
 import pytest
 import responses
+from requests import HTTPError
 
 from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.utils.etag_cache import CachedResponse
+from ms_python_client.utils.http_pool import create_session
 from ms_python_client.utils.init_from_env import MSClientEnvError
+from ms_python_client.utils.response_cache import ResponseCache
 from tests.ms_python_client.base_test_case import (
     MOCK_TOKEN,
     TEST_API_ENDPOINT,
@@ -36,6 +41,16 @@ class TestMSApiClientInit(BaseTest):
         client = MSApiClient.init_from_dotenv(custom_dotenv=self.env_file)
         assert client is not None
 
+    @mock_msal()
+    def test_shared_session(self):
+        session = create_session(pool_maxsize=32)
+        client = MSApiClient(self.config, session=session)
+        other_client = MSApiClient(self.config, session=session)
+
+        assert client.api_client.session is other_client.api_client.session
+        assert client.pool_stats is other_client.pool_stats
+        assert client.retry_stats is not other_client.retry_stats
+
     @mock_msal()
     def test_build_headers(self):
         client = MSApiClient.init_from_dotenv(custom_dotenv=self.env_file)
@@ -109,3 +124,94 @@ class TestMSApiClient(BaseTest):
         )
         response = self.client.make_delete_request("/ms")
         assert response.status_code == 200
+
+
+class TestMSApiClientResponseCache(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = ResponseCache()
+        self.client = MSApiClient(
+            self.config, api_endpoint=TEST_API_ENDPOINT, response_cache=self.cache
+        )
+
+    @responses.activate
+    def test_get_requests_are_cached(self):
+        responses.add(responses.GET, f"{TEST_API_ENDPOINT}/users", json={"a": 1})
+        first = self.client.make_get_request("/users", {"$top": "10"})
+        second = self.client.make_get_request("/users", {"$top": "10"})
+        self.client.make_get_request("/users", {"$top": "20"})
+
+        assert second.json() == first.json() == {"a": 1}
+        assert len(responses.calls) == 2
+        assert self.cache.stats.as_dict()["hits"] == 1
+        assert self.cache.stats.as_dict()["misses"] == 2
+
+    @responses.activate
+    def test_writes_invalidate_the_resource_and_its_collection(self):
+        events = f"{TEST_API_ENDPOINT}/users/u/calendar/events"
+        responses.add(responses.GET, events, json={"value": []})
+        responses.add(responses.GET, f"{events}/e", json={"id": "e"})
+        responses.add(responses.PATCH, f"{events}/e", status=204)
+        responses.add(responses.DELETE, f"{events}/e", status=204)
+        self.client.make_get_request("/users/u/calendar/events")
+        self.client.make_get_request("/users/u/calendar/events/e")
+
+        self.client.make_patch_request("/users/u/calendar/events/e", {})
+        self.client.make_get_request("/users/u/calendar/events")
+        self.client.make_get_request("/users/u/calendar/events/e")
+        self.client.make_delete_request("/users/u/calendar/events/e")
+        self.client.make_get_request("/users/u/calendar/events")
+
+        assert [call.request.method for call in responses.calls] == [
+            "GET",
+            "GET",
+            "PATCH",
+            "GET",
+            "GET",
+            "DELETE",
+            "GET",
+        ]
+        assert self.cache.stats.invalidations == 4
+
+    @responses.activate
+    def test_batch_writes_invalidate_the_resource(self):
+        events = f"{TEST_API_ENDPOINT}/users/u/calendar/events"
+        responses.add(responses.GET, events, json={"value": []})
+        responses.add(responses.GET, f"{events}/e", json={"id": "e"})
+        responses.add(
+            responses.POST,
+            f"{TEST_API_ENDPOINT}/$batch",
+            body=json.dumps({"responses": [{"id": "1", "status": 204}]}),
+        )
+        self.client.make_get_request("/users/u/calendar/events")
+        self.client.make_get_request("/users/u/calendar/events/e")
+        etag_cache = self.client.events.etag_cache
+        etag_cache.put("/users/u/calendar/events/e", None, CachedResponse("1", b"{}"))
+
+        with self.client.batch() as batch:
+            batch.patch("/users/u/calendar/events/e", {"subject": "New"})
+        self.client.make_get_request("/users/u/calendar/events")
+        self.client.make_get_request("/users/u/calendar/events/e")
+
+        assert [call.request.method for call in responses.calls] == [
+            "GET",
+            "GET",
+            "POST",
+            "GET",
+            "GET",
+        ]
+        assert len(etag_cache) == 0
+
+    @responses.activate
+    def test_streamed_and_failed_requests_are_not_cached(self):
+        responses.add(responses.GET, f"{TEST_API_ENDPOINT}/ok", json={})
+        responses.add(responses.GET, f"{TEST_API_ENDPOINT}/missing", status=404)
+        self.client.make_get_request("/ok", stream=True)
+        self.client.make_get_request("/ok", stream=True)
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                self.client.make_get_request("/missing")
+
+        assert len(responses.calls) == 4
+        assert len(self.cache) == 0
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from ms_python_client.utils.bulk import BulkResult, run_bulk
+
+
+def test_run_bulk():
+    results = list(run_bulk(lambda item: item * 2, range(20), lambda item: item))
+
+    assert sorted(results) == [BulkResult(i, i * 2) for i in range(20)]
+    assert all(result.ok for result in results)
+
+
+def test_errors_are_returned():
+    def func(item):
+        if item == 3:
+            raise ValueError("Wrong item")
+        return item
+
+    results = {result.key: result for result in run_bulk(func, range(5), str)}
+
+    assert len(results) == 5
+    assert not results["3"].ok
+    assert isinstance(results["3"].error, ValueError)
+    assert results["4"].result == 4
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def func(item):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    list(run_bulk(func, range(30), str, max_workers=4))
+
+    assert max_running[0] == 4
+
+
+def test_items_are_read_lazily():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = run_bulk(lambda item: item, items(), str, max_workers=2)
+    next(results)
+    results.close()
+
+    assert len(consumed) <= 4
+
+
+def test_results_are_yielded_as_they_finish():
+    def func(item):
+        time.sleep(0.2 if item == 0 else 0)
+        return item
+
+    results = [result.key for result in run_bulk(func, range(3), str, max_workers=3)]
+
+    assert results[-1] == "0"
+
+
+def test_stop_on_error():
+    def func(item):
+        if item == 0:
+            raise ValueError("Wrong item")
+        return item
+
+    results = list(run_bulk(func, range(10), str, max_workers=1, stop_on_error=True))
+
+    assert len(results) == 1
+    assert not results[0].ok
+
+
+def test_max_workers():
+    with pytest.raises(ValueError):
+        list(run_bulk(str, range(3), str, max_workers=0))
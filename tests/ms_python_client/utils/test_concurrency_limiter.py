@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from ms_python_client.utils.concurrency_limiter import (
+    AdaptiveLimiter,
+    MailboxConcurrencyLimiter,
+)
+
+
+def release(limiter: AdaptiveLimiter, status_code: int) -> None:
+    slot = limiter.acquire()
+    slot.status_code = status_code
+    limiter.release(slot)
+
+
+def test_window_is_halved_when_throttled():
+    limiter = AdaptiveLimiter(initial_limit=8, max_limit=8)
+    release(limiter, 429)
+    assert limiter.limit == 4
+    release(limiter, 429)
+    assert limiter.limit == 2
+    release(limiter, 429)
+    release(limiter, 429)
+    assert limiter.limit == 1
+
+
+def test_window_grows_on_success():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+    # About one more slot per window of successful requests
+    for _ in range(3):
+        release(limiter, 200)
+    assert limiter.limit == 3
+    for _ in range(20):
+        release(limiter, 200)
+    assert limiter.limit == 4
+
+
+def test_running_requests_halve_the_window_once():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=4)
+    slots = [limiter.acquire() for _ in range(4)]
+    for slot in slots:
+        slot.status_code = 429
+        limiter.release(slot)
+    assert limiter.limit == 2
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=5, max_limit=4)
+    with pytest.raises(ValueError):
+        MailboxConcurrencyLimiter(min_limit=0)
+
+
+def test_requests_over_the_window_wait():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def request():
+        slot = limiter.acquire()
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        slot.status_code = 200
+        limiter.release(slot)
+
+    threads = [threading.Thread(target=request) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_running[0] == 2
+
+
+def test_mailboxes_are_limited_separately():
+    limiter = MailboxConcurrencyLimiter(initial_limit=2, max_limit=2)
+    with limiter.slot("/users/a/events") as slot:
+        assert slot is not None
+        slot.status_code = 429
+    assert limiter.get_limit("a") == 1
+    assert limiter.get_limit("A") == 1
+    assert limiter.get_limit("b") == 2
+
+    with limiter.slot("/users/b/events"), limiter.slot("/users/b/events"):
+        with limiter.slot("/users/a/events"):
+            pass
+
+    with limiter.slot("/$batch") as slot:
+        assert slot is None
+
+
+def test_recovered_mailboxes_are_forgotten():
+    limiter = MailboxConcurrencyLimiter(initial_limit=2, max_limit=2)
+    with limiter.slot("/users/a/events") as slot:
+        slot.status_code = 429  # type: ignore
+    for _ in range(3):
+        with limiter.slot("/users/a/events") as slot:
+            slot.status_code = 200  # type: ignore
+
+    assert limiter.get_limit("a") == 2
+    assert limiter._limiters == {}
@@ -0,0 +1,37 @@
+from ms_python_client.utils.etag_cache import (
+    CachedResponse,
+    ETagCache,
+    build_variant_key,
+)
+
+VARIANT = build_variant_key({"$select": "id"}, None)
+
+
+def test_least_recently_used_are_dropped():
+    cache = ETagCache(max_size=2)
+    cache.put("/a", VARIANT, CachedResponse("1", b"{}"))
+    cache.put("/b", VARIANT, CachedResponse("2", b"{}"))
+    cache.get("/a", VARIANT)
+    cache.put("/c", VARIANT, CachedResponse("3", b"{}"))
+
+    assert len(cache) == 2
+    assert cache.get("/b", VARIANT) is None
+    assert cache.get("/a", VARIANT) == CachedResponse("1", b"{}")
+
+
+def test_discard_drops_all_the_variants():
+    cache = ETagCache()
+    other = build_variant_key({}, {"prefer": 'outlook.timezone="Europe/Zurich"'})
+    cache.put("/a", VARIANT, CachedResponse("1", b"{}"))
+    cache.put("/a", other, CachedResponse("1", b"{}"))
+    cache.discard("/a")
+
+    assert cache.get("/a", VARIANT) is None
+    assert cache.get("/a", other) is None
+
+
+def test_variant_key():
+    assert build_variant_key({"b": "1", "a": "2"}, {"Prefer": "x"}) == (
+        (("a", "2"), ("b", "1")),
+        "x",
+    )
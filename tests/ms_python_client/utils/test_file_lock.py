@@ -0,0 +1,35 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from ms_python_client.utils.file_lock import file_lock
+
+
+class TestFileLock(unittest.TestCase):
+    def setUp(self) -> None:
+        self.lock_path = os.path.join(tempfile.mkdtemp(), "test.lock")
+
+    def test_lock_is_exclusive(self):
+        events = []
+
+        def worker(name):
+            with file_lock(self.lock_path):
+                events.append(f"{name}-in")
+                time.sleep(0.05)
+                events.append(f"{name}-out")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i in range(0, len(events), 2):
+            assert events[i].split("-")[0] == events[i + 1].split("-")[0]
+
+    def test_shared_lock(self):
+        with file_lock(self.lock_path, shared=True):
+            with file_lock(self.lock_path, shared=True) as f:
+                assert f is not None
@@ -0,0 +1,157 @@
+import json
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError
+from requests import Timeout as RequestsTimeout
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.utils.http2_session import (
+    DEFAULT_MAX_CONNECTIONS,
+    HTTP2Session,
+)
+from ms_python_client.utils.retry import RetryPolicy
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+from tests.ms_python_client.local_h2_server import LocalH2Server
+
+httpx = pytest.importorskip("httpx")
+
+
+def _session_with_transport(handler) -> HTTP2Session:
+    session = HTTP2Session()
+    session.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return session
+
+
+def test_response_is_converted():
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        assert json.loads(request.read()) == {"subject": "test"}
+        # Streamed like the responses of a real transport
+        return httpx.Response(
+            201,
+            headers={"Content-Type": "application/json", "ETag": "abc"},
+            stream=httpx.ByteStream(b'{"id": "1"}'),
+        )
+
+    session = _session_with_transport(handler)
+    response = session.request(
+        "POST",
+        "https://graph.microsoft.com/v1.0/users/1/events",
+        headers={"Authorization": "Bearer token"},
+        json={"subject": "test"},
+    )
+
+    assert response.status_code == 201
+    assert response.json() == {"id": "1"}
+    assert response.headers["etag"] == "abc"
+    assert response.request.method == "POST"
+
+
+def test_transport_errors_are_mapped():
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    def time_out(request):
+        raise httpx.ReadTimeout("too slow", request=request)
+
+    with pytest.raises(RequestsConnectionError):
+        _session_with_transport(refuse).request("GET", "https://example.com")
+    with pytest.raises(RequestsTimeout):
+        _session_with_transport(time_out).request("GET", "https://example.com")
+
+
+class TestStreamedPages(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        pages = {
+            None: {
+                "value": [{"id": "1"}, {"id": "2"}],
+                "@odata.nextLink": f"{TEST_API_ENDPOINT}/users?$skiptoken=2",
+            },
+            "2": {"value": [{"id": "3"}]},
+        }
+
+        def handler(request):
+            assert request.url.path == "/users"
+            page = pages[request.url.params.get("$skiptoken")]
+            # Streamed like the responses of a real transport
+            return httpx.Response(
+                200, stream=httpx.ByteStream(json.dumps(page).encode())
+            )
+
+        self.ms_client = MSApiClient(
+            self.config,
+            api_endpoint=TEST_API_ENDPOINT,
+            transport=_session_with_transport(handler),
+        )
+
+    def test_streamed_pages(self):
+        users = list(self.ms_client.users.iter_users(stream=True))
+
+        assert [user["id"] for user in users] == ["1", "2", "3"]
+
+
+class TestHTTP2Session(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = LocalH2Server(delay=0.2).__enter__()
+        self.server.add("GET", "/test", {"response": "ok"})
+        self.server.add("GET", "/missing", {"error": "gone"}, status=404)
+        self.session = HTTP2Session(max_connections=1, http2_prior_knowledge=True)
+        self.api_client = ApiClient(
+            self.server.url,
+            retry_policy=RetryPolicy(backoff_factor=0),
+            transport=self.session,
+        )
+
+    def tearDown(self) -> None:
+        self.session.close()
+        self.server.__exit__()
+
+    def test_same_response_semantics(self):
+        response = self.api_client.make_get_request("/test", headers={})
+
+        assert response.status_code == 200
+        assert response.json() == {"response": "ok"}
+        assert self.api_client.pool_stats is None
+        with pytest.raises(HTTPError):
+            self.api_client.make_get_request("/missing", headers={})
+
+    def test_requests_are_multiplexed(self):
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: self.api_client.make_get_request("/test", headers={}),
+                    range(10),
+                )
+            )
+        elapsed = time.monotonic() - start
+
+        assert all(response.json() == {"response": "ok"} for response in responses)
+        # All the streams shared one connection and waited together
+        assert self.server.connections == 1
+        assert len(self.server.requests) == 10
+        assert elapsed < 1.5
+
+    def test_api_client_http2_option(self):
+        api_client = ApiClient(self.server.url, http2=True)
+
+        assert isinstance(api_client.transport, HTTP2Session)
+        assert api_client.session is None
+
+    def test_api_client_http2_connections(self):
+        with patch("ms_python_client.api_client.HTTP2Session") as mock_session:
+            ApiClient(self.server.url, http2=True)
+            ApiClient(self.server.url, http2=True, pool_maxsize=8)
+
+        assert [call.kwargs for call in mock_session.call_args_list] == [
+            {"max_connections": DEFAULT_MAX_CONNECTIONS},
+            {"max_connections": 8},
+        ]
@@ -0,0 +1,94 @@
+import threading
+import unittest
+
+from requests import Session
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.utils.http_pool import (
+    PooledHTTPAdapter,
+    PoolStats,
+    create_session,
+    get_pool_stats,
+)
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+
+def test_pool_stats():
+    stats = PoolStats()
+    assert stats.reuse_ratio == 0
+
+    for wait in [0, 0.5, 0.1, 0]:
+        stats.record_checkout(wait)
+    stats.record_new_connection()
+    stats.record_discarded_connection()
+
+    assert stats.as_dict() == {
+        "checkouts": 4,
+        "new_connections": 1,
+        "discarded_connections": 1,
+        "checkout_wait_seconds": 0.6,
+        "max_checkout_wait_seconds": 0.5,
+        "reuse_ratio": 0.75,
+    }
+
+
+def test_create_session():
+    session = create_session(pool_connections=2, pool_maxsize=20, pool_block=True)
+    adapter = session.get_adapter("https://graph.microsoft.com")
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 20
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.max_retries.total == 3
+    assert get_pool_stats(session, "https://graph.microsoft.com") is adapter.stats
+    assert get_pool_stats(Session(), "https://graph.microsoft.com") is None
+
+
+class TestPooledHTTPAdapter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = LocalHttpServer().__enter__()
+        self.server.add("GET", "/test", {"response": "ok"})
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_connections_are_reused(self):
+        api_client = ApiClient(self.server.url)
+        for _ in range(5):
+            api_client.make_get_request("/test", headers={})
+
+        stats = api_client.pool_stats
+        assert stats is not None
+        assert stats.checkouts == 5
+        assert stats.new_connections == 1
+        assert stats.reuse_ratio == 0.8
+
+    def test_session_is_shared(self):
+        session = create_session()
+        api_clients = [ApiClient(self.server.url, session=session) for _ in range(3)]
+        for api_client in api_clients:
+            api_client.make_get_request("/test", headers={})
+
+        assert api_clients[0].session is api_clients[2].session
+        assert api_clients[0].pool_stats.new_connections == 1  # type: ignore
+
+    def test_blocking_pool(self):
+        api_client = ApiClient(self.server.url, pool_maxsize=2, pool_block=True)
+        threads = [
+            threading.Thread(
+                target=api_client.make_get_request,
+                args=("/test",),
+                kwargs={"headers": {}},
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = api_client.pool_stats
+        assert stats is not None
+        assert stats.checkouts == 8
+        assert stats.new_connections <= 2
+        assert stats.discarded_connections == 0
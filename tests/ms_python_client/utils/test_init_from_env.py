@@ -20,6 +20,7 @@ class TestInitFromEnv(unittest.TestCase):
         os.environ.pop("AZURE_AUTHORITY", None)
         os.environ.pop("AZURE_CLIENT_ID", None)
         os.environ.pop("AZURE_SCOPE", None)
+        os.environ.pop("AZURE_CLIENT_SECRET", None)
 
     def test_init_from_env(self):
         config = init_from_env()
@@ -30,6 +31,13 @@ class TestInitFromEnv(unittest.TestCase):
         )
         self.assertEqual(config.AZURE_CLIENT_ID, "client_id")
         self.assertEqual(config.AZURE_SCOPE, ["Scope1", "Scope2"])
+        self.assertFalse(config.app_only)
+
+    def test_init_from_env_app_only(self):
+        os.environ["AZURE_CLIENT_SECRET"] = "secret"
+        config = init_from_env()
+        self.assertTrue(config.app_only)
+        self.assertEqual(config.AZURE_CLIENT_SECRET, "secret")
 
     def test_init_from_env_missing_key(self):
         os.environ.pop("AZURE_AUTHORITY", None)
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+import responses
+from requests import Response
+from requests.exceptions import JSONDecodeError
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.utils import json_codec
+from ms_python_client.utils.json_codec import (
+    STDLIB_CODEC,
+    JsonCodec,
+    decode_response,
+    get_codec_by_name,
+    get_json_codec,
+    set_json_codec,
+)
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT
+
+EVENT = {"id": "1", "subject": "Réunion", "start": {"dateTime": "2023-01-01"}}
+
+
+def _response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    # pylint: disable=protected-access
+    response._content = content
+    return response
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    codec = get_json_codec()
+    yield
+    set_json_codec(codec)
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_codecs(name):
+    pytest.importorskip(name)
+    codec = get_codec_by_name(name)
+
+    assert json.loads(codec.dumps(EVENT)) == EVENT
+    assert codec.loads(json.dumps(EVENT).encode()) == EVENT
+
+    set_json_codec(name)
+    assert decode_response(_response(json.dumps(EVENT).encode())) == EVENT
+    with pytest.raises(JSONDecodeError):
+        decode_response(_response(b"<html>"))
+
+
+def test_fastest_codec_is_used():
+    pytest.importorskip("orjson")
+    assert json_codec._find_codec().name == "orjson"  # pylint: disable=W0212
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        set_json_codec("simplejson")
+
+
+@responses.activate
+def test_api_client_encodes_with_the_codec():
+    responses.add(responses.POST, f"{TEST_API_ENDPOINT}/test", json={})
+    encoded = []
+
+    def dumps(obj):
+        encoded.append(obj)
+        return STDLIB_CODEC.dumps(obj)
+
+    set_json_codec(JsonCodec("custom", dumps, STDLIB_CODEC.loads))
+    ApiClient(TEST_API_ENDPOINT).make_post_request("/test", headers={}, json=EVENT)
+
+    assert encoded == [EVENT]
+    assert json.loads(responses.calls[0].request.body) == EVENT
+    assert responses.calls[0].request.headers["Content-Type"] == "application/json"
@@ -0,0 +1,100 @@
+import json
+import unittest
+
+import pytest
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.utils.json_stream import JsonPageStream
+from ms_python_client.utils.pagination import STREAM_CHUNK_SIZE
+from ms_python_client.utils.transports import Urllib3Transport
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+PAGE = {
+    "@odata.context": "https://graph.microsoft.com/v1.0/$metadata#events",
+    "@odata.count": 1234567,
+    "value": [
+        {
+            "id": str(i),
+            "subject": "Réunion ☕" * i,
+            "attendees": [1, 2.5, None, True],
+            "scores": [1e-05, -25000000000.0, -i, i / 7, 6.02e23],
+        }
+        for i in range(30)
+    ],
+    "@odata.nextLink": "https://graph.microsoft.com/v1.0/users/u/events?$skip=30",
+}
+
+
+def chunked(data: bytes, size: int) -> list:
+    return [data[start:][:size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 6, 7, 100, 1 << 20])
+def test_same_as_json_loads(size):
+    data = json.dumps(PAGE, ensure_ascii=False, indent=2).encode()
+    page = JsonPageStream(chunked(data, size))
+
+    assert list(page) == PAGE["value"]
+    assert page.properties == {key: PAGE[key] for key in PAGE if key != "value"}
+
+
+@pytest.mark.parametrize(
+    "data", [b'{"value": [1e-05]}', b'{"value": [-25000000000.0, 2.5E+3 ]}']
+)
+def test_numbers_cut_between_chunks(data):
+    for size in range(1, len(data) + 1):
+        assert list(JsonPageStream(chunked(data, size))) == json.loads(data)["value"]
+
+
+def test_items_are_yielded_while_reading():
+    data = json.dumps(PAGE).encode()
+    chunks = chunked(data, 64)
+    read = []
+
+    def read_chunks():
+        for chunk in chunks:
+            read.append(chunk)
+            yield chunk
+
+    items = iter(JsonPageStream(read_chunks()))
+
+    assert next(items) == PAGE["value"][0]
+    assert len(read) < len(chunks) / 10
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"[1, 2]", b'{"value": [1, 2', b'{"value": [1}', b'{"a": 1} 2']
+)
+def test_invalid_json(data):
+    with pytest.raises(json.JSONDecodeError):
+        list(JsonPageStream([data]))
+
+
+def test_empty_pages():
+    assert list(JsonPageStream([b"{}"])) == []
+    page = JsonPageStream([b'{"value": [], "@odata.count": 0}'])
+    assert list(page) == []
+    assert page.properties == {"@odata.count": 0}
+
+
+class TestStreamedResponse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = LocalHttpServer().__enter__()
+        self.server.add("GET", "/events", PAGE)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_transports_stream(self):
+        for transport in [None, Urllib3Transport()]:
+            api_client = ApiClient(self.server.url, transport=transport)
+            try:
+                response = api_client.make_get_request("/events", {}, stream=True)
+                with response:
+                    items = list(
+                        JsonPageStream(response.iter_content(STREAM_CHUNK_SIZE))
+                    )
+            finally:
+                api_client.transport.close()
+
+            assert items == PAGE["value"]
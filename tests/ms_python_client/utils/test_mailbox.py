@@ -0,0 +1,18 @@
+from ms_python_client.utils.mailbox import get_mailbox
+
+
+def test_get_mailbox():
+    assert get_mailbox("/users/user@cern.ch/calendar/events") == "user@cern.ch"
+    assert get_mailbox("/users/User%40CERN.ch/events?$top=10") == "user@cern.ch"
+    assert (
+        get_mailbox("https://graph.microsoft.com/v1.0/users/user_id/calendarView/delta")
+        == "user_id"
+    )
+    assert get_mailbox("/users/user_id") == "user_id"
+
+
+def test_get_mailbox_not_for_a_mailbox():
+    assert get_mailbox("/users") is None
+    assert get_mailbox("/users?$filter=a/b") is None
+    assert get_mailbox("/$batch") is None
+    assert get_mailbox("https://graph.microsoft.com/v1.0/subscriptions") is None
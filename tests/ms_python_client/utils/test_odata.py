@@ -0,0 +1,21 @@
+from ms_python_client.utils.odata import RETURN_MINIMAL, with_preference, with_select
+
+
+def test_with_select():
+    assert with_select(None, ["id", "subject"]) == {"$select": "id,subject"}
+    assert with_select({"$select": "body", "$top": "1"}, ["id"]) == {
+        "$select": "body",
+        "$top": "1",
+    }
+    assert with_select({"$select": ""}, ["id"]) == {}
+    assert with_select({"$top": "1"}, []) == {"$top": "1"}
+
+
+def test_with_preference():
+    assert with_preference(None, RETURN_MINIMAL) == {"Prefer": "return=minimal"}
+    assert with_preference({"prefer": "odata.maxpagesize=10"}, RETURN_MINIMAL) == {
+        "prefer": "odata.maxpagesize=10, return=minimal"
+    }
+    # The caller asked for the whole event
+    headers = {"Prefer": "return=representation"}
+    assert with_preference(headers, RETURN_MINIMAL) == headers
@@ -0,0 +1,85 @@
+import pytest
+import responses
+
+from ms_python_client.ms_api_client import MSApiClient
+from ms_python_client.utils.pagination import iter_items, iter_pages
+from tests.ms_python_client.base_test_case import TEST_API_ENDPOINT, BaseTest, mock_msal
+
+ITEMS_URL = f"{TEST_API_ENDPOINT}/items"
+
+
+def add_pages():
+    responses.add(
+        responses.GET,
+        ITEMS_URL,
+        json={"value": [1, 2], "@odata.nextLink": f"{ITEMS_URL}?$skip=2"},
+        match=[responses.matchers.query_param_matcher({"$top": "2"})],
+    )
+    responses.add(
+        responses.GET,
+        ITEMS_URL,
+        json={"value": [3, 4], "@odata.nextLink": f"{ITEMS_URL}?$skip=4"},
+        match=[responses.matchers.query_param_matcher({"$skip": "2"})],
+    )
+    responses.add(
+        responses.GET,
+        ITEMS_URL,
+        json={"value": [5]},
+        match=[responses.matchers.query_param_matcher({"$skip": "4"})],
+    )
+
+
+class TestPagination(BaseTest):
+    @mock_msal()
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = MSApiClient(self.config, api_endpoint=TEST_API_ENDPOINT)
+
+    @responses.activate
+    def test_iter_items(self):
+        add_pages()
+        items = list(iter_items(self.client, "/items", page_size=2))
+
+        assert items == [1, 2, 3, 4, 5]
+        assert len(responses.calls) == 3
+        assert responses.calls[1].request.url == f"{ITEMS_URL}?$skip=2"
+
+    @responses.activate
+    def test_pages_are_requested_lazily(self):
+        add_pages()
+        items = iter_items(self.client, "/items", page_size=2)
+
+        assert len(responses.calls) == 0
+        assert next(items) == 1
+        assert next(items) == 2
+        assert len(responses.calls) == 1
+        assert next(items) == 3
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_prefetch(self):
+        add_pages()
+        pages = iter_pages(self.client, "/items", {"$top": "2"}, prefetch=True)
+
+        assert next(pages)["value"] == [1, 2]
+        assert [page["value"] for page in pages] == [[3, 4], [5]]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_headers_are_sent_on_every_page(self):
+        add_pages()
+        list(iter_pages(self.client, "/items", {"$top": "2"}, {"test": "test"}))
+
+        assert all(call.request.headers["test"] == "test" for call in responses.calls)
+
+    @responses.activate
+    def test_stream(self):
+        add_pages()
+        items = list(iter_items(self.client, "/items", page_size=2, stream=True))
+
+        assert items == [1, 2, 3, 4, 5]
+        assert len(responses.calls) == 3
+
+    def test_stream_and_prefetch(self):
+        with pytest.raises(ValueError):
+            next(iter_items(self.client, "/items", prefetch=True, stream=True))
@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from ms_python_client.utils.rate_limiter import SharedRateLimiter
+from tests.ms_python_client.base_test_case import BaseTest
+
+
+def take_tokens(path: str, count: int) -> None:
+    limiter = SharedRateLimiter(path, mailbox_rate=200, mailbox_burst=10)
+    for _ in range(count):
+        limiter.acquire("/users/user_id/events")
+    limiter.close()
+
+
+class TestSharedRateLimiter(BaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = os.path.join(self.test_dir, "rate_limiter.bin")
+
+    def test_burst_then_wait(self):
+        limiter = SharedRateLimiter(self.path, mailbox_rate=100, mailbox_burst=2)
+        assert limiter.acquire("/users/user_id/events") == 0
+        assert limiter.acquire("/users/user_id/events") == 0
+        assert limiter.acquire("/users/user_id/events") > 0
+        # Other mailboxes have their own budget
+        assert limiter.acquire("/users/other_user/events") == 0
+        limiter.close()
+
+    def test_app_budget(self):
+        limiter = SharedRateLimiter(self.path, app_rate=100, app_burst=1)
+        assert limiter.acquire("/users") == 0
+        assert limiter.get_tokens("app") < 1
+        assert limiter.acquire("/users/user_id/events") > 0
+        limiter.close()
+
+    def test_budgets_are_shared(self):
+        limiter = SharedRateLimiter(self.path, mailbox_rate=1, mailbox_burst=3)
+        other = SharedRateLimiter(self.path, mailbox_rate=1, mailbox_burst=3)
+        limiter.acquire("/users/user_id/events")
+        other.acquire("/users/USER_ID/events")
+
+        assert 0.9 < other.get_tokens("user_id") < 1.1
+        limiter.close()
+        other.close()
+
+    def test_budgets_are_shared_between_processes(self):
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=take_tokens, args=(self.path, 30)) for _ in range(2)
+        ]
+        start = time.monotonic()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        # 60 requests with a burst of 10 at 200 per second
+        assert time.monotonic() - start >= 0.25
+
+    def test_throttled(self):
+        limiter = SharedRateLimiter(self.path)
+        limiter.throttled("/users/user_id/events", 30)
+
+        assert limiter.get_tokens("user_id") < -400
+        assert limiter.get_tokens("other_user") > 1
+        limiter.close()
+
+    def test_buckets_are_reused(self):
+        limiter = SharedRateLimiter(self.path, mailbox_rate=100, slots=2)
+        for i in range(10):
+            assert limiter.acquire(f"/users/user_{i}/events") == 0
+        limiter.close()
+
+    def test_invalid_file(self):
+        SharedRateLimiter(self.path, slots=16).close()
+        with pytest.raises(ValueError):
+            SharedRateLimiter(self.path, slots=32)
+
+        with open(self.path, "r+b") as f:
+            f.write(b"whatever")
+        with pytest.raises(ValueError):
+            SharedRateLimiter(self.path, slots=16)
+
+    def test_invalid_rates(self):
+        with pytest.raises(ValueError):
+            SharedRateLimiter(self.path, mailbox_rate=0)
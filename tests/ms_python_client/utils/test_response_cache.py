@@ -0,0 +1,107 @@
+from requests import Response
+
+from ms_python_client.utils.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_response(content: bytes = b'{"value": []}', status: int = 200) -> Response:
+    response = Response()
+    response.status_code = status
+    response.headers["Content-Type"] = "application/json"
+    # pylint: disable=protected-access
+    response._content = content
+    return response
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    cache.put("/users?$top=10", {}, build_response())
+
+    clock.now = 9
+    cached = cache.get("/users?$top=10", {})
+    clock.now = 10
+    expired = cache.get("/users?$top=10", {})
+
+    assert cached is not None
+    assert cached.json() == {"value": []}
+    assert cached.headers["content-type"] == "application/json"
+    assert expired is None
+    assert cache.stats.as_dict() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "invalidations": 0,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_route_ttls():
+    cache = ResponseCache(ttl=10, route_ttls={"/users": 600, "/users/*/events*": 0})
+
+    assert cache.get_ttl("/users") == 600
+    assert cache.get_ttl("/users/u/events/e") == 0
+    assert cache.get_ttl("/users/u/calendarView/delta") == 0
+    assert cache.get_ttl("/users/u") == 10
+
+    cache.put("/users/u/events", {}, build_response())
+    cache.put("/users/u/calendarView/delta?$deltatoken=1", {}, build_response())
+    assert len(cache) == 0
+
+
+def test_vary_headers():
+    cache = ResponseCache()
+    zurich = {"prefer": 'outlook.timezone="Europe/Zurich"', "Authorization": "a"}
+    cache.put("/events", zurich, build_response())
+
+    assert cache.get("/events", {"Prefer": zurich["prefer"], "authorization": "a"})
+    assert cache.get("/events", {"Authorization": "a"}) is None
+
+
+def test_credentials_are_not_shared():
+    cache = ResponseCache()
+    cache.put("/users", {"Authorization": "Bearer a"}, build_response())
+
+    assert cache.get("/users", {"Authorization": "Bearer a"})
+    assert cache.get("/users", {"Authorization": "Bearer b"}) is None
+    assert cache.get("/users", {}) is None
+    # pylint: disable=protected-access
+    assert all("Bearer a" not in key for key in cache._entries)
+
+
+def test_least_recently_used_are_evicted():
+    cache = ResponseCache(max_size=2)
+    cache.put("/a", {}, build_response())
+    cache.put("/b", {}, build_response())
+    cache.get("/a", {})
+    cache.put("/c", {}, build_response())
+
+    assert cache.get("/b", {}) is None
+    assert cache.get("/a", {}) is not None
+    assert cache.stats.evictions == 1
+
+
+def test_only_successes_are_cached():
+    cache = ResponseCache()
+    cache.put("/a", {}, build_response(b"", status=304))
+
+    assert len(cache) == 0
+
+
+def test_invalidate():
+    cache = ResponseCache()
+    for path in ["/u/events", "/u/events?$top=1", "/u/events/e", "/u/events/e/a", "/u"]:
+        cache.put(path, {}, build_response())
+    cache.put("/u/events/e2", {}, build_response())
+
+    cache.invalidate("/u/events/e")
+
+    assert len(cache) == 2
+    assert cache.stats.invalidations == 4
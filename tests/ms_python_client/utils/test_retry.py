@@ -0,0 +1,76 @@
+import email.utils
+import time
+from unittest.mock import patch
+
+from ms_python_client.utils.retry import RetryPolicy, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("not a date") is None
+
+    date = email.utils.formatdate(time.time() + 30, usegmt=True)
+    retry_after = parse_retry_after(date)
+    assert retry_after is not None
+    assert 25 < retry_after <= 30
+    past = email.utils.formatdate(time.time() - 30, usegmt=True)
+    assert parse_retry_after(past) == 0
+
+
+def test_is_retryable():
+    policy = RetryPolicy()
+    assert policy.is_retryable("GET", 503)
+    assert policy.is_retryable("PATCH", 500)
+    assert policy.is_retryable("delete", 504)
+    assert not policy.is_retryable("GET", 404)
+    assert not policy.is_retryable("POST", 503)
+    assert policy.is_retryable("POST", 503, idempotent=True)
+    # A throttled request has not been processed
+    assert policy.is_retryable("POST", 429)
+
+
+def test_should_retry_is_bounded():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry("GET", 503, 0)
+    assert policy.should_retry("GET", 503, 1)
+    assert not policy.should_retry("GET", 503, 2)
+    assert not policy.should_retry("GET", 404, 2)
+    assert policy.stats.exhausted == 1
+
+
+def test_delay_follows_retry_after():
+    policy = RetryPolicy(jitter=0)
+    assert policy.get_delay(1, 429, {"Retry-After": "7"}) == 7
+    assert policy.get_delay(3, 503, {"Retry-After": "7"}) == 7
+    # Only throttling statuses have a meaningful Retry-After
+    assert policy.get_delay(1, 500, {"Retry-After": "7"}) == 1
+    assert policy.stats.as_dict() == {
+        "retries": 3,
+        "retry_after_waits": 2,
+        "backoff_seconds": 15,
+        "exhausted": 0,
+    }
+
+
+def test_exponential_backoff():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=0)
+    assert [policy.get_delay(attempt) for attempt in range(1, 6)] == [
+        0.5,
+        1,
+        2,
+        3,
+        3,
+    ]
+
+
+def test_jitter():
+    policy = RetryPolicy(jitter=0.5)
+    with patch("ms_python_client.utils.retry.random.uniform", return_value=0.5):
+        assert policy.get_delay(1, 429, {"Retry-After": "10"}) == 15
+
+    delays = [policy.get_delay(3) for _ in range(20)]
+    assert all(4 <= delay <= 6 for delay in delays)
+    assert len(set(delays)) > 1
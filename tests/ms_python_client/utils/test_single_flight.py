@@ -0,0 +1,46 @@
+import threading
+import time
+import unittest
+
+import pytest
+
+from ms_python_client.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_result(self):
+        single_flight = SingleFlight()
+        calls = []
+        results = []
+
+        def func():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight.do("k", func)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["result"] * 10
+
+    def test_sequential_calls_run_again(self):
+        single_flight = SingleFlight()
+        assert single_flight.do("k", lambda: 1) == 1
+        assert single_flight.do("k", lambda: 2) == 2
+
+    def test_error_is_raised(self):
+        single_flight = SingleFlight()
+
+        def func():
+            raise ValueError("error")
+
+        with pytest.raises(ValueError):
+            single_flight.do("k", func)
+        assert single_flight.do("k", lambda: 1) == 1
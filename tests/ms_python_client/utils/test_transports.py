@@ -0,0 +1,89 @@
+import socket
+import unittest
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Session
+from urllib3 import Retry
+
+from ms_python_client.api_client import ApiClient
+from ms_python_client.utils.retry import RetryPolicy
+from ms_python_client.utils.transports import RequestsTransport, Urllib3Transport
+from tests.ms_python_client.local_http_server import LocalHttpServer
+
+
+def test_requests_transport_is_the_default():
+    session = Session()
+    api_client = ApiClient("https://graph.microsoft.com/v1.0", session=session)
+
+    assert isinstance(api_client.transport, RequestsTransport)
+    assert api_client.session is session
+    assert api_client.pool_stats is None
+
+
+def test_urllib3_transport_connection_error():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    transport = Urllib3Transport()
+    transport.retries = Retry(0)
+
+    try:
+        with pytest.raises(RequestsConnectionError):
+            transport.request("GET", f"http://127.0.0.1:{port}/test", timeout=1)
+    finally:
+        transport.close()
+
+
+class TestUrllib3Transport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = LocalHttpServer().__enter__()
+        self.transport = Urllib3Transport()
+        self.api_client = ApiClient(
+            self.server.url,
+            retry_policy=RetryPolicy(backoff_factor=0),
+            transport=self.transport,
+        )
+
+    def tearDown(self) -> None:
+        self.transport.close()
+        self.server.__exit__()
+
+    def test_same_response_semantics(self):
+        self.server.add("POST", "/events", {"id": "1"}, status=201)
+
+        response = self.api_client.make_post_request(
+            "/events", headers={"Authorization": "Bearer token"}, json={"a": "é"}
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"id": "1"}
+        assert response.headers["content-type"] == "application/json"
+        assert response.request.method == "POST"
+        request = self.server.requests[0]
+        assert request.headers["Authorization"] == "Bearer token"
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.json() == {"a": "é"}
+        assert self.api_client.session is None
+
+    def test_errors_and_retries(self):
+        self.server.add("GET", "/test", {"error": "busy"}, status=503)
+        self.server.add("GET", "/test", {"response": "ok"})
+        self.server.add("DELETE", "/test", {"error": "denied"}, status=403)
+
+        assert self.api_client.make_get_request("/test", headers={}).json() == {
+            "response": "ok"
+        }
+        assert self.api_client.retry_stats.retries == 1
+        with pytest.raises(HTTPError):
+            self.api_client.make_delete_request("/test", headers={})
+
+    def test_connections_are_reused(self):
+        self.server.add("GET", "/test", {"response": "ok"})
+        for _ in range(5):
+            self.api_client.make_get_request("/test", headers={})
+
+        stats = self.api_client.pool_stats
+        assert stats.checkouts == 5
+        assert stats.new_connections == 1
+        assert self.server.connections == 1